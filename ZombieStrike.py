@@ -8,12 +8,24 @@ import os
 import math
 import sys
 import random
+import time
+import argparse
+import atexit
+import csv
+import threading
+import heapq
+import hashlib
+import json
+import mmap
+import struct
+from collections import OrderedDict, deque
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 
-# Initialize pygame and mixer for game and sound
-pygame.init()
-pygame.mixer.init()
+try:
+    import numpy as np
+except ImportError:  # NumPy only powers the optional horde engine
+    np = None
 
 # Game constants and configuration
 SCREEN_WIDTH, SCREEN_HEIGHT = 1024, 768
@@ -44,6 +56,62 @@ BULLET_SPAWN_OFFSET = 25
 EXPLOSION_RADIUS = 200
 EXPLOSION_DURATION = 500
 TIME_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 256
+HUD_PANEL_WIDTH, HUD_PANEL_HEIGHT = 220, 130
+HUD_BAR_WIDTH, HUD_BAR_HEIGHT = 200, 30
+BACKGROUND_BLEND_STEPS = 32
+BACKGROUND_CACHE_SIZE = 4
+NIGHT_BG_OFFSET = -10
+GRENADE_ROTATION_STEPS = 72
+COLLISION_CELL_SIZE = 128
+BULLET_DAMAGE = 35
+EXPLOSION_DAMAGE = 150
+EXPLOSION_HITBOX_MARGIN = 200
+GRENADE_THROW_DELAY = 500
+FPS = 60
+SIMULATION_HZ = 60
+SIMULATION_DT = 1000 / SIMULATION_HZ  # Milliseconds of game time per simulation tick
+TICK_SCALE = 60 / SIMULATION_HZ  # Speeds and accelerations above are tuned per 1/60 s
+MAX_FRAME_TIME = 250  # Longest frame fed to the simulation, so a stall cannot snowball
+HEADLESS_MAX_TICKS = SIMULATION_HZ * 60 * 15  # Give up on a headless run after 15 simulated minutes
+SCRIPTED_ENGAGE_RANGE = 400  # Scripted player stops walking once a zombie is this close
+AUTOPILOT_ENGAGE_RANGE = 480  # Autopilot holds its ground from here, just inside the zombies' detection range
+AUTOPILOT_RETREAT_RANGE = 200  # Autopilot sprints back between shots while a zombie is closer than this
+AUTOPILOT_GRENADE_RANGE = 420  # Farthest blast the autopilot aims for; grenades leaving the screen are lost
+AUTOPILOT_GRENADE_LIFT = 8  # Upward speed the autopilot throws grenades with
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512  # Samples per mix callback, about 12 ms at 44.1 kHz; small keeps gunshots responsive
+ASSET_PACK_PATH = os.path.join("Assets", "assets.pack")  # Written by --bake-assets, not checked in
+ASSET_PACK_MAGIC = b"ZSPACK01"
+ASSET_PACK_FORMAT = "BGRA"  # Byte order of 32-bit ARGB display surfaces on little-endian machines
+# Mixer channels reserved for each sound class, and which class each sample plays on
+SOUND_CHANNEL_GROUPS = {"weapons": 4, "explosions": 4}
+SOUND_CLASSES = {"gunshot": "weapons", "grenade": "explosions"}
+SOUND_MAX_VOICES = {"gunshot": 3, "grenade": 4}  # Oldest voice is stolen past this
+SOUND_LAYERS = {"grenade": (0, 50, 150, 200)}  # Millisecond offsets of stacked plays per trigger
+ZOMBIE_MAX_ALIVE = 3  # Zombies on the field at once unless a wave sets "max_alive"
+WAVE_TABLE = {  # Wave number -> zombies in the wave, their speed and health; every new game starts from a copy
+    1: {"count": 5, "speed": 3, "health": 100},
+    2: {"count": 8, "speed": 3.5, "health": 150},
+    3: {"count": 12, "speed": 4, "health": 200}
+}
+WAVE_FIELDS = ("count", "speed", "health", "max_alive")
+HORDE_INITIAL_CAPACITY = 256
+HORDE_SPAWN_SPREAD = 2000  # Horde batches spawn spread over this many pixels past the screen edge
+BULLET_POOL_SIZE = 64  # Bullets in flight at once; a shot is refused while the pool is full
+GRENADE_POOL_SIZE = 16
+PROFILER_HISTORY = 120  # Frames kept for the profiler graph and averages
+PROFILER_TOGGLE_KEY = pygame.K_F3
+TRACE_BUFFER_EVENTS = 100000  # Newest spans kept by the tracer; older ones are overwritten
+TRACE_FLUSH_KEY = pygame.K_F4
+INPUT_LOG_MAGIC = b"ZSINPUT2"
+INPUT_LOG_KEYS = (pygame.K_d, pygame.K_a, pygame.K_LSHIFT, pygame.K_w)  # Held keys the simulation reads, in bit order
+SNAPSHOT_MAGIC = b"ZSSNAPSH"
+SNAPSHOT_VERSION = 2  # Bump whenever the snapshot layout changes; older snapshots are then refused
+GAME_TIME_EPOCH = datetime(2024, 1, 1)  # Snapshots store game_time as microseconds since this
+BATCH_RUN_COLUMNS = ("variant", "seed", "outcome", "wave_reached", "sim_seconds", "clear_seconds", "damage_taken",
+                     "health", "zombies_killed", "bullets_fired", "bullets_hit", "accuracy", "ticks", "wall_seconds",
+                     "digest")
 PLAYER_SPEED = 3
 PLAYER_RUN_SPEED = 15
 HOURS_PER_SECOND = 1 / 60
@@ -60,40 +128,527 @@ HIGHLIGHT = (255, 255, 0)
 TEXT_COLOR = (240, 240, 240)
 EXPLOSION_COLOR = (255, 165, 0)
 
-# Create the main game window and clock
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Zombie Strike")
-clock = pygame.time.Clock()
+
+def lerp(start: float, end: float, alpha: float) -> float:
+    # Linear interpolation used to render between two simulation ticks
+    return start + (end - start) * alpha
+
+
+class KeyState(dict):
+    """Keyboard state for simulated input; keys that were never set read as released."""
+    def __getitem__(self, key):
+        return self.get(key, False)
+
+
+class SimulationClock:
+    """Game time in milliseconds, moved only by simulation ticks and never by the wall clock."""
+    def __init__(self, start: float = 0):
+        self.start = start
+        self.now = start
+
+    def advance(self, dt: float = SIMULATION_DT) -> float:
+        self.now += dt
+        return self.now
+
+    def reset(self) -> None:
+        self.now = self.start
+
+    def elapsed(self) -> timedelta:
+        return timedelta(milliseconds=self.now - self.start)
+
+
+class TraceSpan:
+    __slots__ = ("tracer", "name", "category", "start")
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.complete(self.name, self.category, self.start, time.perf_counter_ns())
+        return False
+
+
+class NullSpan:
+    # Shared stand-in returned while tracing is off
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """
+    Records named timing spans into a fixed-size ring buffer and writes them
+    out in the Chrome Trace Event format (chrome://tracing, Perfetto) only
+    when flushed, so recording never touches the disk mid-frame.
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_EVENTS):
+        self.enabled = False
+        self.path = None
+        self.events = deque(maxlen=capacity)  # (name, category, phase, start ns, duration ns, thread id)
+        self.recorded = 0
+        self.thread_names = {}
+        self.origin = time.perf_counter_ns()
+
+    def start(self, path: str) -> None:
+        self.path = path
+        self.enabled = True
+
+    def span(self, name: str, category: str = "frame"):
+        """
+        Times a with-block as one span.
+
+        Args:
+            name (str): Span name shown in the viewer
+            category (str): Trace category, for filtering
+
+        Returns:
+            A context manager; a shared no-op one while tracing is off
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return TraceSpan(self, name, category)
+
+    def complete(self, name: str, category: str, start: int, end: int) -> None:
+        self._record(name, category, "X", start, end - start)
+
+    def instant(self, name: str, category: str = "frame") -> None:
+        if self.enabled:
+            self._record(name, category, "i", time.perf_counter_ns(), 0)
+
+    def _record(self, name: str, category: str, phase: str, start: int, duration: int) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        self.events.append((name, category, phase, start, duration, thread_id))
+        self.recorded += 1
+
+    def snapshot(self) -> Tuple[List, List, int]:
+        # Cheap copy of the buffer; building the document from it can then happen off the game loop
+        return list(self.thread_names.items()), list(self.events), self.recorded
+
+    def trace_events(self, snapshot: Optional[Tuple[List, List, int]] = None) -> Dict:
+        """
+        Builds the trace document from the buffered spans.
+
+        Args:
+            snapshot (Optional[Tuple[List, List, int]]): Result of snapshot(); taken now if omitted
+
+        Returns:
+            Dict: Chrome Trace Event JSON object, timestamps in microseconds from tracer creation
+        """
+        thread_names, buffered, recorded = snapshot or self.snapshot()
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+                  for thread_id, name in thread_names]
+        for name, category, phase, start, duration, thread_id in buffered:
+            event = {"name": name, "cat": category, "ph": phase, "pid": pid, "tid": thread_id,
+                     "ts": (start - self.origin) / 1000}
+            if phase == "X":
+                event["dur"] = duration / 1000
+            else:
+                event["s"] = "t"
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"recorded": recorded, "dropped": recorded - len(buffered)}}
+
+    def flush(self, path: Optional[str] = None, background: bool = False) -> Optional[threading.Thread]:
+        """
+        Writes the buffered spans to a trace file.
+
+        Args:
+            path (Optional[str]): Output file; defaults to the path given to start()
+            background (bool): Serialise and write on a worker thread so the caller does not hitch
+
+        Returns:
+            Optional[threading.Thread]: The writer thread when background is True
+        """
+        path = path or self.path
+        if path is None:
+            return None
+        snapshot = self.snapshot()  # Spans recorded after this go to the next flush
+        if not background:
+            self._write(path, snapshot)
+            return None
+        writer = threading.Thread(target=self._write, args=(path, snapshot), name="TraceWriter", daemon=True)
+        writer.start()
+        return writer
+
+    def _write(self, path: str, snapshot: Tuple[List, List, int]) -> None:
+        with open(path + ".tmp", "w") as trace_file:
+            json.dump(self.trace_events(snapshot), trace_file)
+        os.replace(path + ".tmp", path)
+
+
+tracer = Tracer()
+
+
+class AppContext:
+    """
+    Owns pygame's process-wide state: the display, the mixer and the clock.
+    Nothing is initialised until a context is created, so importing this
+    module has no side effects. Scenes receive the screen and clock from it.
+    """
+
+    def __init__(self, headless: bool = False):
+        self.headless = headless
+        if headless:
+            # The dummy drivers must be selected before SDL initialises
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, AUDIO_BUFFER)
+        pygame.init()
+        pygame.mixer.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Zombie Strike")
+        self.clock = pygame.time.Clock()
+
+    def close(self) -> None:
+        pygame.quit()
+
+
+def file_digest(path: str) -> Optional[str]:
+    # SHA-1 of a file's contents, or None if it cannot be read
+    try:
+        with open(path, "rb") as source:
+            return hashlib.sha1(source.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class AssetPack:
+    """
+    Images baked ahead of time into one file: a JSON index followed by raw
+    32-bit pixels, already scaled and flipped. The file is memory-mapped and
+    surfaces are built straight from it, with no image decoding; when the
+    display uses the same pixel layout they are not even copied.
+    An entry is only used while its source file still has the hash it was
+    baked from, so editing an asset falls back to loading it normally.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as pack_file:
+            # Copy-on-write, so drawing onto a packed surface never touches the file
+            self.data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, index_size = struct.unpack_from("<8sI", self.data)
+        if magic != ASSET_PACK_MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        header_size = struct.calcsize("<8sI")
+        index = json.loads(bytes(self.data[header_size:header_size + index_size]))
+        if index["format"] != ASSET_PACK_FORMAT:
+            raise ValueError(f"{path} stores {index['format']} pixels")
+        self.base = header_size + index_size  # Entry offsets are relative to the pixel data
+        self.entries = index["entries"]
+        self.valid_sources = {source for source, digest in index["sources"].items()
+                              if file_digest(source) == digest}
+        self.view = memoryview(self.data)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['AssetPack']:
+        # The pack is an optional speed-up, so a missing or unreadable one is not an error
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    def surface(self, key: str) -> Optional[pygame.Surface]:
+        entry = self.entries.get(key)
+        if entry is None or entry["source"] not in self.valid_sources:
+            return None
+        width, height = entry["size"]
+        start = self.base + entry["offset"]
+        return pygame.image.frombuffer(self.view[start:start + width * height * 4], (width, height), ASSET_PACK_FORMAT)
+
+    @staticmethod
+    def write(path: str, images: Dict[str, Tuple[str, pygame.Surface]]) -> int:
+        """
+        Writes a pack holding the given images.
+
+        Args:
+            path (str): Output file
+            images (Dict[str, Tuple[str, Surface]]): Registry key -> (source file, surface)
+
+        Returns:
+            int: Size of the written pack in bytes
+        """
+        entries = {}
+        blobs = []
+        offset = 0
+        for key, (source, surface) in images.items():
+            pixels = pygame.image.tobytes(surface, ASSET_PACK_FORMAT)
+            entries[key] = {"source": source, "offset": offset, "size": list(surface.get_size())}
+            blobs.append(pixels)
+            offset += len(pixels)
+        sources = {source: file_digest(source) for source, _ in images.values()}
+        index = json.dumps({"format": ASSET_PACK_FORMAT, "sources": sources, "entries": entries}).encode()
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as pack_file:
+            pack_file.write(struct.pack("<8sI", ASSET_PACK_MAGIC, len(index)))
+            pack_file.write(index)
+            for pixels in blobs:
+                pack_file.write(pixels)
+        os.replace(temp_path, path)
+        return os.path.getsize(path)
+
+
+class AssetRegistry:
+    """
+    Owns every decoded surface, sound and font for the life of the process.
+    Each item is decoded at most once and every screen gets the same
+    reference, so moving between menu, cutscene and game costs no decoding.
+    Safe to fill from an AssetLoader thread while the main thread reads it.
+    """
+
+    def __init__(self, pack_path: Optional[str] = ASSET_PACK_PATH):
+        self.pack_path = pack_path  # Baked image pack to try first; None always decodes
+        self.pack = None
+        self.pack_checked = False
+        self.images = {}  # image key -> surface
+        self.image_sources = {}  # image key -> source file, for baking
+        self.pack_loads = 0  # Images built from the pack instead of decoded
+        self.alpha_masks = None  # Pixel masks of convert_alpha() surfaces on this display
+        self.sounds = {}  # path -> Sound
+        self.fonts = {}  # (name, size) -> Font
+        self.shared = {}  # key -> object built from registry assets, e.g. GameAssets
+        self.loads = {}  # path or key -> times decoded or built
+        self.hits = 0
+        self.lock = threading.RLock()
+        self.building = {}  # shared key -> Event set once another thread has built it
+
+    def _count_load(self, key) -> None:
+        self.loads[key] = self.loads.get(key, 0) + 1
+
+    @staticmethod
+    def image_key(path: str, alpha: bool, size: Optional[Tuple[int, int]], scale: Optional[float],
+                  flip: bool) -> str:
+        return f"{path}|{int(alpha)}|{size}|{scale}|{int(flip)}"
+
+    def _pack_surface(self, key: str) -> Optional[pygame.Surface]:
+        if not self.pack_checked:
+            self.pack_checked = True
+            self.pack = AssetPack.load(self.pack_path) if self.pack_path else None
+        return self.pack.surface(key) if self.pack else None
+
+    def image(self, path: str, alpha: bool = True, size: Optional[Tuple[int, int]] = None,
+              scale: Optional[float] = None, flip: bool = False) -> pygame.Surface:
+        """
+        Returns a decoded, display-converted image, optionally resized.
+
+        Args:
+            path (str): Image file path
+            alpha (bool): Keep per-pixel alpha (convert_alpha) or not (convert)
+            size (Optional[Tuple[int, int]]): Exact size to scale to
+            scale (Optional[float]): Factor to scale by, if size is not given
+            flip (bool): Mirror horizontally
+        """
+        with self.lock:
+            return self._image(path, alpha, size, scale, flip)
+
+    def _image(self, path: str, alpha: bool, size: Optional[Tuple[int, int]], scale: Optional[float],
+               flip: bool) -> pygame.Surface:
+        key = self.image_key(path, alpha, size, scale, flip)
+        if key in self.images:
+            self.hits += 1
+            return self.images[key]
+        img = self._pack_surface(key)
+        if img is not None:
+            self.pack_loads += 1
+            if self.alpha_masks is None:
+                self.alpha_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+            if not alpha:
+                img = img.convert()
+            elif img.get_masks() != self.alpha_masks:
+                img = img.convert_alpha()
+        elif flip:
+            img = pygame.transform.flip(self._image(path, alpha, size, scale, False), True, False)
+        else:
+            with tracer.span(f"decode {path}", "assets"):
+                img = pygame.image.load(path)
+                img = img.convert_alpha() if alpha else img.convert()
+                self._count_load(path)
+                if size is None and scale is not None:
+                    size = (int(img.get_width() * scale), int(img.get_height() * scale))
+                if size is not None:
+                    img = pygame.transform.scale(img, size)
+        self.images[key] = img
+        self.image_sources[key] = path
+        return img
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        with self.lock:
+            if path in self.sounds:
+                self.hits += 1
+                return self.sounds[path]
+            with tracer.span(f"decode {path}", "assets"):
+                sound = pygame.mixer.Sound(path)
+            self._count_load(path)
+            self.sounds[path] = sound
+            return sound
+
+    def font(self, name: Optional[str], size: int) -> pygame.font.Font:
+        # SDL_ttf is not thread-safe, so fonts should only be opened on the main thread
+        with self.lock:
+            key = (name, size)
+            if key in self.fonts:
+                self.hits += 1
+                return self.fonts[key]
+            font = pygame.font.Font(name, size)
+            self._count_load(key)
+            self.fonts[key] = font
+            return font
+
+    def get(self, key: str, factory):
+        # Shared object built once from registry assets, such as GameAssets or SoundManager.
+        # If another thread is already building it, wait for that instead of building it twice.
+        while True:
+            with self.lock:
+                if key in self.shared:
+                    self.hits += 1
+                    return self.shared[key]
+                building = self.building.get(key)
+                if building is None:
+                    building = self.building[key] = threading.Event()
+                    break
+            building.wait()
+        try:
+            with tracer.span(f"build {key}", "assets"):
+                value = factory()
+            with self.lock:
+                self._count_load(key)
+                self.shared[key] = value
+            return value
+        finally:
+            with self.lock:
+                del self.building[key]
+            building.set()
+
+    def resident_bytes(self) -> int:
+        # Pixel and sample memory held by the registry's decoded images and sounds
+        total = sum(img.get_pitch() * img.get_height() for img in self.images.values())
+        mixer = pygame.mixer.get_init()
+        if mixer:
+            frequency, size, channels = mixer
+            bytes_per_frame = abs(size) // 8 * channels
+            total += sum(int(sound.get_length() * frequency) * bytes_per_frame for sound in self.sounds.values())
+        return total
+
+    def stats(self) -> Dict:
+        return {
+            "decodes": sum(self.loads.values()),
+            "pack_loads": self.pack_loads,
+            "hits": self.hits,
+            "images": len(self.images),
+            "sounds": len(self.sounds),
+            "fonts": len(self.fonts),
+            "shared": len(self.shared),
+            "resident_bytes": self.resident_bytes()
+        }
+
+
+asset_registry = AssetRegistry()
 
 
 class SoundManager:
-    """Handles loading and playing sound effects and music."""
+    """
+    Handles loading and playing sound effects and music.
+    Never blocks: each sound class plays on its own reserved mixer channels,
+    each sample is capped at SOUND_MAX_VOICES by stealing its oldest voice,
+    and layered effects are scheduled and started from update().
+    """
     def __init__(self):
         self.sounds = {}
         self.music = {}
         self.current_music = None
         self.volume = 0.5
+        self.channel_groups = self._reserve_channels()  # Sound class -> reserved channels
+        self.voices = {}  # Sample name -> [(start time, channel)], oldest first
+        self.scheduled = []  # Heap of (due time, sequence, sample name)
+        self.schedule_counter = 0
+        self.voices_stolen = 0
         self.load_sounds()
 
+    def _reserve_channels(self) -> Dict[str, List[pygame.mixer.Channel]]:
+        # Keep the first channels out of the mixer's automatic pool, one block per sound class
+        total = sum(SOUND_CHANNEL_GROUPS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 2))
+        pygame.mixer.set_reserved(total)
+        groups = {}
+        first = 0
+        for name, size in SOUND_CHANNEL_GROUPS.items():
+            groups[name] = [pygame.mixer.Channel(i) for i in range(first, first + size)]
+            first += size
+        return groups
+
     def load_sounds(self):
         # Load sound effects and music files
-        self.sounds['gunshot'] = pygame.mixer.Sound(os.path.join("assets", "gunshot.mp3"))
-        self.sounds['grenade'] = pygame.mixer.Sound(os.path.join("assets", "grenade.mp3"))
-        self.music['menu'] = os.path.join("assets", "menu_music.mp3")
-        self.music['wave'] = os.path.join("assets", "wave_music.mp3")
+        self.sounds['gunshot'] = asset_registry.sound(os.path.join("Assets", "gunshot.mp3"))
+        self.sounds['grenade'] = asset_registry.sound(os.path.join("Assets", "grenade.mp3"))
+        self.music['menu'] = os.path.join("Assets", "menu_music.mp3")
+        self.music['wave'] = os.path.join("Assets", "wave_music.mp3")
         for sound_name, sound in self.sounds.items():
             sound.set_volume(5.0 if sound_name == 'grenade' else self.volume)
 
-    def play_sound(self, sound_name: str):
-        # Play a sound effect by name
+    def play_sound(self, sound_name: str, delay: int = 0):
+        # Play a sound effect by name, with any layers it has, after delay milliseconds
         if sound_name in self.sounds:
-            if sound_name == 'grenade':
-                self.sounds[sound_name].stop()
-                self.sounds[sound_name].play()
-                pygame.time.delay(50)
-                self.sounds[sound_name].play()
+            now = pygame.time.get_ticks()
+            for offset in SOUND_LAYERS.get(sound_name, (0,)):
+                self.schedule_counter += 1
+                heapq.heappush(self.scheduled, (now + delay + offset, self.schedule_counter, sound_name))
+            self.update(now)
+
+    def update(self, now: Optional[int] = None):
+        # Start every scheduled voice that has come due; call once per frame
+        now = pygame.time.get_ticks() if now is None else now
+        while self.scheduled and self.scheduled[0][0] <= now:
+            _, _, sound_name = heapq.heappop(self.scheduled)
+            self._start_voice(sound_name, now)
+
+    def _start_voice(self, sound_name: str, now: int):
+        voices = [(start, channel) for start, channel in self.voices.get(sound_name, [])
+                  if channel.get_sound() is self.sounds[sound_name] and channel.get_busy()]
+        group = self.channel_groups[SOUND_CLASSES.get(sound_name, "weapons")]
+        channel = next((channel for channel in group if not channel.get_busy()), None)
+        if len(voices) >= SOUND_MAX_VOICES.get(sound_name, len(group)) or channel is None:
+            # Steal the oldest voice of this sample, or failing that the oldest in its class
+            if voices:
+                _, channel = voices.pop(0)
             else:
-                self.sounds[sound_name].play()
+                channel = min(group, key=self._voice_start)
+            channel.stop()
+            self.voices_stolen += 1
+        channel.play(self.sounds[sound_name])
+        tracer.instant(f"play {sound_name}", "audio")
+        voices.append((now, channel))
+        self.voices[sound_name] = voices
+
+    def _voice_start(self, channel: pygame.mixer.Channel) -> int:
+        for voices in self.voices.values():
+            for start, voice_channel in voices:
+                if voice_channel is channel:
+                    return start
+        return 0
+
+    def stats(self) -> Dict:
+        return {
+            "voices": {name: sum(channel.get_busy() for _, channel in voices) for name, voices in self.voices.items()},
+            "scheduled": len(self.scheduled),
+            "stolen": self.voices_stolen
+        }
 
     def play_music(self, music_name: str, loops: int = -1):
         # Play background music by name
@@ -117,14 +672,70 @@ class SoundManager:
             pygame.mixer.music.set_volume(self.volume)
 
 
+class TextRenderer:
+    """Renders shadowed text through a bounded LRU cache shared by every screen."""
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text: str, color, scale: float = 1.0, rotation: float = 0) -> Tuple[pygame.Surface, pygame.Surface]:
+        # Return cached (shadow, text) surfaces, rasterising only on a miss.
+        # Scale is rounded so pulsing menu options settle on a few cached sizes.
+        scale = round(scale, 2)
+        key = (font, text, tuple(color), scale, rotation)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return entry
+        self.misses += 1
+        shadow_surface = font.render(text, True, (0, 0, 0))
+        text_surface = font.render(text, True, color)
+        if scale != 1.0 or rotation != 0:
+            text_surface = pygame.transform.rotozoom(text_surface, rotation, scale)
+        entry = (shadow_surface, text_surface)
+        self.cache[key] = entry
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return entry
+
+    def draw(self, surface, text: str, x, y, color, font, center=True, scale=1.0, rotation=0) -> pygame.Rect:
+        # Draw text with a drop shadow and return the foreground rect
+        shadow_surface, text_surface = self.render(font, text, color, scale, rotation)
+        shadow_rect = shadow_surface.get_rect()
+        if center:
+            shadow_rect.center = (x + 2, y + 2)
+        else:
+            shadow_rect.topleft = (x + 2, y + 2)
+        surface.blit(shadow_surface, shadow_rect)
+        if center:
+            text_rect = text_surface.get_rect(center=(x, y))
+        else:
+            text_rect = text_surface.get_rect(topleft=(x, y))
+        surface.blit(text_surface, text_rect)
+        return text_rect
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache)}
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.hits = self.misses = 0
+
+
+text_renderer = TextRenderer()
+
+
 class HomePage:
     """Main menu and home screen for the game."""
     def __init__(self, screen, clock):
         self.screen, self.clock = screen, clock
         self.screen_width, self.screen_height = screen.get_size()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
+        self.small_font = asset_registry.font(None, 24)
         self.selected_option = 0
         self.options = ["Start Game", "About", "Quit"]
         self.showing_instructions = False
@@ -140,11 +751,12 @@ class HomePage:
         self.mouse_pos = (0, 0)
         self.hover_effect = 0
         self.instructions_button_hovered = False
-        self.military_font = pygame.font.Font(None, 72)
-        self.background_image = pygame.image.load("Assets/Background.jpg").convert()
-        self.background_image = pygame.transform.scale(self.background_image, (self.screen_width, self.screen_height))
+        self.military_font = asset_registry.font(None, 72)
+        self.question_font = asset_registry.font(None, 32)
+        self.background_image = asset_registry.image("Assets/Background.jpg", alpha=False,
+                                                     size=(self.screen_width, self.screen_height))
         self.init_particle_system()
-        self.sound_manager = SoundManager()
+        self.sound_manager = asset_registry.get("sound_manager", SoundManager)
         self.sound_manager.play_music('menu')
         self.settings_screen = None
         self.about_screen = None
@@ -208,24 +820,7 @@ class HomePage:
 
     def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True, scale=1.0, rotation=0):
         # Draw text with shadow and optional scaling/rotation
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if scale != 1.0 or rotation != 0:
-            text_surface = pygame.transform.rotozoom(text_surface, rotation, scale)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center, scale, rotation)
 
     def draw_instructions_button(self):
         button_width = button_height = 40
@@ -235,14 +830,10 @@ class HomePage:
         for i in range(2):
             alpha = 150 - i * 50
             pygame.draw.rect(button_surface, (255, 255, 255, alpha), (i, i, button_width - i * 2, button_height - i * 2), 2)
-        question_mark = "?"
-        font_size = 32
-        question_font = pygame.font.Font(None, font_size)
-        shadow_surface = question_font.render(question_mark, True, (0, 0, 0))
+        text_color = (255, 215, 0) if self.instructions_button_hovered else (200, 200, 200)
+        shadow_surface, text_surface = text_renderer.render(self.question_font, "?", text_color)
         shadow_rect = shadow_surface.get_rect(center=(button_width // 2 + 1, button_height // 2 + 1))
         button_surface.blit(shadow_surface, shadow_rect)
-        text_color = (255, 215, 0) if self.instructions_button_hovered else (200, 200, 200)
-        text_surface = question_font.render(question_mark, True, text_color)
         text_rect = text_surface.get_rect(center=(button_width // 2, button_height // 2))
         button_surface.blit(text_surface, text_rect)
         self.screen.blit(button_surface, (button_x, button_y))
@@ -360,10 +951,10 @@ class HomePage:
         y = 0
         for line in description:
             if line.startswith("•"):
-                text_surface = self.small_font.render(line, True, (200, 200, 200))
+                text_surface = text_renderer.render(self.small_font, line, (200, 200, 200))[1]
                 content_surface.blit(text_surface, (30, y))
             else:
-                text_surface = self.small_font.render(line, True, WHITE)
+                text_surface = text_renderer.render(self.small_font, line, WHITE)[1]
                 content_surface.blit(text_surface, (20, y))
             y += 25
         self.max_scroll = max(0, content_height - box_height + 40)
@@ -379,58 +970,161 @@ class HomePage:
                 pygame.draw.line(self.screen, (200, 200, 200, alpha), (box_x + box_width - 30, scroll_bar_y + y), (box_x + box_width - 20, scroll_bar_y + y))
         self.draw_text("Press ESC to return to menu", self.screen_width // 2, self.screen_height - 30, HIGHLIGHT)
 
+    def resume(self):
+        # Bring the menu back after a game: first option selected, instructions closed and menu music restarted,
+        # without reloading anything
+        self.selected_option = 0
+        self.showing_instructions = False
+        self.instructions_scroll = 0
+        self.sound_manager.play_music('menu')
+
     def run(self):
         while True:
-            action = self.handle_events()
-            if action != "menu":
-                return action
-            if self.showing_instructions:
-                self.draw_instructions()
-            else:
-                self.draw_menu()
-            pygame.display.flip()
-            self.clock.tick(60)
+            with tracer.span("HomePage.frame", "menu"):
+                action = self.handle_events()
+                if action != "menu":
+                    return action
+                with tracer.span("draw", "menu"):
+                    if self.showing_instructions:
+                        self.draw_instructions()
+                    else:
+                        self.draw_menu()
+                with tracer.span("present", "menu"):
+                    pygame.display.flip()
+                with tracer.span("wait", "menu"):
+                    self.clock.tick(60)
 
 
 class GameAssets:
+    # Animation folder -> frame count, or None for every PNG in the folder
+    ANIMATIONS = {"Idle": None, "Walk": None, "Run": None, "Shoot": None, "Throw": None,
+                  "Recharge": 13, "Enemy/Run": None, "Enemy/Attack": None}
+    # Single images: attribute -> (file in Assets, registry options)
+    IMAGES = {
+        "day_bg": ("Day.jpg", {"alpha": False, "size": (SCREEN_WIDTH, SCREEN_HEIGHT)}),
+        "night_bg": ("Night.jpg", {"alpha": False, "size": (SCREEN_WIDTH, SCREEN_HEIGHT)}),
+        "bullet": ("Bullet.png", {"scale": BULLET_SCALE}),
+        "grenade": ("Grenade.png", {"scale": BULLET_SCALE * 4})
+    }
+    FONTS = ((None, TIME_FONT_SIZE),)
+
     def __init__(self):
+        self.frame_paths = {}  # Animation folder -> frame files, in frame order
         self.actions = self._load_actions()
-        self.day_bg = self._load_background("Day.jpg")
-        self.night_bg = self._load_background("Night.jpg")
-        self.font = pygame.font.Font(None, TIME_FONT_SIZE)
-        self.bullet = self._load_bullet()
-        self.recharge_frames = self._load_frames("Recharge", 13)
-        self.throw_frames = self._load_frames("Throw", 9)
+        self.day_bg = self._load_image("day_bg")
+        self.night_bg = self._load_image("night_bg")
+        self.background = BackgroundBlender(self.day_bg, self.night_bg)
+        self.font = asset_registry.font(*self.FONTS[0])
+        self.bullet = self._load_image("bullet")
+        self.grenade = self._load_image("grenade")
+        self.grenade_rotations = self._build_rotations(self.grenade, GRENADE_ROTATION_STEPS)
+        self.recharge_frames = self._load_frames("Recharge")
+        self.throw_frames = self.actions["Throw"]
         self.zombie_frames = self._load_frames("Enemy/Run")
         self.zombie_attack_frames = self._load_frames("Enemy/Attack")
+        self.sprites = self._build_sprite_cache()
 
-    def _load_frames(self, folder: str, frame_count: Optional[int] = None) -> List[pygame.Surface]:
-        frames = []
+    @classmethod
+    def frame_files(cls, folder: str) -> List[str]:
         path = f"Assets/{folder}"
+        frame_count = cls.ANIMATIONS[folder]
         files = sorted(os.listdir(path)) if not frame_count else [f"{i}.png" for i in range(frame_count)]
-        for filename in files:
-            if filename.endswith(".png"):
-                img = pygame.image.load(os.path.join(path, filename))
-                scaled_size = (int(img.get_width() * SCALE), int(img.get_height() * SCALE))
-                frames.append(pygame.transform.scale(img, scaled_size))
-        return frames
+        return [os.path.join(path, filename) for filename in files if filename.endswith(".png")]
+
+    @classmethod
+    def manifest(cls) -> List[Tuple[str, Dict]]:
+        # Every registry image this class loads, as (path, options), so it can be loaded ahead of time
+        images = [(os.path.join("Assets", filename), options) for filename, options in cls.IMAGES.values()]
+        for folder in cls.ANIMATIONS:
+            for path in cls.frame_files(folder):
+                images.append((path, {"scale": SCALE}))
+                images.append((path, {"scale": SCALE, "flip": True}))
+        return images
+
+    def _load_image(self, name: str) -> pygame.Surface:
+        filename, options = self.IMAGES[name]
+        return asset_registry.image(os.path.join("Assets", filename), **options)
+
+    def _load_frames(self, folder: str) -> List[pygame.Surface]:
+        self.frame_paths[folder] = self.frame_files(folder)
+        return [asset_registry.image(frame_path, scale=SCALE) for frame_path in self.frame_paths[folder]]
+
+    def _build_sprite_cache(self) -> Dict[str, Dict[str, List[pygame.Surface]]]:
+        # Flip every animation set once so draw calls only need a lookup
+        return {name: {"right": [asset_registry.image(path, scale=SCALE) for path in paths],
+                       "left": [asset_registry.image(path, scale=SCALE, flip=True) for path in paths]}
+                for name, paths in self.frame_paths.items()}
+
+    def frames(self, name: str, direction: str = "right") -> List[pygame.Surface]:
+        return self.sprites[name][direction]
 
     def _load_actions(self) -> Dict[str, List[pygame.Surface]]:
         return {action: self._load_frames(action) for action in ["Idle", "Walk", "Run", "Shoot", "Throw"]}
 
-    def _load_background(self, filename: str) -> pygame.Surface:
-        img = pygame.image.load(os.path.join("assets", filename))
-        return pygame.transform.scale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    def _build_rotations(self, image: pygame.Surface, steps: int) -> List[pygame.Surface]:
+        # Clockwise rotations at 360 / steps degree intervals
+        return [pygame.transform.rotate(image, -i * 360 / steps) for i in range(steps)]
+
+    def grenade_frame(self, angle: float) -> pygame.Surface:
+        steps = len(self.grenade_rotations)
+        return self.grenade_rotations[round(angle * steps / 360) % steps]
+
+
+class BackgroundBlender:
+    """
+    Pre-composited day/night scrolling strips.
+    Each strip holds two copies of the background side by side, so any scroll
+    position is a single blit, and blends are quantised to BACKGROUND_BLEND_STEPS.
+    """
 
-    def _load_bullet(self) -> pygame.Surface:
-        img = pygame.image.load(os.path.join("assets", "Bullet.png"))
-        new_size = (int(img.get_width() * BULLET_SCALE), int(img.get_height() * BULLET_SCALE))
-        return pygame.transform.scale(img, new_size)
+    def __init__(self, day_bg: pygame.Surface, night_bg: pygame.Surface,
+                 steps: int = BACKGROUND_BLEND_STEPS, max_entries: int = BACKGROUND_CACHE_SIZE):
+        self.steps = steps
+        self.max_entries = max_entries
+        self.day_strip = self._stitch(day_bg)
+        # Night sits NIGHT_BG_OFFSET pixels higher, so the day strip shows through underneath
+        self.night_layer = self._stitch(night_bg, NIGHT_BG_OFFSET, pygame.SRCALPHA)
+        self.night_strip = self.day_strip.copy()
+        self.night_strip.blit(self.night_layer, (0, 0))
+        self.cache = OrderedDict()
+
+    def _stitch(self, image: pygame.Surface, y: int = 0, flags: int = 0) -> pygame.Surface:
+        strip = pygame.Surface((SCREEN_WIDTH * 2, SCREEN_HEIGHT), flags)
+        strip.blit(image, (0, y))
+        strip.blit(image, (SCREEN_WIDTH, y))
+        return strip.convert_alpha() if flags & pygame.SRCALPHA else strip.convert()
+
+    def strip(self, day_alpha: float) -> pygame.Surface:
+        # Return the strip for the nearest quantised blend, compositing it on a miss
+        step = round(day_alpha * self.steps)
+        if step >= self.steps:
+            return self.day_strip
+        if step <= 0:
+            return self.night_strip
+        strip = self.cache.get(step)
+        if strip is not None:
+            self.cache.move_to_end(step)
+            return strip
+        strip = self.day_strip.copy()
+        self.night_layer.set_alpha(int(255 * (1 - step / self.steps)))
+        strip.blit(self.night_layer, (0, 0))
+        self.night_layer.set_alpha(None)
+        self.cache[step] = strip
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+        return strip
+
+    def draw(self, screen, world_offset: int, day_alpha: float) -> None:
+        scroll_x = world_offset % SCREEN_WIDTH
+        screen.blit(self.strip(day_alpha), (0, 0), (scroll_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
 
 class AnimationManager:
     def __init__(self, assets: GameAssets):
         self.assets = assets
+        self.reset()
+
+    def reset(self) -> None:
         self.current_animation = "Idle"
         self.frame = 0
         self.timer = 0
@@ -448,7 +1142,7 @@ class AnimationManager:
         self.last_throw_time = 0
         self.throw_cooldown = 1000
 
-    def update(self, current_time: int, keys: pygame.key.ScancodeWrapper) -> None:
+    def update(self, current_time: int, keys: pygame.key.ScancodeWrapper, dt: float = SIMULATION_DT) -> None:
         if self.shooting:
             if current_time - self.shoot_frame_timer >= SHOOT_FRAME_DELAY:
                 self.shoot_frame_timer = current_time
@@ -472,21 +1166,20 @@ class AnimationManager:
                     self.throwing = False
                     self.throw_frame = 0
         if not any([self.shooting, self.reloading, self.throwing]):
-            self.timer += clock.get_time()
+            self.timer += dt
             if self.timer > FRAME_DELAY:
                 self.timer = 0
                 self.frame = (self.frame + 1) % len(self.assets.actions[self.current_animation])
 
     def draw(self, screen, x: int, y: int) -> None:
         if self.reloading:
-            frame = self.assets.recharge_frames[self.reload_frame]
+            frame = self.assets.frames("Recharge", self.direction)[self.reload_frame]
         elif self.throwing:
-            frame = self.assets.throw_frames[self.throw_frame]
+            frame = self.assets.frames("Throw", self.direction)[self.throw_frame]
         else:
-            current_frames = self.assets.actions.get(self.current_animation, self.assets.actions["Idle"])
+            current_frames = self.assets.sprites.get(self.current_animation, self.assets.sprites["Idle"])[self.direction]
             frame = current_frames[self.frame] if current_frames and 0 <= self.frame < len(current_frames) else None
         if frame:
-            frame = pygame.transform.flip(frame, self.direction == "left", False)
             screen.blit(frame, (x - frame.get_width() // 2, y))
 
     def start_shoot(self, current_time: int) -> None:
@@ -497,11 +1190,11 @@ class AnimationManager:
             self.shoot_timer = current_time
             self.shoot_frame_timer = current_time
 
-    def start_reload(self) -> None:
+    def start_reload(self, current_time: int) -> None:
         if not self.reloading and not self.throwing:
             self.reloading = True
             self.reload_frame = 0
-            self.reload_timer = pygame.time.get_ticks()
+            self.reload_timer = current_time
 
     def start_throw(self, current_time: int) -> None:
         if not self.throwing and not self.reloading and current_time - self.last_throw_time >= self.throw_cooldown:
@@ -518,6 +1211,199 @@ class AnimationManager:
         self.direction = direction
 
 
+class Projectile:
+    """A bullet or grenade slot owned by a ProjectilePool. Positions are screen-space floats."""
+
+    __slots__ = ("x", "y", "prev_x", "prev_y", "vx", "vy", "width", "height",
+                 "direction", "angle", "rotation_speed", "start_time", "active")
+
+    def __init__(self):
+        self.active = False
+
+    def launch(self, x: float, y: float, width: int, height: int, velocity: Tuple[float, float],
+               direction: str, current_time: int, rotation_speed: float = 0) -> None:
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
+        self.width = width
+        self.height = height
+        self.vx, self.vy = velocity
+        self.direction = direction
+        self.angle = 0
+        self.rotation_speed = rotation_speed
+        self.start_time = current_time
+        self.active = True
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return int(self.x) + self.width // 2, int(self.y) + self.height // 2
+
+    def is_off_screen(self) -> bool:
+        return (self.x + self.width < 0 or self.x > SCREEN_WIDTH or
+                self.y + self.height < 0 or self.y > SCREEN_HEIGHT)
+
+
+class ProjectilePool:
+    """
+    Fixed-capacity projectile storage.
+    Slots are allocated once and recycled through a free list, so firing
+    creates no garbage. Active projectiles stay in launch order, which the
+    collision code relies on to give the earliest bullet the hit.
+    """
+
+    def __init__(self, capacity: int):
+        self.slots = [Projectile() for _ in range(capacity)]
+        self.free = self.slots[::-1]  # Stack of idle slots
+        self.active = []  # Projectiles in flight, in launch order
+        self.high_water = 0  # Most projectiles ever in flight at once
+        self.launched = 0
+        self.refused = 0  # Launches refused because the pool was full
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __getitem__(self, index: int) -> Projectile:
+        return self.active[index]
+
+    def has_room(self) -> bool:
+        return bool(self.free)
+
+    def acquire(self) -> Optional[Projectile]:
+        if not self.free:
+            self.refused += 1
+            return None
+        projectile = self.free.pop()
+        self.active.append(projectile)
+        self.launched += 1
+        self.high_water = max(self.high_water, len(self.active))
+        return projectile
+
+    def release(self, projectile: Projectile) -> None:
+        # Marks a slot idle; sweep() drops it from the active list
+        projectile.active = False
+
+    def sweep(self) -> None:
+        # Compact the active list in place, returning released slots to the free list
+        write = 0
+        for projectile in self.active:
+            if projectile.active:
+                self.active[write] = projectile
+                write += 1
+            else:
+                self.free.append(projectile)
+        del self.active[write:]
+
+    def integrate(self, gravity: float = 0) -> None:
+        # Move every projectile by one simulation tick
+        for projectile in self.active:
+            projectile.prev_x = projectile.x
+            projectile.prev_y = projectile.y
+            projectile.x += projectile.vx * TICK_SCALE
+            projectile.y += projectile.vy * TICK_SCALE
+            projectile.vy += gravity * TICK_SCALE
+            projectile.angle += projectile.rotation_speed * TICK_SCALE
+
+    def clear(self) -> None:
+        for projectile in self.active:
+            projectile.active = False
+        self.sweep()
+
+    def reset(self) -> None:
+        # Clear for a new game, keeping the slots but starting the counters over
+        self.clear()
+        self.high_water = self.launched = self.refused = 0
+
+    def stats(self) -> Dict:
+        return {
+            "capacity": len(self.slots),
+            "in_use": len(self.active),
+            "occupancy": len(self.active) / len(self.slots),
+            "high_water": self.high_water,
+            "launched": self.launched,
+            "refused": self.refused
+        }
+
+
+class Explosion:
+    """A grenade blast that grows to max_radius and damages each zombie at most once."""
+
+    __slots__ = ("pos", "world_pos", "start_time", "radius", "max_radius", "damage", "hit")
+
+    def __init__(self, pos: Tuple[int, int], world_pos: Tuple[int, int], current_time: int,
+                 max_radius: int = EXPLOSION_RADIUS, damage: int = EXPLOSION_DAMAGE):
+        self.pos = pos  # Screen position at detonation, for drawing
+        self.world_pos = world_pos  # World position, for damage
+        self.start_time = current_time
+        self.radius = 0
+        self.max_radius = max_radius
+        self.damage = damage
+        self.hit = set()  # Zombies (or horde ids) this blast has already damaged
+
+    @property
+    def reach(self) -> int:
+        # Damage radius, which runs ahead of the drawn fireball
+        return self.radius + EXPLOSION_HITBOX_MARGIN
+
+
+class ExplosionSystem:
+    """
+    Tracks live explosions and resolves their area damage.
+    Every tick each blast asks the zombie spatial index for zombies inside its
+    current reach, and damages only those it has not hit before, so damage
+    is the same at any tick rate and overlapping blasts stay cheap.
+    """
+
+    def __init__(self):
+        self.active = []  # Explosions in detonation order
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def detonate(self, pos: Tuple[int, int], world_pos: Tuple[int, int], current_time: int) -> Explosion:
+        explosion = Explosion(pos, world_pos, current_time)
+        self.active.append(explosion)
+        return explosion
+
+    def update(self, current_time: int) -> None:
+        # Grow each blast and drop the ones that have burnt out
+        self.active = [explosion for explosion in self.active
+                       if current_time - explosion.start_time < EXPLOSION_DURATION]
+        for explosion in self.active:
+            progress = (current_time - explosion.start_time) / EXPLOSION_DURATION
+            explosion.radius = int(explosion.max_radius * progress)
+
+    def resolve(self, collisions: 'CollisionSystem', zombies: List['Zombie']) -> List[Tuple['Zombie', int]]:
+        """
+        Finds zombies newly caught by a blast this tick.
+
+        Args:
+            collisions (CollisionSystem): Spatial index used for the radial queries
+            zombies (List[Zombie]): Zombies in spawn order
+
+        Returns:
+            List: (zombie, damage) pairs in detonation order, then spawn order
+        """
+        hits = []
+        if not self.active:
+            return hits
+        collisions.index_zombies(zombies)
+        for explosion in self.active:
+            x, y = explosion.world_pos
+            for zombie in collisions.query_radius(x, y, explosion.reach):
+                if zombie not in explosion.hit:
+                    explosion.hit.add(zombie)
+                    hits.append((zombie, explosion.damage))
+        return hits
+
+    def clear(self) -> None:
+        self.active.clear()
+
+
 class Player:
     """
     Represents the player character in the game.
@@ -539,118 +1425,133 @@ class Player:
         self.direction = "right"  # Current facing direction
 
         # Weapon systems
-        self.bullets = []  # List of active bullets
-        self.grenades = []  # List of active grenades
-        self.explosions = []  # List of active explosions
-        self.current_bullets = self.max_bullets = 30  # Ammo count
-        self.current_grenades = self.max_grenades = 6  # Grenade count
+        self.bullets = ProjectilePool(BULLET_POOL_SIZE)  # Active bullets
+        self.grenades = ProjectilePool(GRENADE_POOL_SIZE)  # Active grenades
+        self.explosions = ExplosionSystem()  # Active explosions
+        self.max_bullets = 30  # Magazine size
+        self.max_grenades = 6  # Grenades carried
+
+        # UI elements
+        self.health_bar_width = 200  # Width of health bar
+        self.health_bar_height = 20  # Height of health bar
+        self.health_bar_padding = 10  # Padding around health bar
+
+        # UI and timing
+        self.font = asset_registry.font(None, 36)  # Font for UI elements
+        self.damage_cooldown = 1000  # Time between damage events
+        self.max_health = 100  # Maximum health
+
+        # Retained HUD layers, rebuilt only after invalidate_hud()
+        self.hud_chrome = None  # Static ammo panel background and labels
+        self.hud_surface = None  # Ammo panel with current counts
+        self.health_bar_surface = None  # Health bar at current health
+        self.reset()
+
+    def reset(self) -> None:
+        """Returns the player to a fresh start, reusing pools, animations and HUD chrome."""
+        self.rect.topleft = (self.original_x, self.original_y)
+        self.direction = "right"
+        self.animation.reset()
+
+        # Weapon systems
+        self.bullets.reset()
+        self.grenades.reset()
+        self.explosions.clear()
+        self.current_bullets = self.max_bullets  # Ammo count
+        self.current_grenades = self.max_grenades  # Grenade count
 
         # Combat timing
         self.last_shot_time = 0  # Last time player fired
         self.reload_complete_time = None  # When reload will complete
+        self.pending_throw = None  # (velocity, throw time) of a grenade waiting on the throw animation
+        self.delayed_throw_time = 0  # When the pending grenade leaves the hand
 
         # Grenade aiming system
         self.is_aiming_grenade = False  # Whether player is aiming grenade
         self.grenade_trajectory_points = []  # Points for trajectory preview
+        self.grenade_aim_start_pos = (0, 0)  # Start position for grenade aim
+        self.grenade_aim_current_pos = (0, 0)  # Current aim position
+        self.grenade_power = 0  # Current grenade throw power
 
         # Movement and physics
         self.jumping = False  # Whether player is jumping
         self.velocity = 0  # Current vertical velocity
-        self.max_health = 100  # Maximum health
+        self.y = self.original_y  # Vertical position, kept fractional; rect.y is it rounded
+        self.prev_y = self.original_y  # Vertical position at the previous tick, for render interpolation
         self.current_health = self.max_health  # Current health
-
-        # UI elements
-        self.health_bar_width = 200  # Width of health bar
-        self.health_bar_height = 20  # Height of health bar
-        self.health_bar_padding = 10  # Padding around health bar
-
-        # Grenade aiming system
-        self.grenade_aim_start_pos = (0, 0)  # Start position for grenade aim
-        self.grenade_aim_current_pos = (0, 0)  # Current aim position
-        self.grenade_power = 0  # Current grenade throw power
-
-        # UI and timing
-        self.font = pygame.font.Font(None, 36)  # Font for UI elements
         self.last_damage_time = 0  # Last time player took damage
-        self.damage_cooldown = 1000  # Time between damage events
+        self.invalidate_hud()
 
-    def take_damage(self, amount: int) -> None:
+    def invalidate_hud(self) -> None:
+        """Marks the ammo panel and health bar for re-rendering on the next draw."""
+        self.hud_dirty = True
+        self.health_bar_dirty = True
+
+    def take_damage(self, amount: int, current_time: int) -> None:
         """
         Handles player taking damage with cooldown system.
 
         Args:
             amount (int): Amount of damage to take
+            current_time (int): Current simulation time in milliseconds
         """
-        current_time = pygame.time.get_ticks()
         if current_time - self.last_damage_time >= self.damage_cooldown:
             self.current_health = max(0, self.current_health - amount)
             self.last_damage_time = current_time
+            self.invalidate_hud()
 
-    def update_projectiles(self) -> None:
+    def update_projectiles(self, current_time: int, world_offset: float = 0) -> None:
         """
-        Updates all projectiles (bullets, grenades, explosions).
+        Updates all projectiles (bullets, grenades, explosions) by one simulation tick.
         Handles movement, collisions, and cleanup.
+
+        Args:
+            current_time (int): Current simulation time in milliseconds
+            world_offset (float): Current world offset, used to place explosions in world space
         """
-        current_time = pygame.time.get_ticks()
+        # Release a grenade once the throw animation reaches it
+        if self.pending_throw and current_time >= self.delayed_throw_time:
+            self.release_grenade(*self.pending_throw)
+            self.pending_throw = None
 
         # Update bullets
-        self.bullets = [bullet for bullet in self.bullets if not self._is_off_screen(bullet['rect'])]
         for bullet in self.bullets:
-            bullet['rect'].x += bullet['velocity'][0]
-            bullet['rect'].y += bullet['velocity'][1]
+            if bullet.is_off_screen():
+                self.bullets.release(bullet)
+        self.bullets.sweep()
+        self.bullets.integrate()
 
         # Update grenades
-        for grenade in self.grenades[:]:
-            grenade['rect'].x += grenade['velocity'][0]
-            grenade['rect'].y += grenade['velocity'][1]
-
+        self.grenades.integrate(GRENADE_GRAVITY)
+        ground = self.original_y + self.rect.height
+        for grenade in self.grenades:
             # Handle grenade landing
-            if grenade['rect'].bottom >= self.original_y + self.rect.height:
-                grenade['rect'].bottom = self.original_y + self.rect.height
-                grenade['velocity'] = (0, 0)
-
-                if not grenade.get('exploded', False):
-                    grenade['exploded'] = True
-                    # Play explosion sound multiple times for extra impact
-                    self.sound_manager.play_sound('grenade')
-                    pygame.time.delay(100)  # Add delay to ensure sound plays
-                    self.sound_manager.play_sound('grenade')
-                    self.explosions.append({
-                        'pos': (grenade['rect'].centerx, grenade['rect'].centery),
-                        'start_time': current_time,
-                        'radius': 0,
-                        'max_radius': EXPLOSION_RADIUS,
-                        'damage': 150
-                    })
-                    self.grenades.remove(grenade)
-            else:
-                grenade['velocity'] = (grenade['velocity'][0], grenade['velocity'][1] + GRENADE_GRAVITY)
-                grenade['angle'] += grenade['rotation_speed']
-
-            if self._is_off_screen(grenade['rect']):
-                self.grenades.remove(grenade)
+            if grenade.y + grenade.height >= ground:
+                grenade.y = ground - grenade.height
+                # Explosion sound is layered for extra impact, see SOUND_LAYERS
+                self.sound_manager.play_sound('grenade')
+                centerx, centery = grenade.center
+                self.explosions.detonate((centerx, centery), (centerx + world_offset, centery), current_time)
+                self.grenades.release(grenade)
+            elif grenade.is_off_screen():
+                self.grenades.release(grenade)
+        self.grenades.sweep()
 
         # Update explosions
-        self.explosions = [explosion for explosion in self.explosions
-                          if current_time - explosion['start_time'] < EXPLOSION_DURATION]
-        for explosion in self.explosions:
-            progress = (current_time - explosion['start_time']) / EXPLOSION_DURATION
-            explosion['radius'] = int(explosion['max_radius'] * progress)
+        self.explosions.update(current_time)
 
         # Check reload completion
         if self.reload_complete_time and current_time >= self.reload_complete_time:
             self.current_bullets = self.max_bullets
             self.reload_complete_time = None
+            self.invalidate_hud()
 
-    def _is_off_screen(self, rect: pygame.Rect) -> bool:
-        return (rect.right < 0 or rect.left > SCREEN_WIDTH or
-                rect.bottom < 0 or rect.top > SCREEN_HEIGHT)
-
-    def shoot(self, current_time: int, world_offset: int) -> None:
+    def shoot(self, current_time: int, world_offset: float) -> bool:
         if (current_time - self.last_shot_time >= SHOOT_COOLDOWN and
             not self.animation.shooting and
             not self.animation.reloading and
-            self.current_bullets > 0):
+            self.current_bullets > 0 and
+            self.bullets.has_room()):
             self.animation.start_shoot(current_time)
             self.last_shot_time = current_time
             self.sound_manager.play_sound('gunshot')
@@ -659,14 +1560,13 @@ class Player:
             bullet_y = self.rect.centery + 35
             bullet_width = int(100 * BULLET_SCALE)
             bullet_height = int(100 * BULLET_SCALE)
-            bullet_rect = pygame.Rect(bullet_x, bullet_y, bullet_width, bullet_height)
             initial_velocity = (BULLET_SPEED if self.direction == "right" else -BULLET_SPEED, 0)
-            self.bullets.append({
-                'rect': bullet_rect,
-                'velocity': initial_velocity,
-                'direction': self.direction
-            })
+            self.bullets.acquire().launch(bullet_x, bullet_y, bullet_width, bullet_height,
+                                          initial_velocity, self.direction, current_time)
             self.current_bullets -= 1
+            self.invalidate_hud()
+            return True
+        return False
 
     def throw(self, current_time: int, velocity: Tuple[float, float]) -> None:
         if (current_time - self.animation.last_throw_time >= self.animation.throw_cooldown and
@@ -675,41 +1575,43 @@ class Player:
             self.current_grenades > 0):
 
             self.animation.start_throw(current_time)
+            self.delayed_throw_time = current_time + GRENADE_THROW_DELAY
+            self.pending_throw = (velocity, current_time)
 
-            def delayed_throw():
-                spawn_offset = -BULLET_SPAWN_OFFSET if self.direction == "left" else BULLET_SPAWN_OFFSET
-                grenade_x = SCREEN_WIDTH // 2 + spawn_offset
-                grenade_y = self.rect.centery + 25
-                grenade_width = int(20 * BULLET_SCALE * 4)
-                grenade_height = int(20 * BULLET_SCALE * 4)
-
-                self.grenades.append({
-                    'rect': pygame.Rect(grenade_x, grenade_y, grenade_width, grenade_height),
-                    'velocity': velocity,
-                    'direction': self.direction,
-                    'angle': 0,
-                    'rotation_speed': 10,
-                    'start_time': current_time,
-                    'is_active': True
-                })
-                self.current_grenades -= 1
-
-            pygame.time.set_timer(pygame.USEREVENT, 500)
-            self.delayed_throw_callback = delayed_throw
-
-    def start_reload(self) -> None:
+    def release_grenade(self, velocity: Tuple[float, float], throw_time: int) -> None:
+        # The grenade leaves the hand partway through the throw animation
+        grenade = self.grenades.acquire()
+        if grenade is None:
+            return
+        spawn_offset = -BULLET_SPAWN_OFFSET if self.direction == "left" else BULLET_SPAWN_OFFSET
+        grenade_x = SCREEN_WIDTH // 2 + spawn_offset
+        grenade_y = self.rect.centery + 25
+        grenade_width = int(20 * BULLET_SCALE * 4)
+        grenade_height = int(20 * BULLET_SCALE * 4)
+
+        grenade.launch(grenade_x, grenade_y, grenade_width, grenade_height,
+                       velocity, self.direction, throw_time, rotation_speed=10)
+        self.current_grenades -= 1
+        self.invalidate_hud()
+
+    def start_reload(self, current_time: int) -> bool:
         if not self.animation.reloading and self.current_bullets < self.max_bullets:
-            self.animation.start_reload()
-            self.reload_complete_time = pygame.time.get_ticks() + (len(self.assets.recharge_frames) * self.animation.throw_frame_delay)
+            self.animation.start_reload(current_time)
+            self.reload_complete_time = current_time + (len(self.assets.recharge_frames) * self.animation.throw_frame_delay)
+            return True
+        return False
 
     def handle_jumping(self, keys: pygame.key.ScancodeWrapper) -> None:
+        self.prev_y = self.y
         if self.jumping:
-            self.rect.y += self.velocity
-            self.velocity += GRAVITY
-            if self.rect.y >= self.original_y:
-                self.rect.y = self.original_y
+            # Exact step along the arc, so its height is the same at any rate; at 60 Hz this is y += velocity
+            self.y += (self.velocity + GRAVITY * (TICK_SCALE - 1) / 2) * TICK_SCALE
+            self.velocity += GRAVITY * TICK_SCALE
+            if self.y >= self.original_y:
+                self.y = self.original_y
                 self.jumping = False
                 self.velocity = 0
+            self.rect.y = round(self.y)
         elif keys[pygame.K_w] and not self.jumping:
             self.jumping = True
             self.velocity = JUMP_STRENGTH
@@ -739,92 +1641,90 @@ class Player:
                 y += vy
                 vy += GRENADE_GRAVITY
 
-    def release_grenade_aim(self) -> None:
+    def release_grenade_aim(self, current_time: int) -> None:
         if self.is_aiming_grenade:
             dx = self.grenade_aim_start_pos[0] - self.grenade_aim_current_pos[0]
             dy = self.grenade_aim_start_pos[1] - self.grenade_aim_current_pos[1]
             velocity = (dx * PULL_MULTIPLIER, dy * PULL_MULTIPLIER)
-            self.throw(pygame.time.get_ticks(), velocity)
+            self.throw(current_time, velocity)
             self.is_aiming_grenade = False
             self.grenade_trajectory_points = []
             self.grenade_power = 0
 
-    def draw_bullet_counter(self, screen) -> None:
-        ammo_bg = pygame.Surface((220, 130), pygame.SRCALPHA)
-        for y in range(130):
-            alpha = int(150 * (1 - y / 130))
-            pygame.draw.line(ammo_bg, (0, 0, 0, alpha), (0, y), (220, y))
+    def _bake_hud_chrome(self) -> pygame.Surface:
+        # Render the parts of the ammo panel that never change
+        chrome = pygame.Surface((HUD_PANEL_WIDTH, HUD_PANEL_HEIGHT), pygame.SRCALPHA)
+        for y in range(HUD_PANEL_HEIGHT):
+            alpha = int(150 * (1 - y / HUD_PANEL_HEIGHT))
+            pygame.draw.line(chrome, (0, 0, 0, alpha), (0, y), (HUD_PANEL_WIDTH, y))
         for i in range(3):
             alpha = 100 - i * 30
-            pygame.draw.rect(ammo_bg, (255, 255, 255, alpha), (i, i, 220 - i * 2, 130 - i * 2), 2)
-        bar_width = 200
-        bar_height = 30
-        bar_x = (220 - bar_width) // 2
+            pygame.draw.rect(chrome, (255, 255, 255, alpha), (i, i, HUD_PANEL_WIDTH - i * 2, HUD_PANEL_HEIGHT - i * 2), 2)
+        bar_x, bullet_y, grenade_y = self._hud_bar_layout()
+        shadow_offset = 2
+        shadow_color = (0, 0, 0, 150)
+        for bar_y, label in ((bullet_y, "AMMO"), (grenade_y, "GRENADES")):
+            for y in range(HUD_BAR_HEIGHT):
+                shade = 30 + (y * 2)
+                pygame.draw.line(chrome, (shade, shade, shade, 200),
+                               (bar_x, bar_y + y),
+                               (bar_x + HUD_BAR_WIDTH, bar_y + y))
+            shadow = self.font.render(label, True, shadow_color)
+            chrome.blit(shadow, (bar_x + 5 + shadow_offset, bar_y - 25 + shadow_offset))
+            chrome.blit(self.font.render(label, True, WHITE), (bar_x + 5, bar_y - 25))
+        return chrome
+
+    def _hud_bar_layout(self) -> Tuple[int, int, int]:
+        bar_x = (HUD_PANEL_WIDTH - HUD_BAR_WIDTH) // 2
         bar_spacing = 25
-        total_content_height = (bar_height * 2) + bar_spacing + 50
-        start_y = (130 - total_content_height) // 2 + 10
+        total_content_height = (HUD_BAR_HEIGHT * 2) + bar_spacing + 50
+        start_y = (HUD_PANEL_HEIGHT - total_content_height) // 2 + 10
         bullet_y = start_y + 25
-        for y in range(bar_height):
-            shade = 30 + (y * 2)
-            pygame.draw.line(ammo_bg, (shade, shade, shade, 200),
-                           (bar_x, bullet_y + y),
-                           (bar_x + bar_width, bullet_y + y))
-        current_bullet_width = int((self.current_bullets / self.max_bullets) * bar_width)
-        for i in range(3):
-            alpha = 200 - i * 50
-            pygame.draw.rect(ammo_bg, (255, 215, 0, alpha),
-                           (bar_x, bullet_y, current_bullet_width, bar_height))
-        pygame.draw.line(ammo_bg, (200, 200, 200, 200), (bar_x, bullet_y), (bar_x + bar_width, bullet_y), 2)
-        pygame.draw.line(ammo_bg, (50, 50, 50, 200), (bar_x, bullet_y + bar_height), (bar_x + bar_width, bullet_y + bar_height), 2)
-        pygame.draw.line(ammo_bg, (200, 200, 200, 200), (bar_x, bullet_y), (bar_x, bullet_y + bar_height), 2)
-        pygame.draw.line(ammo_bg, (50, 50, 50, 200), (bar_x + bar_width, bullet_y), (bar_x + bar_width, bullet_y + bar_height), 2)
-        grenade_y = bullet_y + bar_height + bar_spacing
-        for y in range(bar_height):
-            shade = 30 + (y * 2)
-            pygame.draw.line(ammo_bg, (shade, shade, shade, 200),
-                           (bar_x, grenade_y + y),
-                           (bar_x + bar_width, grenade_y + y))
-        current_grenade_width = int((self.current_grenades / self.max_grenades) * bar_width)
-        for i in range(3):
-            alpha = 200 - i * 50
-            pygame.draw.rect(ammo_bg, (255, 50, 50, alpha),
-                           (bar_x, grenade_y, current_grenade_width, bar_height))
-        pygame.draw.line(ammo_bg, (200, 200, 200, 200), (bar_x, grenade_y), (bar_x + bar_width, grenade_y), 2)
-        pygame.draw.line(ammo_bg, (50, 50, 50, 200), (bar_x, grenade_y + bar_height), (bar_x + bar_width, grenade_y + bar_height), 2)
-        pygame.draw.line(ammo_bg, (200, 200, 200, 200), (bar_x, grenade_y), (bar_x, grenade_y + bar_height), 2)
-        pygame.draw.line(ammo_bg, (50, 50, 50, 200), (bar_x + bar_width, grenade_y), (bar_x + bar_width, grenade_y + bar_height), 2)
-        bullet_label = self.font.render("AMMO", True, (255, 255, 255))
-        grenade_label = self.font.render("GRENADES", True, (255, 255, 255))
-        bullet_count = self.font.render(f"{self.current_bullets}/{self.max_bullets}", True, (255, 255, 255))
-        grenade_count = self.font.render(f"{self.current_grenades}/{self.max_grenades}", True, (255, 255, 255))
+        grenade_y = bullet_y + HUD_BAR_HEIGHT + bar_spacing
+        return bar_x, bullet_y, grenade_y
+
+    def _render_hud(self) -> pygame.Surface:
+        # Compose the ammo panel from the baked chrome and the current counts
+        if self.hud_chrome is None:
+            self.hud_chrome = self._bake_hud_chrome()
+        hud = self.hud_chrome.copy()
+        bar_x, bullet_y, grenade_y = self._hud_bar_layout()
         shadow_offset = 2
         shadow_color = (0, 0, 0, 150)
-        shadow = self.font.render("AMMO", True, shadow_color)
-        ammo_bg.blit(shadow, (bar_x + 5 + shadow_offset, bullet_y - 25 + shadow_offset))
-        ammo_bg.blit(bullet_label, (bar_x + 5, bullet_y - 25))
-        shadow = self.font.render("GRENADES", True, shadow_color)
-        ammo_bg.blit(shadow, (bar_x + 5 + shadow_offset, grenade_y - 25 + shadow_offset))
-        ammo_bg.blit(grenade_label, (bar_x + 5, grenade_y - 25))
-        shadow = self.font.render(f"{self.current_bullets}/{self.max_bullets}", True, shadow_color)
-        ammo_bg.blit(shadow, (bar_x + bar_width - bullet_count.get_width() - 5 + shadow_offset,
-                            bullet_y - 25 + shadow_offset))
-        ammo_bg.blit(bullet_count, (bar_x + bar_width - bullet_count.get_width() - 5, bullet_y - 25))
-        shadow = self.font.render(f"{self.current_grenades}/{self.max_grenades}", True, shadow_color)
-        ammo_bg.blit(shadow, (bar_x + bar_width - grenade_count.get_width() - 5 + shadow_offset,
-                            grenade_y - 25 + shadow_offset))
-        ammo_bg.blit(grenade_count, (bar_x + bar_width - grenade_count.get_width() - 5, grenade_y - 25))
-        screen.blit(ammo_bg, (SCREEN_WIDTH - 240, SCREEN_HEIGHT - 140))
+        bars = ((bullet_y, self.current_bullets, self.max_bullets, (255, 215, 0, 100)),
+                (grenade_y, self.current_grenades, self.max_grenades, (255, 50, 50, 100)))
+        for bar_y, current, maximum, fill_color in bars:
+            fill_width = int((current / maximum) * HUD_BAR_WIDTH)
+            pygame.draw.rect(hud, fill_color, (bar_x, bar_y, fill_width, HUD_BAR_HEIGHT))
+            pygame.draw.line(hud, (200, 200, 200, 200), (bar_x, bar_y), (bar_x + HUD_BAR_WIDTH, bar_y), 2)
+            pygame.draw.line(hud, (50, 50, 50, 200), (bar_x, bar_y + HUD_BAR_HEIGHT), (bar_x + HUD_BAR_WIDTH, bar_y + HUD_BAR_HEIGHT), 2)
+            pygame.draw.line(hud, (200, 200, 200, 200), (bar_x, bar_y), (bar_x, bar_y + HUD_BAR_HEIGHT), 2)
+            pygame.draw.line(hud, (50, 50, 50, 200), (bar_x + HUD_BAR_WIDTH, bar_y), (bar_x + HUD_BAR_WIDTH, bar_y + HUD_BAR_HEIGHT), 2)
+            count_text = f"{current}/{maximum}"
+            count = self.font.render(count_text, True, WHITE)
+            count_x = bar_x + HUD_BAR_WIDTH - count.get_width() - 5
+            shadow = self.font.render(count_text, True, shadow_color)
+            hud.blit(shadow, (count_x + shadow_offset, bar_y - 25 + shadow_offset))
+            hud.blit(count, (count_x, bar_y - 25))
+        return hud
+
+    def draw_bullet_counter(self, screen) -> None:
+        if self.hud_dirty:
+            self.hud_surface = self._render_hud()
+            self.hud_dirty = False
+        screen.blit(self.hud_surface, (SCREEN_WIDTH - 240, SCREEN_HEIGHT - 140))
 
     def draw_health_bar(self, screen) -> None:
-        bar_x = SCREEN_WIDTH - self.health_bar_width - self.health_bar_padding
-        bar_y = self.health_bar_padding
-        pygame.draw.rect(screen, MILITARY_RED,
-                        (bar_x, bar_y, self.health_bar_width, self.health_bar_height))
-        current_width = int((self.current_health / self.max_health) * self.health_bar_width)
-        pygame.draw.rect(screen, CAMO_GREEN,
-                        (bar_x, bar_y, current_width, self.health_bar_height))
-        pygame.draw.rect(screen, WHITE,
-                        (bar_x, bar_y, self.health_bar_width, self.health_bar_height), 2)
+        if self.health_bar_dirty:
+            bar = pygame.Surface((self.health_bar_width, self.health_bar_height))
+            bar.fill(MILITARY_RED)
+            current_width = int((self.current_health / self.max_health) * self.health_bar_width)
+            pygame.draw.rect(bar, CAMO_GREEN, (0, 0, current_width, self.health_bar_height))
+            pygame.draw.rect(bar, WHITE, (0, 0, self.health_bar_width, self.health_bar_height), 2)
+            self.health_bar_surface = bar
+            self.health_bar_dirty = False
+        screen.blit(self.health_bar_surface,
+                    (SCREEN_WIDTH - self.health_bar_width - self.health_bar_padding, self.health_bar_padding))
 
     def draw_grenade_aim(self, screen) -> None:
         if not self.is_aiming_grenade:
@@ -890,7 +1790,8 @@ class Zombie:
 
     def __init__(self, x: int, y: int, assets: GameAssets):
         # Initialize zombie position and dimensions
-        self.rect = pygame.Rect(x + 40, y + 100, 60, 140)  # Hitbox for collision detection
+        self.x = x + 40  # World x of the hitbox, kept fractional; rect.x is it rounded
+        self.rect = pygame.Rect(round(self.x), y + 100, 60, 140)  # Hitbox for collision detection
 
         # Game assets and animation
         self.assets = assets  # Game assets (sprites, animations)
@@ -900,6 +1801,7 @@ class Zombie:
 
         # Movement and behavior
         self.speed = 2  # Movement speed
+        self.prev_x = self.x  # Position at the previous tick, for render interpolation
         self.direction = "left"  # Current facing direction
         self.health = 100  # Current health
         self.max_health = 100  # Maximum health
@@ -911,9 +1813,6 @@ class Zombie:
         self.health_bar_width = 40  # Width of health bar
         self.health_bar_height = 5  # Height of health bar
 
-        # UI elements
-        self.font = pygame.font.Font(None, 20)  # Font for UI elements
-
         # Attack system
         self.is_attacking = False  # Whether zombie is attacking
         self.attack_frame = 0  # Current attack animation frame
@@ -924,19 +1823,21 @@ class Zombie:
         self.attack_damage = 10  # Damage per attack
         self.has_dealt_damage = False  # Whether damage was dealt in current attack
 
-    def update(self, player_x: int, player: 'Player') -> None:
+    def update(self, player_x: int, player: 'Player', current_time: int, dt: float = SIMULATION_DT) -> None:
         """
-        Updates zombie state including movement, attacks, and animations.
+        Updates zombie state including movement, attacks, and animations by one simulation tick.
 
         Args:
             player_x (int): X position of the player
             player (Player): Player object for interaction
+            current_time (int): Current simulation time in milliseconds
+            dt (float): Length of the tick in milliseconds
         """
+        self.prev_x = self.x
         if not self.is_alive:
             return
 
-        current_time = pygame.time.get_ticks()
-        distance_to_player = abs(self.rect.x - player_x)
+        distance_to_player = abs(self.x - player_x)
 
         # Handle player detection and attack
         if distance_to_player <= self.detection_range:
@@ -954,44 +1855,48 @@ class Zombie:
                         self.attack_frame_timer = current_time
                         self.attack_frame = (self.attack_frame + 1) % len(self.assets.zombie_attack_frames)
                         if not self.has_dealt_damage and self.attack_frame == 0:
-                            player.take_damage(self.attack_damage)
+                            player.take_damage(self.attack_damage, current_time)
                             self.has_dealt_damage = True
                         if self.attack_frame == 0:
                             self.is_attacking = False
             else:
                 # Move towards player
-                if self.rect.x > player_x:
-                    self.rect.x -= self.speed
+                if self.x > player_x:
+                    self.x -= self.speed * TICK_SCALE
                     self.direction = "left"
                 else:
-                    self.rect.x += self.speed
+                    self.x += self.speed * TICK_SCALE
                     self.direction = "right"
+                self.rect.x = round(self.x)
                 self.is_attacking = False
                 self.attack_frame = 0
 
         # Update walking animation if not attacking
         if not self.is_attacking:
-            self.frame_timer += clock.get_time()
+            self.frame_timer += dt
             if self.frame_timer > self.frame_delay:
                 self.frame_timer = 0
                 self.frame = (self.frame + 1) % len(self.assets.zombie_frames)
 
-    def draw(self, screen, world_offset: int) -> None:
+    def draw(self, screen, world_offset: int, alpha: float = 1.0) -> None:
         """
         Draws the zombie and its health bar.
 
         Args:
             screen: Pygame surface to draw on
             world_offset (int): Current world offset for scrolling
+            alpha (float): Fraction of the way from the previous tick to the current one
         """
         if not self.is_alive:
             return
 
-        screen_x = self.rect.x - world_offset - 40
+        screen_x = round(lerp(self.prev_x, self.x, alpha)) - world_offset - 40
         if 0 <= screen_x <= SCREEN_WIDTH:
             # Draw zombie sprite
-            frame = self.assets.zombie_attack_frames[self.attack_frame] if self.is_attacking else self.assets.zombie_frames[self.frame]
-            frame = pygame.transform.flip(frame, self.direction == "left", False)
+            if self.is_attacking:
+                frame = self.assets.frames("Enemy/Attack", self.direction)[self.attack_frame]
+            else:
+                frame = self.assets.frames("Enemy/Run", self.direction)[self.frame]
             screen.blit(frame, (screen_x, self.rect.y - 100))
 
             # Draw health bar
@@ -1020,52 +1925,378 @@ class Zombie:
             self.is_alive = False
 
 
-class GameOverScreen:
-    def __init__(self, screen, clock, is_win: bool):
-        self.screen = screen
-        self.clock = clock
-        self.screen_width, self.screen_height = screen.get_size()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
-        self.small_font = pygame.font.Font(None, 24)
-        self.selected_option = 0
-        self.options = ["Play Again", "Main Menu"]
-        self.fade_alpha = 0
-        self.fade_speed = 5
-        self.is_win = is_win
-        self.stats = {
-            "zombies_killed": 0,
-            "time_survived": "00:00",
-            "distance_traveled": 0,
-            "accuracy": 0
-        }
-        self.military_font = pygame.font.Font(None, 72)
-        self.background_image = pygame.image.load("Assets/Background.jpg").convert()
-        self.background_image = pygame.transform.scale(self.background_image, (self.screen_width, self.screen_height))
+class Horde:
+    """
+    Struct-of-arrays zombie storage backed by NumPy.
+    Follows the same rules as Zombie, but moves, attacks and takes damage as
+    whole-array operations, so a wave can hold thousands of zombies.
+    """
 
-    def draw_overlay(self, alpha=100):
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(alpha)
-        self.screen.blit(overlay, (0, 0))
+    WIDTH, HEIGHT = 60, 140  # Hitbox size, matching Zombie.rect
+    FIELDS = {
+        "id": "int64", "x": "float64", "prev_x": "float64", "y": "int32",
+        "health": "float64", "max_health": "float64", "speed": "float64",
+        "frame": "int32", "frame_timer": "float64",
+        "attack_frame": "int32", "attack_frame_timer": "float64", "last_attack_time": "float64",
+        "attacking": "bool", "dealt_damage": "bool", "facing_left": "bool", "alive": "bool"
+    }
+
+    def __init__(self, assets: GameAssets, capacity: int = HORDE_INITIAL_CAPACITY):
+        if np is None:
+            raise RuntimeError("The horde engine requires NumPy")
+        self.assets = assets
+        self.run_frame_count = len(assets.zombie_frames)
+        self.attack_frame_count = len(assets.zombie_attack_frames)
+        self.count = 0  # Slots in use, alive or dead, in spawn order
+        self.alive_count = 0
+        self.next_id = 0  # Stable ids survive compaction, for per-explosion hit sets
+        self.capacity = 0
+        self.detection_range = 500
+        self.attack_range = 100
+        self.attack_cooldown = 1000
+        self.attack_frame_delay = 100
+        self.attack_damage = 10
+        self.frame_delay = 150
+        self.health_bar_width = 40
+        self.health_bar_height = 5
+        self._resize(capacity)
+
+    def __len__(self) -> int:
+        return self.alive_count
+
+    def clear(self) -> None:
+        # Forget every zombie but keep the arrays for the next game
+        self.count = self.alive_count = self.next_id = 0
+
+    def _resize(self, capacity: int) -> None:
+        for name, dtype in self.FIELDS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def spawn(self, xs: List[float], y: int, speed: float, health: float) -> None:
+        # Add a batch of zombies; x and y follow Zombie's sprite-to-hitbox offsets
+        n = len(xs)
+        if self.count + n > self.capacity:
+            self._resize(max(self.capacity * 2, self.count + n))
+        batch = slice(self.count, self.count + n)
+        for name in self.FIELDS:
+            getattr(self, name)[batch] = 0
+        self.id[batch] = np.arange(self.next_id, self.next_id + n)
+        self.next_id += n
+        self.x[batch] = np.asarray(xs, dtype="float64") + 40
+        self.prev_x[batch] = self.x[batch]
+        self.y[batch] = y + 100
+        self.health[batch] = health
+        self.max_health[batch] = health
+        self.speed[batch] = speed
+        self.facing_left[batch] = True
+        self.alive[batch] = True
+        self.count += n
+        self.alive_count += n
+
+    def compact(self) -> None:
+        # Drop dead slots while keeping spawn order
+        keep = np.flatnonzero(self.alive[:self.count])
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:keep.size] = array[keep]
+        self.count = int(keep.size)
+
+    def update(self, player_x: int, player: 'Player', current_time: int, dt: float = SIMULATION_DT) -> None:
+        """
+        Advances every zombie by one simulation tick, following Zombie.update.
 
-    def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        Args:
+            player_x (int): X position of the player
+            player (Player): Player object for interaction
+            current_time (int): Current simulation time in milliseconds
+            dt (float): Length of the tick in milliseconds
+        """
+        n = self.count
+        x = self.x[:n]
+        self.prev_x[:n] = x
+        alive = self.alive[:n]
+        attacking = self.attacking[:n]
+        attack_frame = self.attack_frame[:n]
+        distance = np.abs(x - player_x)
+        detected = alive & (distance <= self.detection_range)
+        in_range = detected & (distance <= self.attack_range)
+        chasing = detected & ~in_range
+
+        # Start attacks whose cooldown has passed
+        starting = in_range & ~attacking & (current_time - self.last_attack_time[:n] >= self.attack_cooldown)
+        attacking[starting] = True
+        attack_frame[starting] = 0
+        self.dealt_damage[:n][starting] = False
+        self.last_attack_time[:n][starting] = current_time
+
+        # Step attack animations; damage lands when the animation wraps
+        stepping = in_range & attacking & (current_time - self.attack_frame_timer[:n] >= self.attack_frame_delay)
+        self.attack_frame_timer[:n][stepping] = current_time
+        attack_frame[stepping] = (attack_frame[stepping] + 1) % self.attack_frame_count
+        finished = stepping & (attack_frame == 0)
+        landed = finished & ~self.dealt_damage[:n]
+        if landed.any():
+            # Player.take_damage has a cooldown, so one call covers every landed hit
+            player.take_damage(self.attack_damage, current_time)
+            self.dealt_damage[:n][landed] = True
+        attacking[finished] = False
+
+        # Move towards the player
+        moving_left = chasing & (x > player_x)
+        moving_right = chasing & ~moving_left
+        step = self.speed[:n] * TICK_SCALE
+        x[moving_left] -= step[moving_left]
+        x[moving_right] += step[moving_right]
+        self.facing_left[:n][moving_left] = True
+        self.facing_left[:n][moving_right] = False
+        attacking[chasing] = False
+        attack_frame[chasing] = 0
+
+        # Update walking animation if not attacking
+        walking = alive & ~attacking
+        frame_timer = self.frame_timer[:n]
+        frame_timer[walking] += dt
+        advancing = walking & (frame_timer > self.frame_delay)
+        frame_timer[advancing] = 0
+        frame = self.frame[:n]
+        frame[advancing] = (frame[advancing] + 1) % self.run_frame_count
+
+    def resolve_hits(self, bullets: ProjectilePool, explosions: ExplosionSystem,
+                     world_offset: float) -> Tuple[List[int], int]:
+        """
+        Applies bullet and explosion damage to the whole horde.
+
+        Bullets are matched as in CollisionSystem.resolve: zombies are taken in
+        spawn order and each takes the earliest-fired overlapping bullet not
+        already spent, so each zombie takes at most one bullet and each bullet
+        hits at most one zombie. Each explosion damages a zombie once, when its
+        reach first touches it.
+
+        Returns:
+            Tuple: Indices of bullets that hit, in the order of the zombies they hit, and the number of zombies killed
+        """
+        n = self.count
+        alive = self.alive[:n]
+        left = np.rint(self.x[:n])  # Rounded, as Zombie.rect is
+        right = left + self.WIDTH
+        top = self.y[:n]
+        bottom = top + self.HEIGHT
+        shot = np.zeros(n, dtype=bool)
+        spent = []
+        indices = []
+        overlaps = []  # One row per bullet in firing order, flagging the living zombies it overlaps
+        for index, bullet in enumerate(bullets):
+            if bullet.width <= 0 or bullet.height <= 0:
+                continue
+            bullet_left = int(bullet.x + world_offset)
+            bullet_top = int(bullet.y)
+            indices.append(index)
+            overlaps.append(alive & (left < bullet_left + bullet.width) & (bullet_left < right) &
+                            (top < bullet_top + bullet.height) & (bullet_top < bottom))
+        if overlaps:
+            overlaps = np.array(overlaps)
+            candidates = np.flatnonzero(overlaps.any(axis=0))
+            available = [True] * len(indices)
+            # Only the few zombies touching a bullet are walked, in spawn order, each as a column of bullet flags
+            for zombie, column in zip(candidates.tolist(), overlaps[:, candidates].T.tolist()):
+                for row, overlapping in enumerate(column):
+                    if overlapping and available[row]:
+                        available[row] = False
+                        shot[zombie] = True
+                        spent.append(indices[row])
+                        break
+        damage = shot * float(BULLET_DAMAGE)
+        for explosion in explosions:
+            ex, ey = explosion.world_pos
+            dx = np.maximum(np.maximum(left - ex, ex - right), 0)
+            dy = np.maximum(np.maximum(top - ey, ey - bottom), 0)
+            caught = alive & (dx * dx + dy * dy <= explosion.reach ** 2)
+            if explosion.hit:
+                caught &= ~np.isin(self.id[:n], np.fromiter(explosion.hit, dtype="int64"))
+            if caught.any():
+                explosion.hit.update(self.id[:n][caught].tolist())
+                damage[caught] += explosion.damage
+        health = self.health[:n]
+        health -= damage
+        died = alive & (health <= 0)
+        kills = int(np.count_nonzero(died))
+        if kills:
+            alive[died] = False
+            self.alive_count -= kills
+            if self.count - self.alive_count > max(HORDE_INITIAL_CAPACITY, self.count // 2):
+                self.compact()
+        return spent, kills
+
+    def count_between(self, left: float, right: float) -> int:
+        # Living zombies whose x lies in [left, right)
+        x = self.x[:self.count]
+        return int(np.count_nonzero(self.alive[:self.count] & (x >= left) & (x < right)))
+
+    def nearest_offset(self, player_x: int) -> Optional[float]:
+        # Signed distance from the player to the closest living zombie
+        offsets = self.x[:self.count][self.alive[:self.count]] - player_x
+        if offsets.size == 0:
+            return None
+        return float(offsets[np.argmin(np.abs(offsets))])
+
+    def draw(self, screen, world_offset: int, alpha: float = 1.0) -> None:
+        n = self.count
+        screen_x = np.rint(self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha) - world_offset - 40
+        visible = np.flatnonzero(self.alive[:n] & (screen_x >= 0) & (screen_x <= SCREEN_WIDTH))
+        run_frames = self.assets.sprites["Enemy/Run"]
+        attack_frames = self.assets.sprites["Enemy/Attack"]
+        for i in visible.tolist():
+            direction = "left" if self.facing_left[i] else "right"
+            if self.attacking[i]:
+                frame = attack_frames[direction][self.attack_frame[i]]
+            else:
+                frame = run_frames[direction][self.frame[i]]
+            x = int(screen_x[i])
+            y = int(self.y[i])
+            screen.blit(frame, (x, y - 100))
+            health_bar_x = x + (frame.get_width() - self.health_bar_width) // 3
+            health_bar_y = y - 23
+            pygame.draw.rect(screen, MILITARY_RED,
+                           (health_bar_x, health_bar_y, self.health_bar_width, self.health_bar_height))
+            current_width = int((self.health[i] / self.max_health[i]) * self.health_bar_width)
+            pygame.draw.rect(screen, CAMO_GREEN,
+                           (health_bar_x, health_bar_y, current_width, self.health_bar_height))
+            pygame.draw.rect(screen, WHITE,
+                           (health_bar_x, health_bar_y, self.health_bar_width, self.health_bar_height), 1)
+
+
+class CollisionSystem:
+    """
+    Resolves bullet hits against zombies in world space, and answers area
+    queries against the zombies for explosions.
+    The level only scrolls horizontally, so bullets and zombies are bucketed
+    into a 1-D spatial hash along x and each zombie only tests nearby bullets.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.bullet_cells = {}  # cell index -> bullet indices in firing order
+        self.zombie_cells = {}  # cell index -> zombies in spawn order
+        self.zombie_rank = {}  # id(zombie) -> spawn order, for ordering query results
+
+    def _cell_range(self, left: int, right: int) -> range:
+        return range(left // self.cell_size, (right - 1) // self.cell_size + 1)
+
+    def _index_bullets(self, bullets: ProjectilePool, world_offset: float) -> List[Tuple[int, int, int, int]]:
+        # Shift bullets from screen space into world space once per frame
+        self.bullet_cells.clear()
+        boxes = []
+        for index, bullet in enumerate(bullets):
+            left = int(bullet.x + world_offset)
+            top = int(bullet.y)
+            box = (left, top, left + bullet.width, top + bullet.height)
+            boxes.append(box)
+            if bullet.width > 0 and bullet.height > 0:
+                for cell in self._cell_range(box[0], box[2]):
+                    self.bullet_cells.setdefault(cell, []).append(index)
+        return boxes
+
+    def index_zombies(self, zombies: List['Zombie']) -> None:
+        self.zombie_cells.clear()
+        self.zombie_rank.clear()
+        for rank, zombie in enumerate(zombies):
+            if zombie.is_alive:
+                self.zombie_rank[id(zombie)] = rank
+                for cell in self._cell_range(zombie.rect.left, zombie.rect.right):
+                    self.zombie_cells.setdefault(cell, []).append(zombie)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List['Zombie']:
+        """
+        Returns the indexed zombies whose hitbox lies within radius of a world-space point, in spawn order.
+        """
+        found = []
+        seen = set()
+        for cell in self._cell_range(int(x - radius), int(x + radius) + 1):
+            for zombie in self.zombie_cells.get(cell, ()):
+                rect = zombie.rect
+                dx = max(rect.left - x, x - rect.right, 0)
+                dy = max(rect.top - y, y - rect.bottom, 0)
+                if id(zombie) not in seen and dx * dx + dy * dy <= radius * radius:
+                    seen.add(id(zombie))
+                    found.append(zombie)
+        found.sort(key=lambda zombie: self.zombie_rank[id(zombie)])
+        return found
+
+    def resolve(self, zombies: List['Zombie'], bullets: ProjectilePool,
+                world_offset: float) -> List[Tuple['Zombie', int]]:
+        """
+        Finds every bullet hit for this frame in a single pass.
+
+        Each zombie takes at most one bullet per frame, the earliest-fired one
+        overlapping it, and each bullet hits at most one zombie.
+
+        Args:
+            zombies (List[Zombie]): Zombies in spawn order
+            bullets (ProjectilePool): Player bullets in screen space, in firing order
+            world_offset (float): Current world offset for scrolling
+
+        Returns:
+            List: (zombie, bullet index) pairs
+        """
+        bullet_hits = []
+        if bullets:
+            boxes = self._index_bullets(bullets, world_offset)
+            spent = set()
+            for zombie in zombies:
+                if not zombie.is_alive:
+                    continue
+                rect = zombie.rect
+                best = None
+                for cell in self._cell_range(rect.left, rect.right):
+                    for index in self.bullet_cells.get(cell, ()):
+                        if best is not None and index >= best:
+                            break
+                        left, top, right, bottom = boxes[index]
+                        if (index not in spent and rect.left < right and left < rect.right and
+                                rect.top < bottom and top < rect.bottom):
+                            best = index
+                            break
+                if best is not None:
+                    spent.add(best)
+                    bullet_hits.append((zombie, best))
+        return bullet_hits
+
+
+class GameOverScreen:
+    def __init__(self, screen, clock, is_win: bool):
+        self.screen = screen
+        self.clock = clock
+        self.screen_width, self.screen_height = screen.get_size()
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
+        self.small_font = asset_registry.font(None, 24)
+        self.selected_option = 0
+        self.options = ["Play Again", "Main Menu"]
+        self.fade_alpha = 0
+        self.fade_speed = 5
+        self.is_win = is_win
+        self.stats = {
+            "zombies_killed": 0,
+            "time_survived": "00:00",
+            "distance_traveled": 0,
+            "accuracy": 0
+        }
+        self.military_font = asset_registry.font(None, 72)
+        self.background_image = asset_registry.image("Assets/Background.jpg", alpha=False,
+                                                     size=(self.screen_width, self.screen_height))
+
+    def draw_overlay(self, alpha=100):
+        overlay = pygame.Surface((self.screen_width, self.screen_height))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        self.screen.blit(overlay, (0, 0))
+
+    def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center)
 
     def draw_menu(self):
         self.screen.blit(self.background_image, (0, 0))
@@ -1133,13 +2364,18 @@ class GameOverScreen:
         return "game_over"
 
     def run(self):
+        frame_name = f"{type(self).__name__}.frame"
         while True:
-            action = self.handle_events()
-            if action != "game_over":
-                return action
-            self.draw_menu()
-            pygame.display.flip()
-            self.clock.tick(60)
+            with tracer.span(frame_name, "menu"):
+                action = self.handle_events()
+                if action != "game_over":
+                    return action
+                with tracer.span("draw", "menu"):
+                    self.draw_menu()
+                with tracer.span("present", "menu"):
+                    pygame.display.flip()
+                with tracer.span("wait", "menu"):
+                    self.clock.tick(60)
 
 
 class LoseScreen(GameOverScreen):
@@ -1147,8 +2383,53 @@ class LoseScreen(GameOverScreen):
         super().__init__(screen, clock, False)
 
 
+class AssetLoader:
+    """
+    Loads the game's sprites and sounds on a worker thread, so the intro
+    cutscene can play while they load and report progress as it goes.
+    """
+
+    def __init__(self, registry: AssetRegistry):
+        self.registry = registry
+        self.total = 0  # Load steps, known once the manifest has been read
+        self.done = 0
+        self.error = None  # Exception from the worker; the main thread will hit it again when it loads
+        self.thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+
+    def start(self) -> 'AssetLoader':
+        # Fonts go through SDL_ttf, which is not thread-safe, so open them here first
+        for name, size in GameAssets.FONTS:
+            self.registry.font(name, size)
+        self.thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            manifest = GameAssets.manifest()
+            self.total = len(manifest) + 2
+            for path, options in manifest:
+                self.registry.image(path, **options)
+                self.done += 1
+            self.registry.get("game_assets", GameAssets)
+            self.done += 1
+            self.registry.get("sound_manager", SoundManager)
+            self.done += 1
+        except Exception as error:
+            self.error = error
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+    def is_done(self) -> bool:
+        return not self.thread.is_alive()
+
+    def wait(self) -> None:
+        self.thread.join()
+
+
 class IntroCutscene:
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, loader: Optional[AssetLoader] = None):
         self.screen = screen
         self.clock = clock
         self.screen_width, self.screen_height = screen.get_size()
@@ -1158,16 +2439,18 @@ class IntroCutscene:
         self.fade_speed = 3
         self.scene_duration = 3000
         self.scene_start_time = pygame.time.get_ticks()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
         self.text_complete = False
         self.text_complete_time = 0
         self.text_wait_duration = 1000
-        self.military_font = pygame.font.Font(None, 72)
-        self.background_image = pygame.image.load("Assets/Background.jpg").convert()
-        self.background_image = pygame.transform.scale(self.background_image, (self.screen_width, self.screen_height))
-        self.sound_manager = SoundManager()
+        self.military_font = asset_registry.font(None, 72)
+        self.small_font = asset_registry.font(None, 24)
+        self.background_image = asset_registry.image("Assets/Background.jpg", alpha=False,
+                                                     size=(self.screen_width, self.screen_height))
+        self.sound_manager = asset_registry.get("sound_manager", SoundManager)
         self.sound_manager.play_music('menu')
+        self.loader = loader  # Game assets loading in the background, if any
         self.scenes = [
             {
                 "title": "OPERATION: ZOMBIE STRIKE",
@@ -1208,22 +2491,7 @@ class IntroCutscene:
         self.screen.blit(overlay, (0, 0))
 
     def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center)
 
     def draw_scene(self):
         self.screen.blit(self.background_image, (0, 0))
@@ -1245,6 +2513,19 @@ class IntroCutscene:
             self.draw_text(current_scene["subtitle"], self.screen_width // 2, box_y + 180, WHITE, self.font)
         skip_text = "Press SPACE to skip"
         self.draw_text(skip_text, self.screen_width // 2, self.screen_height - 50, (200, 200, 200))
+        if self.loader:
+            self.draw_loading()
+
+    def draw_loading(self):
+        # Thin progress bar for the assets loading behind the briefing
+        bar_width, bar_height = 300, 6
+        bar_x = self.screen_width // 2 - bar_width // 2
+        bar_y = self.screen_height - 90
+        progress = 1.0 if self.loader.is_done() else self.loader.progress
+        pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(self.screen, HIGHLIGHT, (bar_x, bar_y, int(bar_width * progress), bar_height))
+        label = "READY" if progress >= 1.0 else f"LOADING {int(progress * 100)}%"
+        self.draw_text(label, self.screen_width // 2, bar_y - 15, (200, 200, 200), self.small_font)
 
     def update_typewriter(self):
         current_time = pygame.time.get_ticks()
@@ -1259,49 +2540,558 @@ class IntroCutscene:
 
     def run(self):
         while self.running:
-            current_time = pygame.time.get_ticks()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        return "start_game"
-                    if event.key == pygame.K_ESCAPE:
+            with tracer.span("IntroCutscene.frame", "menu"):
+                current_time = pygame.time.get_ticks()
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
                         return "quit"
-            current_scene = self.scenes[self.current_scene]
-            if current_scene["effect"] == "typewriter":
-                self.update_typewriter()
-                if self.text_complete and current_time - self.text_complete_time >= self.text_wait_duration:
-                    self.current_scene += 1
-                    if self.current_scene >= len(self.scenes):
-                        return "start_game"
-                    self.current_text = ""
-                    self.target_text = self.scenes[self.current_scene]["subtitle"]
-                    self.typewriter_index = 0
-                    self.text_complete = False
-            else:
-                if current_time - self.scene_start_time > self.scene_duration:
-                    self.current_scene += 1
-                    if self.current_scene >= len(self.scenes):
-                        return "start_game"
-                    self.scene_start_time = current_time
-                    self.current_text = ""
-                    self.target_text = self.scenes[self.current_scene]["subtitle"]
-                    self.typewriter_index = 0
-                    self.text_complete = False
-            self.draw_scene()
-            pygame.display.flip()
-            self.clock.tick(60)
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_SPACE:
+                            return "start_game"
+                        if event.key == pygame.K_ESCAPE:
+                            return "quit"
+                current_scene = self.scenes[self.current_scene]
+                if current_scene["effect"] == "typewriter":
+                    self.update_typewriter()
+                    if self.text_complete and current_time - self.text_complete_time >= self.text_wait_duration:
+                        self.current_scene += 1
+                        if self.current_scene >= len(self.scenes):
+                            return "start_game"
+                        self.current_text = ""
+                        self.target_text = self.scenes[self.current_scene]["subtitle"]
+                        self.typewriter_index = 0
+                        self.text_complete = False
+                else:
+                    if current_time - self.scene_start_time > self.scene_duration:
+                        self.current_scene += 1
+                        if self.current_scene >= len(self.scenes):
+                            return "start_game"
+                        self.scene_start_time = current_time
+                        self.current_text = ""
+                        self.target_text = self.scenes[self.current_scene]["subtitle"]
+                        self.typewriter_index = 0
+                        self.text_complete = False
+                with tracer.span("draw", "menu"):
+                    self.draw_scene()
+                with tracer.span("present", "menu"):
+                    pygame.display.flip()
+                with tracer.span("wait", "menu"):
+                    self.clock.tick(60)
         return "start_game"
 
 
+class FrameProfiler:
+    """
+    Per-frame timings for the game loop, shown as an overlay or reported headless.
+    Stages are timed by wrapping the game's own methods while the profiler is
+    enabled and unwrapping them when it is disabled, so switched off it costs
+    two clock reads per frame.
+    """
+
+    # (stage, owner, method); several methods can add to one stage
+    STAGES = (
+        ("handle_events", "game", "handle_events"),
+        ("handle_input", "game", "handle_input"),
+        ("update_projectiles", "player", "update_projectiles"),
+        ("update_zombies", "game", "update_zombies"),
+        ("draw_background", "game", "draw_background"),
+        ("draw_zombies", "game", "draw_zombies"),
+        ("draw_projectiles", "game", "draw_projectiles"),
+        ("hud", "game", "draw_time"),
+        ("hud", "game", "draw_wave_info"),
+        ("hud", "player", "draw_bullet_counter"),
+        ("hud", "player", "draw_health_bar"),
+        ("hud", "player", "draw_grenade_aim"),
+    )
+    GRAPH_SIZE = (PROFILER_HISTORY * 2, 60)
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self.enabled = False
+        self.stage_names = list(dict.fromkeys(stage for stage, _, _ in self.STAGES))
+        self.frame_times = deque(maxlen=PROFILER_HISTORY)  # Milliseconds of work per frame
+        self.stage_times = {stage: deque(maxlen=PROFILER_HISTORY) for stage in self.stage_names}
+        self.current = dict.fromkeys(self.stage_names, 0.0)  # Seconds spent in each stage this frame
+        self.frame_start = None
+        self.font = asset_registry.font(None, 22)
+
+    def _owner(self, owner: str):
+        return self.game if owner == "game" else self.game.player
+
+    def _timed(self, stage: str, method):
+        current = self.current
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                current[stage] += clock() - start
+        return timed
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        for stage, owner, name in self.STAGES:
+            target = self._owner(owner)
+            setattr(target, name, self._timed(stage, getattr(target, name)))
+        for stage in self.stage_names:
+            self.current[stage] = 0.0
+            self.stage_times[stage].clear()
+        self.enabled = True
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        for _, owner, name in self.STAGES:
+            vars(self._owner(owner)).pop(name, None)  # Falls back to the class method
+        self.enabled = False
+
+    def toggle(self) -> None:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def begin_frame(self) -> None:
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        # Close the frame opened by begin_frame() and roll the stage totals into the history
+        if self.frame_start is None:
+            return
+        self.frame_times.append((time.perf_counter() - self.frame_start) * 1000)
+        self.frame_start = None
+        if self.enabled:
+            for stage in self.stage_names:
+                self.stage_times[stage].append(self.current[stage] * 1000)
+                self.current[stage] = 0.0
+
+    def entity_counts(self) -> Dict[str, int]:
+        player = self.game.player
+        return {
+            "zombies": self.game.zombie_count(),
+            "bullets": len(player.bullets),
+            "grenades": len(player.grenades),
+            "explosions": len(player.explosions)
+        }
+
+    def report(self) -> Dict:
+        """
+        Summarises the frames in the history window.
+
+        Returns:
+            Dict: Mean and worst frame time, frame rate, mean milliseconds per stage and entity counts
+        """
+        frames = list(self.frame_times)
+        frame_ms = sum(frames) / len(frames) if frames else 0.0
+        stages = {stage: round(sum(times) / len(times), 4) if times else 0.0
+                  for stage, times in self.stage_times.items()}
+        if self.game.headless:
+            fps = 1000 / frame_ms if frame_ms else 0  # Ticks are not paced, so this is simulation throughput
+        else:
+            fps = self.game.clock.get_fps()
+        return {
+            "frame_ms": round(frame_ms, 4),
+            "worst_frame_ms": round(max(frames, default=0.0), 4),
+            "fps": round(fps),
+            "stages_ms": stages,
+            "entities": self.entity_counts()
+        }
+
+    def draw(self, screen) -> None:
+        report = self.report()
+        rows = [(f"{report['fps']} FPS", f"{report['frame_ms']:.2f} / {report['worst_frame_ms']:.2f} ms")]
+        rows += [(stage, f"{ms:.3f} ms") for stage, ms in report["stages_ms"].items()]
+        rows += [(name, str(count)) for name, count in report["entities"].items()]
+        graph_width, graph_height = self.GRAPH_SIZE
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((graph_width + 20, len(rows) * line_height + graph_height + 30), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for row, (label, value) in enumerate(rows):
+            y = 10 + row * line_height
+            panel.blit(self.font.render(label, True, WHITE), (10, y))
+            value_surface = self.font.render(value, True, WHITE)
+            panel.blit(value_surface, (panel.get_width() - 10 - value_surface.get_width(), y))
+
+        # Rolling frame-time graph, with the frame budget as a reference line
+        graph_top = 20 + len(rows) * line_height
+        budget = 1000 / FPS
+        scale = graph_height / (budget * 2)
+        budget_y = graph_top + graph_height - budget * scale
+        pygame.draw.line(panel, GOLD, (10, budget_y), (10 + graph_width, budget_y))
+        for index, ms in enumerate(self.frame_times):
+            bar_height = min(graph_height, ms * scale)
+            color = MILITARY_RED if ms > budget else CAMO_TAN
+            pygame.draw.line(panel, color, (10 + index * 2, graph_top + graph_height),
+                             (10 + index * 2, graph_top + graph_height - bar_height))
+        screen.blit(panel, (SCREEN_WIDTH - panel.get_width() - 10, 60))
+
+
+class InputLog:
+    """
+    Compact binary log of everything a player feeds the simulation.
+    Held keys are stored only when they change; each record is one varint of
+    (ticks since the previous record << 4 | opcode) plus a small payload, so a
+    long session takes a few kilobytes. Records are stamped with the number of
+    ticks completed when they happened, and a replay applies them just before
+    the next tick. The header carries everything setup_game() needs to build
+    the same game, including the wave table when it is not WAVE_TABLE.
+    """
+
+    HEADER = struct.Struct("<8sqIBB")  # Magic, seed, horde size (0 for none), waves, wave table entries that follow
+    WAVE = struct.Struct("<BIddI")  # Wave number, count, speed, health, max alive (0 for the default)
+    KEYS, FIRE, RELOAD, AIM_START, AIM_MOVE, AIM_RELEASE, NEXT_WAVE, RESET, END = range(9)
+    PAYLOADS = {
+        KEYS: struct.Struct("<B"),  # Bitmask over INPUT_LOG_KEYS
+        AIM_START: struct.Struct("<hh"),  # Mouse position
+        AIM_MOVE: struct.Struct("<hh"),
+        RESET: struct.Struct("<q")  # Seed of the new game
+    }
+
+    def __init__(self, seed: int, horde_size: int = 0, waves: int = 3,
+                 wave_table: Optional[Dict[int, Dict]] = None):
+        self.seed = seed
+        self.horde_size = horde_size
+        self.waves = waves
+        self.wave_table = wave_table  # None for WAVE_TABLE
+        self.data = bytearray()
+        self.last_tick = 0
+        self.key_mask = 0
+
+    def record(self, tick: int, opcode: int, *args) -> None:
+        value = (tick - self.last_tick) << 4 | opcode
+        while value >= 0x80:
+            self.data.append(value & 0x7F | 0x80)
+            value >>= 7
+        self.data.append(value)
+        if opcode in self.PAYLOADS:
+            self.data += self.PAYLOADS[opcode].pack(*args)
+        self.last_tick = 0 if opcode == self.RESET else tick
+
+    def record_keys(self, tick: int, keys) -> None:
+        mask = sum(1 << bit for bit, key in enumerate(INPUT_LOG_KEYS) if keys[key])
+        if mask != self.key_mask:
+            self.key_mask = mask
+            self.record(tick, self.KEYS, mask)
+
+    @staticmethod
+    def key_state(mask: int) -> KeyState:
+        return KeyState({key: True for bit, key in enumerate(INPUT_LOG_KEYS) if mask & 1 << bit})
+
+    def to_bytes(self) -> bytes:
+        # The wave table is only stored when it differs from WAVE_TABLE
+        table = {} if self.wave_table is None or self.wave_table == WAVE_TABLE else self.wave_table
+        parts = [self.HEADER.pack(INPUT_LOG_MAGIC, self.seed, self.horde_size, self.waves, len(table))]
+        for number, wave in table.items():
+            parts.append(self.WAVE.pack(number, wave["count"], wave["speed"], wave["health"], wave.get("max_alive", 0)))
+        parts.append(bytes(self.data))
+        return b"".join(parts)
+
+    def save(self, path: str) -> int:
+        data = self.to_bytes()
+        with open(path, "wb") as log_file:
+            log_file.write(data)
+        return len(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputLog':
+        magic, seed, horde_size, waves, table_size = cls.HEADER.unpack_from(data)
+        if magic != INPUT_LOG_MAGIC:
+            raise ValueError("Not a Zombie Strike input log")
+        offset = cls.HEADER.size
+        wave_table = None
+        if table_size:
+            wave_table = {}
+            for _ in range(table_size):
+                number, count, speed, health, max_alive = cls.WAVE.unpack_from(data, offset)
+                offset += cls.WAVE.size
+                wave_table[number] = {"count": count, "speed": speed, "health": health}
+                if max_alive:
+                    wave_table[number]["max_alive"] = max_alive
+        log = cls(seed, horde_size, waves, wave_table)
+        log.data = bytearray(data[offset:])
+        return log
+
+    @classmethod
+    def load(cls, path: str) -> 'InputLog':
+        with open(path, "rb") as log_file:
+            return cls.from_bytes(log_file.read())
+
+    def records(self):
+        """
+        Decodes the log.
+
+        Yields:
+            Tuple[int, int, tuple]: Tick, opcode and payload values, in recording order
+        """
+        data = self.data
+        offset = 0
+        tick = 0
+        while offset < len(data):
+            value = shift = 0
+            while True:
+                byte = data[offset]
+                offset += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            opcode = value & 0xF
+            tick += value >> 4
+            args = ()
+            if opcode in self.PAYLOADS:
+                payload = self.PAYLOADS[opcode]
+                args = payload.unpack_from(data, offset)
+                offset += payload.size
+            yield tick, opcode, args
+            if opcode == self.RESET:
+                tick = 0
+
+
+class GameSnapshot:
+    """
+    Versioned binary image of the simulation, taken between ticks.
+    Holds everything update() reads: clock, counters, wave table, RNG state,
+    the player and their animation, projectiles, explosions and zombies.
+    Drawing caches and sound are left out and rebuild on the next frame.
+    Restoring into any Game using the same zombie engine (list or horde)
+    carries on exactly where the snapshot was taken.
+    """
+
+    HEADER = struct.Struct("<8sHB")  # Magic, layout version, flags
+    HORDE_FLAG = 1
+    GAME = struct.Struct("<dQqqddBB??dIIIII")
+    RNG = struct.Struct("<625I?d")  # Mersenne Twister words and position, then the cached gauss() value
+    WAVE = struct.Struct("<BIddI")  # Wave number, count, speed, health, max alive (0 for the default)
+    PLAYER = struct.Struct("<iddd??iiiddd?dddd?hhhh")
+    ANIMATION = struct.Struct("<16sid??dd?id?idd")  # Animation name first
+    POOL = struct.Struct("<IIII")  # High water, launched, refused, projectiles in flight
+    PROJECTILE = struct.Struct("<6dhh?3d")
+    ZOMBIE = struct.Struct("<didddddi???idd?")
+    HORDE = struct.Struct("<III")  # Slots in use, alive, next id; the arrays follow
+    EXPLOSION = struct.Struct("<iidddiiiI")  # Ends with the number of hit zombies that follow
+    COUNT = struct.Struct("<I")
+
+    def __init__(self, data: bytes = b""):
+        self.data = data
+        self.offset = 0
+        self.parts = []
+
+    def write(self, layout: struct.Struct, *values) -> None:
+        self.parts.append(layout.pack(*values))
+
+    def read(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    @staticmethod
+    def horde_dtypes(horde: 'Horde'):
+        # Horde arrays are stored little-endian whatever the machine
+        return [(name, np.dtype(dtype).newbyteorder("<")) for name, dtype in horde.FIELDS.items()]
+
+    @classmethod
+    def capture(cls, game: 'Game') -> bytes:
+        """
+        Serialises a game between ticks.
+
+        Args:
+            game (Game): Game to capture; it is not modified
+
+        Returns:
+            bytes: Snapshot for restore()
+        """
+        snapshot = cls()
+        snapshot.write(cls.HEADER, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, cls.HORDE_FLAG if game.horde is not None else 0)
+        snapshot.write(cls.GAME, game.sim_clock.now, game.tick_count, game.run_seed,
+                       (game.game_time - GAME_TIME_EPOCH) // timedelta(microseconds=1),
+                       game.world_offset, game.prev_world_offset, game.current_wave, game.max_waves,
+                       game.wave_complete, game.mission_complete, game.wave_start_time, game.zombies_spawned,
+                       game.zombies_killed, game.wave_zombies_killed, game.bullets_fired, game.bullets_hit)
+        _, words, gauss_next = game.rng.getstate()
+        snapshot.write(cls.RNG, *words, gauss_next is not None, gauss_next or 0.0)
+        snapshot.write(cls.COUNT, len(game.wave_zombies))
+        for number, wave in game.wave_zombies.items():
+            snapshot.write(cls.WAVE, number, wave["count"], wave["speed"], wave["health"], wave.get("max_alive", 0))
+        snapshot.write_player(game.player)
+        snapshot.write_zombies(game)
+        snapshot.write_explosions(game)
+        return b"".join(snapshot.parts)
+
+    @classmethod
+    def restore(cls, game: 'Game', data: bytes) -> None:
+        """
+        Puts a game back in the state a snapshot was taken in.
+
+        Args:
+            game (Game): Game to overwrite, set up with the same zombie engine as the captured one
+            data (bytes): Snapshot from capture()
+
+        Raises:
+            ValueError: If data is not a snapshot, has another layout version or needs the other zombie engine
+        """
+        snapshot = cls(data)
+        magic, version, flags = snapshot.read(cls.HEADER)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a Zombie Strike snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot layout version {version} is not supported, expected {SNAPSHOT_VERSION}")
+        if bool(flags & cls.HORDE_FLAG) != (game.horde is not None):
+            raise ValueError("Snapshot was taken with the other zombie engine")
+        (game.sim_clock.now, game.tick_count, game.run_seed, game_time, game.world_offset, game.prev_world_offset,
+         game.current_wave, game.max_waves, game.wave_complete, game.mission_complete, game.wave_start_time,
+         game.zombies_spawned, game.zombies_killed, game.wave_zombies_killed, game.bullets_fired,
+         game.bullets_hit) = snapshot.read(cls.GAME)
+        game.game_time = GAME_TIME_EPOCH + timedelta(microseconds=game_time)
+        game.day_progress = (game.game_time.hour + game.game_time.minute / 60) / 24
+        rng_state = snapshot.read(cls.RNG)
+        game.rng.setstate((3, rng_state[:625], rng_state[626] if rng_state[625] else None))
+        game.wave_zombies = {}
+        for _ in range(snapshot.read(cls.COUNT)[0]):
+            number, count, speed, health, max_alive = snapshot.read(cls.WAVE)
+            game.wave_zombies[number] = {"count": count, "speed": speed, "health": health}
+            if max_alive:
+                game.wave_zombies[number]["max_alive"] = max_alive
+        snapshot.read_player(game.player)
+        snapshot.read_zombies(game)
+        snapshot.read_explosions(game)
+        game.player.invalidate_hud()
+        game.invalidate_wave_info()
+        game.countdown_value = None
+
+    def write_player(self, player: 'Player') -> None:
+        pending = player.pending_throw
+        (throw_vx, throw_vy), throw_time = pending if pending else ((0.0, 0.0), 0.0)
+        reload_time = player.reload_complete_time
+        self.write(self.PLAYER, player.rect.x, player.y, player.prev_y, player.velocity, player.jumping,
+                   player.direction == "left", player.current_health, player.current_bullets,
+                   player.current_grenades, player.last_shot_time, math.nan if reload_time is None else reload_time,
+                   player.last_damage_time, pending is not None, throw_vx, throw_vy, throw_time,
+                   player.delayed_throw_time, player.is_aiming_grenade,
+                   *player.grenade_aim_start_pos, *player.grenade_aim_current_pos)
+        animation = player.animation
+        self.write(self.ANIMATION, animation.current_animation.encode(), animation.frame, animation.timer,
+                   animation.direction == "left", animation.shooting, animation.shoot_timer,
+                   animation.shoot_frame_timer, animation.reloading, animation.reload_frame, animation.reload_timer,
+                   animation.throwing, animation.throw_frame, animation.throw_timer, animation.last_throw_time)
+        for pool in (player.bullets, player.grenades):
+            self.write(self.POOL, pool.high_water, pool.launched, pool.refused, len(pool))
+            for p in pool:
+                self.write(self.PROJECTILE, p.x, p.y, p.prev_x, p.prev_y, p.vx, p.vy, p.width, p.height,
+                           p.direction == "left", p.angle, p.rotation_speed, p.start_time)
+
+    def read_player(self, player: 'Player') -> None:
+        (x, y, player.prev_y, player.velocity, player.jumping, facing_left, player.current_health,
+         player.current_bullets, player.current_grenades, player.last_shot_time, reload_time,
+         player.last_damage_time, pending, throw_vx, throw_vy, throw_time, player.delayed_throw_time, aiming,
+         start_x, start_y, aim_x, aim_y) = self.read(self.PLAYER)
+        player.y = y
+        player.rect.topleft = (x, round(y))
+        player.direction = "left" if facing_left else "right"
+        player.reload_complete_time = None if math.isnan(reload_time) else reload_time
+        player.pending_throw = ((throw_vx, throw_vy), throw_time) if pending else None
+        player.is_aiming_grenade = False
+        player.grenade_trajectory_points = []
+        if aiming:
+            # Rebuilds the power and trajectory preview from the two mouse positions
+            player.start_grenade_aim((start_x, start_y))
+            if (aim_x, aim_y) != (start_x, start_y):
+                player.update_grenade_aim((aim_x, aim_y))
+        animation = player.animation
+        (name, animation.frame, animation.timer, facing_left, animation.shooting, animation.shoot_timer,
+         animation.shoot_frame_timer, animation.reloading, animation.reload_frame, animation.reload_timer,
+         animation.throwing, animation.throw_frame, animation.throw_timer,
+         animation.last_throw_time) = self.read(self.ANIMATION)
+        animation.current_animation = name.rstrip(b"\0").decode()
+        animation.direction = "left" if facing_left else "right"
+        for pool in (player.bullets, player.grenades):
+            pool.reset()
+            high_water, launched, refused, count = self.read(self.POOL)
+            for _ in range(count):
+                p = pool.acquire()
+                p.active = True
+                (p.x, p.y, p.prev_x, p.prev_y, p.vx, p.vy, p.width, p.height, facing_left, p.angle,
+                 p.rotation_speed, p.start_time) = self.read(self.PROJECTILE)
+                p.direction = "left" if facing_left else "right"
+            pool.high_water, pool.launched, pool.refused = high_water, launched, refused
+
+    def write_zombies(self, game: 'Game') -> None:
+        self.write(self.COUNT, len(game.zombies))
+        for z in game.zombies:
+            self.write(self.ZOMBIE, z.x, z.rect.y, z.prev_x, z.speed, z.health, z.max_health, z.frame_timer,
+                       z.frame, z.direction == "left", z.is_alive, z.is_attacking, z.attack_frame,
+                       z.attack_frame_timer, z.last_attack_time, z.has_dealt_damage)
+        horde = game.horde
+        if horde is not None:
+            self.write(self.HORDE, horde.count, horde.alive_count, horde.next_id)
+            for name, dtype in self.horde_dtypes(horde):
+                self.parts.append(getattr(horde, name)[:horde.count].astype(dtype, copy=False).tobytes())
+
+    def read_zombies(self, game: 'Game') -> None:
+        game.zombies = []
+        for _ in range(self.read(self.COUNT)[0]):
+            zombie = Zombie(0, 0, game.assets)
+            (zombie.x, zombie.rect.y, zombie.prev_x, zombie.speed, zombie.health, zombie.max_health,
+             zombie.frame_timer, zombie.frame, facing_left, zombie.is_alive, zombie.is_attacking,
+             zombie.attack_frame, zombie.attack_frame_timer, zombie.last_attack_time,
+             zombie.has_dealt_damage) = self.read(self.ZOMBIE)
+            zombie.rect.x = round(zombie.x)
+            zombie.direction = "left" if facing_left else "right"
+            game.zombies.append(zombie)
+        horde = game.horde
+        if horde is not None:
+            count, alive_count, next_id = self.read(self.HORDE)
+            horde.clear()
+            if count > horde.capacity:
+                horde._resize(count)
+            for name, dtype in self.horde_dtypes(horde):
+                getattr(horde, name)[:count] = np.frombuffer(self.data, dtype, count, self.offset)
+                self.offset += count * dtype.itemsize
+            horde.count, horde.alive_count, horde.next_id = count, alive_count, next_id
+
+    def write_explosions(self, game: 'Game') -> None:
+        # Listed zombies an explosion has hit are stored by their place in game.zombies, horde zombies by id
+        index = {zombie: position for position, zombie in enumerate(game.zombies)}
+        explosions = game.player.explosions
+        self.write(self.COUNT, len(explosions))
+        for explosion in explosions:
+            if game.horde is not None:
+                hit = sorted(explosion.hit)
+            else:
+                # Zombies already removed from the list are dead and cannot be hit again
+                hit = sorted(index[zombie] for zombie in explosion.hit if zombie in index)
+            self.write(self.EXPLOSION, *explosion.pos, *explosion.world_pos, explosion.start_time, explosion.radius,
+                       explosion.max_radius, explosion.damage, len(hit))
+            self.write(struct.Struct(f"<{len(hit)}q"), *hit)
+
+    def read_explosions(self, game: 'Game') -> None:
+        explosions = game.player.explosions
+        explosions.clear()
+        for _ in range(self.read(self.COUNT)[0]):
+            x, y, world_x, world_y, start_time, radius, max_radius, damage, hits = self.read(self.EXPLOSION)
+            explosion = Explosion((x, y), (world_x, world_y), start_time, max_radius, damage)
+            explosion.radius = radius
+            hit = self.read(struct.Struct(f"<{hits}q"))
+            explosion.hit = set(hit) if game.horde is not None else {game.zombies[position] for position in hit}
+            explosions.active.append(explosion)
+
+
 class Game:
-    def __init__(self):
+    def __init__(self, screen, clock, headless: bool = False, use_horde: bool = False, seed: Optional[int] = None,
+                 sim_clock: Optional[SimulationClock] = None, wave_table: Optional[Dict[int, Dict]] = None):
         self.screen = screen
-        self.clock = clock
-        self.assets = GameAssets()
-        self.sound_manager = SoundManager()
-        self.sound_manager.play_music('wave')
+        self.clock = clock  # Paces rendering only; game logic reads sim_clock
+        self.headless = headless  # Simulation only: no music and nothing is drawn
+        self.seed = seed  # Same seed and inputs replay the same game; None picks a fresh one per game
+        self.rng = random.Random()
+        self.recorder = None  # InputLog receiving this game's inputs, if recording
+        self.sim_clock = sim_clock or SimulationClock()
+        self.wave_table = wave_table or WAVE_TABLE  # Copied into wave_zombies by every reset()
+        self.assets = asset_registry.get("game_assets", GameAssets)
+        self.horde = Horde(self.assets) if use_horde else None  # NumPy engine replacing self.zombies
+        self.sound_manager = asset_registry.get("sound_manager", SoundManager)
         player_height = self.assets.actions["Idle"][0].get_height()
         self.player = Player(SCREEN_WIDTH // 2,
                            SCREEN_HEIGHT - GROUND_HEIGHT - player_height - 48,
@@ -1309,26 +3099,58 @@ class Game:
                            player_height,
                            self.assets,
                            self.sound_manager)
+        self.collisions = CollisionSystem()
+        self.max_waves = len(self.wave_table)
+        self.wave_delay = 5000
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
+        self.screen_width = SCREEN_WIDTH
+        self.screen_height = SCREEN_HEIGHT
+        self.bullet_hitbox = None  # Translucent bullet hitbox overlay, built on first draw
+        self.time_chrome = self._make_panel(100, 40, (255, 255, 255, 100))
+        # The clock label changes every tick, so it is composed from glyphs rendered once
+        self.time_glyphs = {text: self.assets.font.render(text, True, WHITE)
+                            for text in ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", ":", " AM", " PM")}
+        self.profiler = FrameProfiler(self)  # Toggled with PROFILER_TOGGLE_KEY
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Starts a new game from wave 1.
+        Only gameplay state is rebuilt; assets, sounds, fonts, pools and the
+        horde arrays are kept, so a retry costs next to nothing.
+
+        Args:
+            seed (Optional[int]): Seed for this game, overriding the one the Game was created with
+        """
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        if self.recorder is not None:
+            self.recorder.record(self.tick_count, InputLog.RESET, seed)
+        self.run_seed = seed  # Seed actually in use, recorded so even unseeded games can be replayed
+        if not self.headless:
+            self.sound_manager.play_music('wave')
+        self.rng.seed(seed)
+        self.sim_clock.reset()
+        self.tick_count = 0
+        self.player.reset()
+        if self.horde is not None:
+            self.horde.clear()
         self.running = True
         self.game_time = datetime(2024, 1, 1, 6, 0)
         self.world_offset = 0
+        self.prev_world_offset = 0
+        self.render_offset = 0
         self.day_progress = 0
-        self.current_time = 0
         self.zombies = []
         self.zombies_killed = 0
         self.wave_zombies_killed = 0
         self.current_wave = 1
-        self.max_waves = 3
         self.wave_complete = False
         self.wave_start_time = 0
-        self.wave_delay = 5000
-        self.wave_zombies = {
-            1: {"count": 5, "speed": 3, "health": 100},
-            2: {"count": 8, "speed": 3.5, "health": 150},
-            3: {"count": 12, "speed": 4, "health": 200}
-        }
+        self.wave_zombies = {number: dict(wave) for number, wave in self.wave_table.items()}
         self.zombies_spawned = 0
-        self.start_time = datetime.now()
+        self.mission_complete = False
         self.bullets_fired = 0
         self.bullets_hit = 0
         self.paused = False
@@ -1336,22 +3158,174 @@ class Game:
         self.exit_button_rect = None
         self.next_wave_button_rect = None
         self.next_wave_button_hovered = False
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
-        self.screen_width = SCREEN_WIDTH
-        self.screen_height = SCREEN_HEIGHT
+        self.wave_info_surface = None
+        self.wave_info_dirty = True
+        self.countdown_surface = None
+        self.countdown_value = None
         self.start_wave()
 
+    @property
+    def current_time(self) -> float:
+        # Simulation time in milliseconds, advanced by update()
+        return self.sim_clock.now
+
+    def time_survived(self) -> str:
+        return str(self.sim_clock.elapsed()).split('.')[0]
+
+    def state_digest(self) -> str:
+        """
+        Fingerprints the simulation state, to check that two runs stayed identical.
+
+        Returns:
+            str: SHA-1 of the clock, player, counters, zombies and projectiles
+        """
+        player = self.player
+        state = [self.current_time, self.world_offset, self.current_wave, self.zombies_spawned, self.zombies_killed,
+                 self.bullets_fired, self.bullets_hit, *player.rect, player.y, player.velocity, player.current_health,
+                 player.current_bullets, player.current_grenades]
+        for zombie in self.zombies:
+            state += (zombie.x, zombie.rect.y, zombie.health, zombie.is_alive)
+        for pool in (player.bullets, player.grenades):
+            for p in pool:
+                state += (p.x, p.y, p.vx, p.vy)
+        for explosion in player.explosions:
+            state += (*explosion.world_pos, explosion.radius)
+        # Hashed as doubles, so a value restored from a snapshot as 3.0 matches the 3 it was saved from
+        digest = hashlib.sha1(struct.pack(f"<{len(state)}d", *state))
+        if self.horde is not None:
+            for name in ("id", "x", "y", "health", "alive"):
+                digest.update(getattr(self.horde, name)[:self.horde.count].tobytes())
+        return digest.hexdigest()
+
+    def snapshot(self) -> bytes:
+        """Captures the simulation as it stands between ticks; see GameSnapshot."""
+        return GameSnapshot.capture(self)
+
+    def restore(self, data: bytes) -> None:
+        """Rewinds or fast-forwards to a snapshot() of this or another Game with the same zombie engine."""
+        GameSnapshot.restore(self, data)
+
+    def _make_panel(self, width: int, height: int, border_color) -> pygame.Surface:
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 150))
+        pygame.draw.rect(panel, border_color, (0, 0, width, height), 2)
+        return panel
+
+    def invalidate_wave_info(self) -> None:
+        # Wave number or kill count changed; rebuild the wave panel on next draw
+        self.wave_info_dirty = True
+
     def start_wave(self):
-        self.wave_start_time = pygame.time.get_ticks()
+        self.wave_start_time = self.current_time
         self.zombies_spawned = 0
         self.wave_zombies_killed = 0
         self.wave_complete = False
+        self.invalidate_wave_info()
         self.spawn_zombie()
 
+    # Everything a player can do to the simulation goes through these methods, so it can be recorded.
+    # Shots and reloads that are refused change nothing, so only the ones that happen are logged.
+
+    def next_wave(self) -> None:
+        if self.current_wave < self.max_waves:
+            if self.recorder is not None:
+                self.recorder.record(self.tick_count, InputLog.NEXT_WAVE)
+            self.current_wave += 1
+            self.start_wave()
+
+    def fire(self) -> None:
+        if self.player.shoot(self.current_time, self.world_offset):
+            self.bullets_fired += 1
+            if self.recorder is not None:
+                self.recorder.record(self.tick_count, InputLog.FIRE)
+
+    def reload(self) -> None:
+        if self.player.start_reload(self.current_time) and self.recorder is not None:
+            self.recorder.record(self.tick_count, InputLog.RELOAD)
+
+    def start_grenade_aim(self, pos: Tuple[int, int]) -> None:
+        if self.recorder is not None:
+            self.recorder.record(self.tick_count, InputLog.AIM_START, *pos)
+        self.player.start_grenade_aim(pos)
+
+    def update_grenade_aim(self, pos: Tuple[int, int]) -> None:
+        if self.recorder is not None:
+            self.recorder.record(self.tick_count, InputLog.AIM_MOVE, *pos)
+        self.player.update_grenade_aim(pos)
+
+    def release_grenade_aim(self) -> None:
+        if self.recorder is not None:
+            self.recorder.record(self.tick_count, InputLog.AIM_RELEASE)
+        self.player.release_grenade_aim(self.current_time)
+
+    def record_inputs(self, horde_size: int = 0) -> InputLog:
+        """
+        Starts recording this game's inputs.
+
+        Args:
+            horde_size (int): Zombies per wave if the game was set up for the horde engine, stored for replay
+
+        Returns:
+            InputLog: The log being written to; finish it with end_recording()
+        """
+        self.recorder = InputLog(self.run_seed, horde_size, self.max_waves, self.wave_table)
+        return self.recorder
+
+    def end_recording(self) -> InputLog:
+        recorder, self.recorder = self.recorder, None
+        recorder.record(self.tick_count, InputLog.END)
+        return recorder
+
+    def apply_input(self, opcode: int, args: tuple) -> None:
+        # Re-apply one recorded input; held keys are handled by the replay loop
+        if opcode == InputLog.FIRE:
+            self.fire()
+        elif opcode == InputLog.RELOAD:
+            self.reload()
+        elif opcode == InputLog.AIM_START:
+            self.start_grenade_aim(args)
+        elif opcode == InputLog.AIM_MOVE:
+            self.update_grenade_aim(args)
+        elif opcode == InputLog.AIM_RELEASE:
+            self.release_grenade_aim()
+        elif opcode == InputLog.NEXT_WAVE:
+            self.next_wave()
+        elif opcode == InputLog.RESET:
+            self.reset(args[0])
+
+    def zombie_count(self) -> int:
+        return len(self.horde) if self.horde is not None else len(self.zombies)
+
+    def nearest_zombie_offset(self) -> Optional[float]:
+        # Signed x distance from the player to the closest living zombie
+        player_x = SCREEN_WIDTH // 2 + self.world_offset
+        if self.horde is not None:
+            return self.horde.nearest_offset(player_x)
+        distances = [zombie.x - player_x for zombie in self.zombies if zombie.is_alive]
+        return min(distances, key=abs, default=None)
+
+    def zombies_between(self, near: float, far: float) -> int:
+        # Living zombies whose signed x distance from the player lies in [near, far)
+        player_x = SCREEN_WIDTH // 2 + self.world_offset
+        if self.horde is not None:
+            return self.horde.count_between(player_x + near, player_x + far)
+        return sum(1 for zombie in self.zombies if zombie.is_alive and near <= zombie.x - player_x < far)
+
+    def spawn_horde(self, count: int) -> None:
+        wave = self.wave_zombies[self.current_wave]
+        count = min(count, wave["count"] - self.zombies_spawned)
+        if count > 0:
+            spread = 300 + HORDE_SPAWN_SPREAD * (count > 1)
+            spawn_xs = [self.world_offset + SCREEN_WIDTH + self.rng.randint(100, spread) for _ in range(count)]
+            spawn_y = SCREEN_HEIGHT - GROUND_HEIGHT - self.assets.zombie_frames[0].get_height() - 48
+            self.horde.spawn(spawn_xs, spawn_y, wave["speed"], wave["health"])
+            self.zombies_spawned += count
+
     def spawn_zombie(self) -> None:
-        if self.zombies_spawned < self.wave_zombies[self.current_wave]["count"]:
-            spawn_x = self.world_offset + SCREEN_WIDTH + random.randint(100, 300)
+        if self.horde is not None:
+            self.spawn_horde(1)
+        elif self.zombies_spawned < self.wave_zombies[self.current_wave]["count"]:
+            spawn_x = self.world_offset + SCREEN_WIDTH + self.rng.randint(100, 300)
             spawn_y = SCREEN_HEIGHT - GROUND_HEIGHT - self.assets.zombie_frames[0].get_height() - 48
             zombie = Zombie(spawn_x, spawn_y, self.assets)
             zombie.speed = self.wave_zombies[self.current_wave]["speed"]
@@ -1382,103 +3356,119 @@ class Game:
             self.draw_text("MISSION ACCOMPLISHED!", self.screen_width // 2, self.screen_height // 3, HIGHLIGHT, self.title_font)
             stats_y = self.screen_height // 2
             self.draw_text(f"Total Zombies Eliminated: {self.zombies_killed}", self.screen_width // 2, stats_y, WHITE)
-            self.draw_text(f"Time Survived: {str(datetime.now() - self.start_time).split('.')[0]}",
+            self.draw_text(f"Time Survived: {self.time_survived()}",
                          self.screen_width // 2, stats_y + 40, WHITE)
             self.draw_text(f"Accuracy: {int((self.bullets_hit / max(1, self.bullets_fired)) * 100)}%",
                          self.screen_width // 2, stats_y + 80, WHITE)
 
     def update_wave(self) -> None:
-        current_time = pygame.time.get_ticks()
-        if len(self.zombies) == 0 and self.zombies_spawned >= self.wave_zombies[self.current_wave]["count"]:
+        wave = self.wave_zombies[self.current_wave]
+        alive = self.zombie_count()
+        if alive == 0 and self.zombies_spawned >= wave["count"]:
             if not self.wave_complete:
                 self.wave_complete = True
-                self.wave_start_time = current_time
-        if (len(self.zombies) < 3 and
-            self.zombies_spawned < self.wave_zombies[self.current_wave]["count"] and
+                self.wave_start_time = self.current_time
+        max_alive = wave.get("max_alive", ZOMBIE_MAX_ALIVE)
+        if (alive < max_alive and
+            self.zombies_spawned < wave["count"] and
             not self.wave_complete):
-            self.spawn_zombie()
+            if self.horde is not None:
+                self.spawn_horde(max_alive - alive)
+            else:
+                self.spawn_zombie()
+
+    def record_kills(self, kills: int) -> None:
+        self.zombies_killed += kills
+        self.wave_zombies_killed += kills
+        self.invalidate_wave_info()
+        if (self.current_wave == self.max_waves and
+            self.wave_zombies_killed >= self.wave_zombies[self.max_waves]["count"]):
+            self.mission_complete = True
+
+    def release_bullets(self, indices: List[int]) -> None:
+        bullets = self.player.bullets
+        for index in indices:
+            bullets.release(bullets[index])
+        bullets.sweep()
+
+    def update_horde(self) -> None:
+        self.horde.update(SCREEN_WIDTH // 2 + self.world_offset, self.player, self.current_time)
+        spent, kills = self.horde.resolve_hits(self.player.bullets, self.player.explosions, self.world_offset)
+        if spent:
+            self.bullets_hit += len(spent)
+            self.release_bullets(spent)
+        if kills:
+            self.record_kills(kills)
 
     def update_zombies(self) -> None:
+        if self.horde is not None:
+            self.update_horde()
+            return
+        player_x = SCREEN_WIDTH // 2 + self.world_offset
+        for zombie in self.zombies:
+            zombie.update(player_x, self.player, self.current_time)
+        bullet_hits = self.collisions.resolve(self.zombies, self.player.bullets, self.world_offset)
+        explosion_hits = self.player.explosions.resolve(self.collisions, self.zombies)
+        if bullet_hits:
+            for zombie, bullet_index in bullet_hits:
+                zombie.take_damage(BULLET_DAMAGE)
+            self.bullets_hit += len(bullet_hits)
+            self.release_bullets([bullet_index for zombie, bullet_index in bullet_hits])
+        for zombie, damage in explosion_hits:
+            zombie.take_damage(damage)
         for zombie in self.zombies[:]:
-            zombie.update(SCREEN_WIDTH // 2 + self.world_offset, self.player)
-            for bullet in self.player.bullets[:]:
-                bullet_world_rect = pygame.Rect(
-                    bullet['rect'].x + self.world_offset,
-                    bullet['rect'].y,
-                    bullet['rect'].width,
-                    bullet['rect'].height
-                )
-                if zombie.is_alive and bullet_world_rect.colliderect(zombie.rect):
-                    zombie.take_damage(35)
-                    self.player.bullets.remove(bullet)
-                    self.bullets_hit += 1
-                    break
-            for explosion in self.player.explosions:
-                # Create a larger hitbox for the explosion while keeping visual size the same
-                explosion_rect = pygame.Rect(
-                    explosion['pos'][0] - explosion['radius'] - 200,  # Increased from 50 to 200
-                    explosion['pos'][1] - explosion['radius'] - 200,  # Increased from 50 to 200
-                    explosion['radius'] * 2 + 400,  # Increased from 100 to 400
-                    explosion['radius'] * 2 + 400   # Increased from 100 to 400
-                )
-                if zombie.is_alive and explosion_rect.colliderect(zombie.rect):
-                    zombie.take_damage(150)
             if not zombie.is_alive:
                 self.zombies.remove(zombie)
-                self.zombies_killed += 1
-                self.wave_zombies_killed += 1
-                if (self.current_wave == self.max_waves and
-                    self.wave_zombies_killed >= self.wave_zombies[self.max_waves]["count"]):
-                    stats = {
-                        "zombies_killed": self.zombies_killed,
-                        "time_survived": str(datetime.now() - self.start_time).split('.')[0],
-                        "distance_traveled": int(self.world_offset / 100),
-                        "accuracy": int((self.bullets_hit / max(1, self.bullets_fired)) * 100)
-                    }
-                    outro = OutroCutscene(screen, clock, stats, self.assets)
-                    outro_complete = False
-                    while not outro_complete:
-                        self.draw_background()
-                        self.draw_time()
-                        self.draw_zombies()
-                        self.draw_projectiles()
-                        self.player.draw_bullet_counter(screen)
-                        self.player.draw_health_bar(screen)
-                        self.draw_wave_info()
-                        action = outro.handle_events()
-                        if action != "outro":
-                            if action == "retry":
-                                self.__init__()
-                                return
-                            elif action == "menu":
-                                return "menu"
-                            elif action == "quit":
-                                pygame.quit()
-                                sys.exit()
-                            break
-                        result = outro.update()
-                        outro.draw()
-                        if result == "complete":
-                            outro_complete = True
-                        pygame.display.flip()
-                        self.clock.tick(60)
-                    # Show GameOverScreen after outro
-                    game_over_screen = GameOverScreen(screen, clock, True)
-                    game_over_screen.stats = stats
-                    action = game_over_screen.run()
-                    if action == "retry":
-                        self.__init__()
-                        return
-                    elif action == "menu":
-                        return "menu"
-                    elif action == "quit":
-                        pygame.quit()
-                        sys.exit()
+                self.record_kills(1)
+
+    def mission_stats(self) -> Dict:
+        return {
+            "zombies_killed": self.zombies_killed,
+            "time_survived": self.time_survived(),
+            "distance_traveled": int(self.world_offset / 100),
+            "accuracy": int((self.bullets_hit / max(1, self.bullets_fired)) * 100)
+        }
 
-    def draw_wave_info(self) -> None:
-        info_bg = pygame.Surface((300, 60), pygame.SRCALPHA)
-        info_bg.fill((0, 0, 0, 150))
-        pygame.draw.rect(info_bg, (255, 255, 255, 100), (0, 0, 300, 60), 2)
+    def play_outro(self) -> Optional[str]:
+        # Run the extraction cutscene over the final game frame, then the win screen
+        stats = self.mission_stats()
+        outro = OutroCutscene(self.screen, self.clock, stats, self.assets)
+        outro_complete = False
+        while not outro_complete:
+            self.draw_background()
+            self.draw_time()
+            self.draw_zombies()
+            self.draw_projectiles()
+            self.player.draw_bullet_counter(self.screen)
+            self.player.draw_health_bar(self.screen)
+            self.draw_wave_info()
+            action = outro.handle_events()
+            if action != "outro":
+                if action == "quit":
+                    pygame.quit()
+                    sys.exit()
+                break
+            result = outro.update()
+            outro.draw()
+            if result == "complete":
+                outro_complete = True
+            pygame.display.flip()
+            self.clock.tick(FPS)
+        # Show GameOverScreen after outro
+        game_over_screen = GameOverScreen(self.screen, self.clock, True)
+        game_over_screen.stats = stats
+        action = game_over_screen.run()
+        if action == "retry":
+            self.reset()
+        elif action == "menu":
+            return "menu"
+        elif action == "quit":
+            pygame.quit()
+            sys.exit()
+        return None
+
+    def _render_wave_info(self) -> pygame.Surface:
+        info = self._make_panel(300, 60, (255, 255, 255, 100))
         wave_text = f"Wave {self.current_wave}/{self.max_waves}"
         zombies_remaining = self.wave_zombies[self.current_wave]["count"] - self.wave_zombies_killed
         wave_surface = self.font.render(wave_text, True, WHITE)
@@ -1487,22 +3477,27 @@ class Game:
         zombies_x = (300 - zombies_surface.get_width()) // 2
         total_text_height = wave_surface.get_height() + zombies_surface.get_height() + 5
         start_y = (60 - total_text_height) // 2
+        info.blit(wave_surface, (wave_x, start_y))
+        info.blit(zombies_surface, (zombies_x, start_y + wave_surface.get_height() + 5))
+        return info
+
+    def draw_wave_info(self) -> None:
+        if self.wave_info_dirty:
+            self.wave_info_surface = self._render_wave_info()
+            self.wave_info_dirty = False
         bg_x = (self.screen_width - 300) // 2
         bg_y = 20
-        screen.blit(info_bg, (bg_x, bg_y))
-        screen.blit(wave_surface, (bg_x + wave_x, bg_y + start_y))
-        screen.blit(zombies_surface, (bg_x + zombies_x, bg_y + start_y + wave_surface.get_height() + 5))
+        self.screen.blit(self.wave_info_surface, (bg_x, bg_y))
         if self.wave_complete and self.current_wave < self.max_waves:
-            countdown = max(0, (self.wave_delay - (pygame.time.get_ticks() - self.wave_start_time)) // 1000)
-            next_wave_text = f"Next Wave in {countdown}s"
-            next_wave_surface = self.font.render(next_wave_text, True, HIGHLIGHT)
-            countdown_bg = pygame.Surface((250, 40), pygame.SRCALPHA)
-            countdown_bg.fill((0, 0, 0, 150))
-            pygame.draw.rect(countdown_bg, (255, 255, 0, 100), (0, 0, 250, 40), 2)
-            countdown_x = (250 - next_wave_surface.get_width()) // 2
-            countdown_y = (40 - next_wave_surface.get_height()) // 2
-            screen.blit(countdown_bg, (self.screen_width // 2 - 125, bg_y + 70))
-            screen.blit(next_wave_surface, (self.screen_width // 2 - 125 + countdown_x, bg_y + 70 + countdown_y))
+            countdown = max(0, int(self.wave_delay - (self.current_time - self.wave_start_time)) // 1000)
+            if countdown != self.countdown_value:
+                self.countdown_surface = self._make_panel(250, 40, (255, 255, 0, 100))
+                next_wave_surface = self.font.render(f"Next Wave in {countdown}s", True, HIGHLIGHT)
+                countdown_x = (250 - next_wave_surface.get_width()) // 2
+                countdown_y = (40 - next_wave_surface.get_height()) // 2
+                self.countdown_surface.blit(next_wave_surface, (countdown_x, countdown_y))
+                self.countdown_value = countdown
+            self.screen.blit(self.countdown_surface, (self.screen_width // 2 - 125, bg_y + 70))
 
     def draw_overlay(self, alpha=100):
         overlay = pygame.Surface((self.screen_width, self.screen_height))
@@ -1523,31 +3518,17 @@ class Game:
 
     def draw_button(self, x, y, width, height, text, hovered):
         button_color = HIGHLIGHT if hovered else TEXT_COLOR
-        pygame.draw.rect(screen, button_color, (x, y, width, height), 2)
+        pygame.draw.rect(self.screen, button_color, (x, y, width, height), 2)
         self.draw_text(text, x + width // 2, y + height // 2, button_color)
         return pygame.Rect(x, y, width, height)
 
     def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center)
 
     def handle_input(self, keys: pygame.key.ScancodeWrapper) -> None:
         speed = PLAYER_RUN_SPEED if keys[pygame.K_LSHIFT] else PLAYER_SPEED
         moving = False
+        speed *= TICK_SCALE
         if keys[pygame.K_d]:
             self.world_offset += speed
             self.player.direction = "right"
@@ -1562,23 +3543,13 @@ class Game:
             self.player.animation.set_animation("Run" if keys[pygame.K_LSHIFT] else "Walk" if moving else "Idle")
 
     def update_time(self) -> None:
-        self.game_time += timedelta(hours=HOURS_PER_SECOND)
+        self.game_time += timedelta(hours=HOURS_PER_SECOND * TICK_SCALE)
         if self.game_time.hour >= 24:
             self.game_time = self.game_time.replace(hour=0)
         self.day_progress = (self.game_time.hour + self.game_time.minute / 60) / 24
 
     def draw_background(self) -> None:
-        day_alpha = self._calculate_day_alpha()
-        num_backgrounds = 3
-        start_x = -(self.world_offset % SCREEN_WIDTH)
-        for i in range(num_backgrounds):
-            x_pos = start_x + (i * SCREEN_WIDTH)
-            day_surface = self.assets.day_bg.copy()
-            day_surface.set_alpha(int(255 * day_alpha))
-            screen.blit(day_surface, (x_pos, 0))
-            night_surface = self.assets.night_bg.copy()
-            night_surface.set_alpha(int(255 * (1 - day_alpha)))
-            screen.blit(night_surface, (x_pos, -10))
+        self.assets.background.draw(self.screen, self.render_offset, self._calculate_day_alpha())
 
     def _calculate_day_alpha(self) -> float:
         if 18 <= self.game_time.hour < 19:
@@ -1590,60 +3561,86 @@ class Game:
         return 1.0
 
     def draw_time(self) -> None:
-        time_bg = pygame.Surface((100, 40), pygame.SRCALPHA)
-        time_bg.fill((0, 0, 0, 150))
-        pygame.draw.rect(time_bg, (255, 255, 255, 100), (0, 0, 100, 40), 2)
-        time_str = self.game_time.strftime("%I:%M %p")
-        time_surface = self.assets.font.render(time_str, True, WHITE)
-        text_x = (100 - time_surface.get_width()) // 2
-        text_y = (40 - time_surface.get_height()) // 2
-        screen.blit(time_bg, (10, 10))
-        screen.blit(time_surface, (10 + text_x, 10 + text_y))
-
-    def draw_projectiles(self) -> None:
+        time_str = self.game_time.strftime("%I:%M")
+        glyphs = [self.time_glyphs[char] for char in time_str]
+        glyphs.append(self.time_glyphs[" PM" if self.game_time.hour >= 12 else " AM"])
+        self.screen.blit(self.time_chrome, (10, 10))
+        x = 10 + (100 - sum(glyph.get_width() for glyph in glyphs)) // 2
+        y = 10 + (40 - glyphs[0].get_height()) // 2
+        for glyph in glyphs:
+            self.screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def draw_projectiles(self, alpha: float = 1.0) -> None:
         for bullet in self.player.bullets:
-            screen.blit(self.assets.bullet, bullet['rect'])
-            pygame.draw.rect(screen, MILITARY_RED, bullet['rect'], 3)
-            hitbox_surface = pygame.Surface((bullet['rect'].width, bullet['rect'].height), pygame.SRCALPHA)
-            hitbox_surface.fill((*MILITARY_RED, 50))
-            screen.blit(hitbox_surface, bullet['rect'])
+            draw_rect = pygame.Rect(int(lerp(bullet.prev_x, bullet.x, alpha)), int(lerp(bullet.prev_y, bullet.y, alpha)),
+                                    bullet.width, bullet.height)
+            self.screen.blit(self.assets.bullet, draw_rect)
+            pygame.draw.rect(self.screen, MILITARY_RED, draw_rect, 3)
+            if self.bullet_hitbox is None or self.bullet_hitbox.get_size() != draw_rect.size:
+                self.bullet_hitbox = pygame.Surface(draw_rect.size, pygame.SRCALPHA)
+                self.bullet_hitbox.fill((*MILITARY_RED, 50))
+            self.screen.blit(self.bullet_hitbox, draw_rect)
         for grenade in self.player.grenades:
-            grenade_img = pygame.image.load("Assets/Grenade.png")
-            grenade_img = pygame.transform.scale(grenade_img,
-                (int(grenade_img.get_width() * BULLET_SCALE * 4),
-                 int(grenade_img.get_height() * BULLET_SCALE * 4)))
-            rotated_grenade = pygame.transform.rotate(grenade_img, -grenade['angle'])
-            grenade_rect = rotated_grenade.get_rect(center=grenade['rect'].center)
-            screen.blit(rotated_grenade, grenade_rect)
+            rotated_grenade = self.assets.grenade_frame(grenade.angle)
+            center = (int(lerp(grenade.prev_x, grenade.x, alpha)) + grenade.width // 2,
+                      int(lerp(grenade.prev_y, grenade.y, alpha)) + grenade.height // 2)
+            grenade_rect = rotated_grenade.get_rect(center=center)
+            self.screen.blit(rotated_grenade, grenade_rect)
         for explosion in self.player.explosions:
-            pygame.draw.circle(screen, EXPLOSION_COLOR, explosion['pos'], explosion['radius'])
-            inner_surface = pygame.Surface((explosion['radius'] * 2, explosion['radius'] * 2), pygame.SRCALPHA)
+            pygame.draw.circle(self.screen, EXPLOSION_COLOR, explosion.pos, explosion.radius)
+            inner_surface = pygame.Surface((explosion.radius * 2, explosion.radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(inner_surface, (*EXPLOSION_COLOR, 128),
-                             (explosion['radius'], explosion['radius']),
-                             explosion['radius'] * 0.7)
-            screen.blit(inner_surface,
-                       (explosion['pos'][0] - explosion['radius'],
-                        explosion['pos'][1] - explosion['radius']))
-            pygame.draw.circle(screen, (255, 255, 255, 50), explosion['pos'], explosion['radius'], 1)
-
-    def draw_zombies(self) -> None:
+                             (explosion.radius, explosion.radius),
+                             explosion.radius * 0.7)
+            self.screen.blit(inner_surface,
+                       (explosion.pos[0] - explosion.radius,
+                        explosion.pos[1] - explosion.radius))
+            pygame.draw.circle(self.screen, (255, 255, 255, 50), explosion.pos, explosion.radius, 1)
+
+    def draw_zombies(self, alpha: float = 1.0) -> None:
+        if self.horde is not None:
+            self.horde.draw(self.screen, self.render_offset, alpha)
         for zombie in self.zombies:
-            zombie.draw(screen, self.world_offset)
+            zombie.draw(self.screen, self.render_offset, alpha)
+
+    def update(self, keys: pygame.key.ScancodeWrapper) -> None:
+        """
+        Advances the simulation by one fixed tick of SIMULATION_DT milliseconds.
+
+        Args:
+            keys: Keyboard state to apply for this tick
+        """
+        if self.recorder is not None:
+            self.recorder.record_keys(self.tick_count, keys)
+        self.sim_clock.advance()
+        self.tick_count += 1
+        self.prev_world_offset = self.world_offset
+        self.handle_input(keys)
+        self.player.handle_jumping(keys)
+        self.update_time()
+        self.update_wave()
+        self.player.update_projectiles(self.current_time, self.world_offset)
+        self.player.animation.update(self.current_time, keys)
+        self.update_zombies()
 
-    def draw_game(self) -> None:
-        self.current_time = pygame.time.get_ticks()
+    def draw_game(self, alpha: float = 1.0) -> None:
+        """
+        Renders the current game state without advancing it.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the last update, for interpolation
+        """
+        self.render_offset = round(lerp(self.prev_world_offset, self.world_offset, alpha))
         self.draw_background()
         self.draw_time()
-        self.player.update_projectiles()
-        self.player.animation.update(self.current_time, pygame.key.get_pressed())
-        self.update_zombies()
-        self.draw_zombies()
-        self.draw_projectiles()
-        self.player.draw_bullet_counter(screen)
-        self.player.draw_health_bar(screen)
+        self.draw_zombies(alpha)
+        self.draw_projectiles(alpha)
+        self.player.draw_bullet_counter(self.screen)
+        self.player.draw_health_bar(self.screen)
         if self.player.is_aiming_grenade:
-            self.player.draw_grenade_aim(screen)
-        self.player.animation.draw(screen, SCREEN_WIDTH // 2, self.player.rect.y)
+            self.player.draw_grenade_aim(self.screen)
+        self.player.animation.draw(self.screen, SCREEN_WIDTH // 2, round(lerp(self.player.prev_y, self.player.y, alpha)))
         self.draw_wave_info()
 
     def handle_events(self) -> None:
@@ -1653,90 +3650,103 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.paused = not self.paused
+                elif event.key == PROFILER_TOGGLE_KEY:
+                    self.profiler.toggle()
+                elif event.key == TRACE_FLUSH_KEY:
+                    tracer.flush(background=True)
                 elif event.key == pygame.K_r and not self.paused:
-                    self.player.start_reload()
+                    self.reload()
                 elif event.key == pygame.K_SPACE and not self.paused:
-                    self.player.shoot(pygame.time.get_ticks(), self.world_offset)
-                    self.bullets_fired += 1
+                    self.fire()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     if self.paused and self.exit_button_rect and self.exit_button_rect.collidepoint(event.pos):
                         return "menu"
                     elif self.wave_complete and self.next_wave_button_rect and self.next_wave_button_rect.collidepoint(event.pos):
                         if self.current_wave < self.max_waves:
-                            self.current_wave += 1
-                            self.start_wave()
+                            self.next_wave()
                         else:
                             # Show game over screen
-                            game_over_screen = GameOverScreen(screen, clock, True)
-                            accuracy = int((self.bullets_hit / max(1, self.bullets_fired)) * 100)
-                            game_over_screen.stats = {
-                                "zombies_killed": self.zombies_killed,
-                                "time_survived": str(datetime.now() - self.start_time).split('.')[0],
-                                "distance_traveled": int(self.world_offset / 100),
-                                "accuracy": accuracy
-                            }
+                            game_over_screen = GameOverScreen(self.screen, self.clock, True)
+                            game_over_screen.stats = self.mission_stats()
                             action = game_over_screen.run()
                             if action == "retry":
-                                self.__init__()
+                                self.reset()
                             elif action == "menu":
                                 return
                             elif action == "quit":
                                 pygame.quit()
                                 sys.exit()
                     elif not self.paused:
-                        self.player.start_grenade_aim(event.pos)
+                        self.start_grenade_aim(event.pos)
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1 and not self.paused:
-                self.player.release_grenade_aim()
+                self.release_grenade_aim()
             elif event.type == pygame.MOUSEMOTION:
                 if self.paused and self.exit_button_rect:
                     self.exit_button_hovered = self.exit_button_rect.collidepoint(event.pos)
                 elif self.wave_complete and self.next_wave_button_rect:
                     self.next_wave_button_hovered = self.next_wave_button_rect.collidepoint(event.pos)
                 elif not self.paused and self.player.is_aiming_grenade:
-                    self.player.update_grenade_aim(event.pos)
-            elif event.type == pygame.USEREVENT and not self.paused:
-                if hasattr(self.player, 'delayed_throw_callback'):
-                    self.player.delayed_throw_callback()
-                    delattr(self.player, 'delayed_throw_callback')
-                    pygame.time.set_timer(pygame.USEREVENT, 0)
+                    self.update_grenade_aim(event.pos)
 
     def run(self) -> None:
+        # Fixed-timestep loop: the simulation advances in SIMULATION_DT steps
+        # regardless of render cost, and drawing interpolates between steps
+        accumulator = 0.0
+        frame_time = 0
+        self.clock.tick()
         while self.running:
-            keys = pygame.key.get_pressed()
-            action = self.handle_events()
-            if action == "menu":
-                return
-            if not self.paused:
-                self.handle_input(keys)
-                self.player.handle_jumping(keys)
-                self.update_time()
-                self.update_wave()
-                self.draw_game()
-                self.draw_wave_info()
-                if self.wave_complete:
-                    self.draw_wave_complete_screen()
-            else:
-                self.draw_game()
-                self.draw_wave_info()
-                self.draw_pause_overlay()
-            pygame.display.update()
-            self.clock.tick(60)
-            if self.player.current_health <= 0:
-                lose_screen = LoseScreen(screen, clock)
-                lose_screen.stats = {
-                    "zombies_killed": self.zombies_killed,
-                    "time_survived": str(datetime.now() - self.start_time).split('.')[0],
-                    "distance_traveled": int(self.world_offset / 100)
-                }
-                action = lose_screen.run()
-                if action == "retry":
-                    self.__init__()
-                elif action == "menu":
+            with tracer.span("Game.frame"):
+                self.profiler.begin_frame()
+                keys = pygame.key.get_pressed()
+                with tracer.span("handle_events"):
+                    action = self.handle_events()
+                if action == "menu":
                     return
-                elif action == "quit":
-                    pygame.quit()
-                    sys.exit()
+                if not self.paused:
+                    accumulator += min(frame_time, MAX_FRAME_TIME)
+                    while accumulator >= SIMULATION_DT:
+                        with tracer.span("tick", "simulation"):
+                            self.update(keys)
+                        accumulator -= SIMULATION_DT
+                    if self.mission_complete:
+                        if self.play_outro() == "menu":
+                            return
+                        accumulator = 0.0
+                        frame_time = 0
+                        continue
+                with tracer.span("sound"):
+                    self.sound_manager.update()
+                with tracer.span("draw"):
+                    self.draw_game(accumulator / SIMULATION_DT)
+                    if self.paused:
+                        self.draw_pause_overlay()
+                    elif self.wave_complete:
+                        self.draw_wave_complete_screen()
+                self.profiler.end_frame()
+                if self.profiler.enabled:
+                    self.profiler.draw(self.screen)
+                with tracer.span("present"):
+                    pygame.display.update()
+                with tracer.span("wait"):
+                    frame_time = self.clock.tick(FPS)
+                if self.player.current_health <= 0:
+                    lose_screen = LoseScreen(self.screen, self.clock)
+                    lose_screen.stats = {
+                        "zombies_killed": self.zombies_killed,
+                        "time_survived": self.time_survived(),
+                        "distance_traveled": int(self.world_offset / 100)
+                    }
+                    action = lose_screen.run()
+                    if action == "retry":
+                        self.reset()
+                        accumulator = 0.0
+                        frame_time = 0
+                    elif action == "menu":
+                        return
+                    elif action == "quit":
+                        pygame.quit()
+                        sys.exit()
 
 
 class OutroCutscene:
@@ -1745,12 +3755,11 @@ class OutroCutscene:
         self.clock = clock
         self.screen_width, self.screen_height = screen.get_size()
         self.running = True
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
         self.stats = stats
         self.assets = game_assets
-        self.tank_img = pygame.image.load("Assets/Tank.png")
-        self.tank_img = pygame.transform.scale(self.tank_img, (600, 300))
+        self.tank_img = asset_registry.image("Assets/Tank.png", size=(600, 300))
         self.tank_x = SCREEN_WIDTH + 600
         self.tank_y = SCREEN_HEIGHT - GROUND_HEIGHT - self.tank_img.get_height() + 19
         self.tank_speed = 8
@@ -1780,22 +3789,7 @@ class OutroCutscene:
         return "outro"
 
     def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center)
 
     def update(self):
         current_time = pygame.time.get_ticks()
@@ -1832,16 +3826,14 @@ class OutroCutscene:
                     return "complete"
 
     def draw(self):
-        screen.blit(self.tank_img, (self.tank_x, self.tank_y))
+        self.screen.blit(self.tank_img, (self.tank_x, self.tank_y))
         if not self.player_entered:
             if self.current_state == "player_walking":
-                frame = self.assets.actions["Walk"][self.player_frame]
-                frame = pygame.transform.flip(frame, self.player_direction == "left", False)
-                screen.blit(frame, (self.player_x - frame.get_width() // 2, self.player_y))
+                frame = self.assets.frames("Walk", self.player_direction)[self.player_frame]
+                self.screen.blit(frame, (self.player_x - frame.get_width() // 2, self.player_y))
             else:
-                frame = self.assets.actions["Idle"][0]
-                frame = pygame.transform.flip(frame, self.player_direction == "left", False)
-                screen.blit(frame, (self.player_x - frame.get_width() // 2, self.player_y))
+                frame = self.assets.frames("Idle", self.player_direction)[0]
+                self.screen.blit(frame, (self.player_x - frame.get_width() // 2, self.player_y))
         if self.current_state == "complete":
             self.draw_text("MISSION COMPLETE", self.screen_width // 2, self.screen_height // 3, HIGHLIGHT, self.title_font)
             self.draw_text("You have been successfully extracted", self.screen_width // 2, self.screen_height // 2, WHITE)
@@ -1852,14 +3844,14 @@ class AboutScreen:
         self.screen = screen
         self.clock = clock
         self.screen_width, self.screen_height = screen.get_size()
-        self.font = pygame.font.Font(None, 36)
-        self.title_font = pygame.font.Font(None, 72)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = asset_registry.font(None, 36)
+        self.title_font = asset_registry.font(None, 72)
+        self.small_font = asset_registry.font(None, 24)
         self.selected_option = 0
         self.options = ["Back"]
-        self.military_font = pygame.font.Font(None, 72)
-        self.background_image = pygame.image.load("Assets/Background.jpg").convert()
-        self.background_image = pygame.transform.scale(self.background_image, (self.screen_width, self.screen_height))
+        self.military_font = asset_registry.font(None, 72)
+        self.background_image = asset_registry.image("Assets/Background.jpg", alpha=False,
+                                                     size=(self.screen_width, self.screen_height))
 
     def draw_overlay(self, alpha=100):
         overlay = pygame.Surface((self.screen_width, self.screen_height))
@@ -1868,22 +3860,7 @@ class AboutScreen:
         self.screen.blit(overlay, (0, 0))
 
     def draw_text(self, text, x, y, color=TEXT_COLOR, font=None, center=True):
-        if font is None:
-            font = self.font
-        shadow_surface = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect()
-        if center:
-            shadow_rect.center = (x + 2, y + 2)
-        else:
-            shadow_rect.topleft = (x + 2, y + 2)
-        self.screen.blit(shadow_surface, shadow_rect)
-        text_surface = font.render(text, True, color)
-        if center:
-            text_rect = text_surface.get_rect(center=(x, y))
-        else:
-            text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
-        return text_rect
+        return text_renderer.draw(self.screen, text, x, y, color, self.font if font is None else font, center)
 
     def draw_menu(self):
         self.screen.blit(self.background_image, (0, 0))
@@ -1968,7 +3945,506 @@ class AboutScreen:
             self.clock.tick(60)
 
 
-def main():
+class Agent:
+    """
+    Plays a Game in place of the keyboard and mouse.
+    act() runs before every tick. It holds keys by setting them in keys and
+    acts through the same Game methods the event loop calls (fire, reload and
+    the grenade aim methods), so an agent's games record and replay like a
+    human's. Agents read whatever they need straight from the Game.
+    """
+
+    def act(self, game: Game, keys: KeyState) -> None:
+        raise NotImplementedError
+
+
+class ScriptedAgent(Agent):
+    """Minimal stand-in player: walks right until a zombie is close, then holds and fires."""
+
+    def act(self, game: Game, keys: KeyState) -> None:
+        nearest = game.nearest_zombie_offset()
+        keys[pygame.K_d] = nearest is None or nearest > SCRIPTED_ENGAGE_RANGE
+        if game.player.current_bullets == 0:
+            game.reload()
+        elif nearest is not None and abs(nearest) < SCREEN_WIDTH // 2:
+            game.fire()
+
+
+class AutopilotAgent(Agent):
+    """
+    Default bot, able to clear every wave of the standard game.
+    Advances until zombies come into range, then shoots from a distance:
+    between shots it sprints back from anything closer than
+    AUTOPILOT_RETREAT_RANGE and turns to face it again in time for the next
+    shot. It lobs grenades into groups and at tough zombies, and reloads
+    during lulls. Each decision looks at the nearest zombie and a couple of
+    range counts, so it costs a few microseconds a tick even with a horde.
+    """
+
+    def act(self, game: Game, keys: KeyState) -> None:
+        player = game.player
+        keys[pygame.K_d] = keys[pygame.K_a] = keys[pygame.K_LSHIFT] = False
+        nearest = game.nearest_zombie_offset()
+        if nearest is None:
+            # Nothing to fight: top up the magazine and walk on to where the next zombies spawn
+            keys[pygame.K_d] = True
+            if player.current_bullets < player.max_bullets:
+                game.reload()
+            return
+        distance = abs(nearest)
+        ahead = "right" if nearest > 0 else "left"
+        if player.current_bullets == 0 or (distance > AUTOPILOT_ENGAGE_RANGE and
+                                           player.current_bullets < player.max_bullets // 2):
+            game.reload()
+        if self.can_throw(game) and self.wants_grenade(game, nearest):
+            self.throw_at(game, nearest)
+
+        ticks_to_shot = max(0.0, SHOOT_COOLDOWN - (game.current_time - player.last_shot_time)) / SIMULATION_DT
+        if distance > AUTOPILOT_ENGAGE_RANGE:
+            keys[pygame.K_d if ahead == "right" else pygame.K_a] = True
+        elif distance < AUTOPILOT_RETREAT_RANGE and ticks_to_shot > 1 and game.world_offset > 0 and ahead == "right":
+            # Sprint away; the next tick that cannot retreat turns back to shoot
+            keys[pygame.K_a] = keys[pygame.K_LSHIFT] = True
+        elif player.direction != ahead:
+            keys[pygame.K_d if ahead == "right" else pygame.K_a] = True
+        if player.direction == ahead and distance < SCREEN_WIDTH // 2:
+            game.fire()
+
+    @staticmethod
+    def can_throw(game: Game) -> bool:
+        # Mirrors Player.throw, so an aim is never released for a throw that would be refused
+        player = game.player
+        animation = player.animation
+        return (player.current_grenades > 0 and not animation.throwing and not animation.reloading and
+                player.pending_throw is None and player.rect.y == player.original_y and
+                game.current_time - animation.last_throw_time >= animation.throw_cooldown)
+
+    @staticmethod
+    def wants_grenade(game: Game, nearest: float) -> bool:
+        # Worth a grenade: a group within range, or one zombie that would take many shots close by
+        if abs(nearest) > AUTOPILOT_GRENADE_RANGE + EXPLOSION_HITBOX_MARGIN:
+            return False
+        if nearest > 0:
+            group = game.zombies_between(0, AUTOPILOT_GRENADE_RANGE + EXPLOSION_HITBOX_MARGIN)
+        else:
+            group = game.zombies_between(-AUTOPILOT_GRENADE_RANGE - EXPLOSION_HITBOX_MARGIN, 0)
+        tough = game.wave_zombies[game.current_wave]["health"] > BULLET_DAMAGE * 4
+        return group >= 2 or (tough and abs(nearest) < AUTOPILOT_RETREAT_RANGE)
+
+    @staticmethod
+    def throw_at(game: Game, offset: float) -> None:
+        """
+        Aims and throws a grenade to land near a zombie, the way a player drags the mouse.
+
+        Args:
+            game (Game): Game to throw in
+            offset (float): Signed x distance from the player to the target
+        """
+        player = game.player
+        # Count the ticks a throw with AUTOPILOT_GRENADE_LIFT stays in the air, as Player.update_projectiles moves it
+        y = player.rect.centery + 25
+        ground = player.original_y + player.rect.height
+        velocity_y = -AUTOPILOT_GRENADE_LIFT
+        flight_ticks = 0
+        while y < ground:
+            y += velocity_y * TICK_SCALE
+            velocity_y += GRENADE_GRAVITY * TICK_SCALE
+            flight_ticks += 1
+        # The grenade lands in front of the player wherever they stand, and zombies keep walking meanwhile
+        reach = min(max(abs(offset) - BULLET_SPAWN_OFFSET, 0), AUTOPILOT_GRENADE_RANGE)
+        velocity_x = math.copysign(reach / (flight_ticks * TICK_SCALE), offset)
+        start = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        game.start_grenade_aim(start)
+        game.update_grenade_aim((start[0] - round(velocity_x / PULL_MULTIPLIER),
+                                 start[1] + round(AUTOPILOT_GRENADE_LIFT / PULL_MULTIPLIER)))
+        game.release_grenade_aim()
+
+
+AGENTS = {"autopilot": AutopilotAgent, "scripted": ScriptedAgent}
+
+
+def override_waves(table: Dict[int, Dict], overrides: Dict) -> Dict[int, Dict]:
+    """
+    Applies balance changes to a wave table without modifying it.
+
+    Args:
+        table (Dict[int, Dict]): Wave table to start from, such as WAVE_TABLE
+        overrides (Dict): Wave number (int or string, as read from JSON) -> fields to change; new waves must set
+            count, speed and health
+
+    Returns:
+        Dict[int, Dict]: The changed copy
+
+    Raises:
+        ValueError: If an override names an unknown field or leaves a new wave incomplete
+    """
+    waves = {number: dict(wave) for number, wave in table.items()}
+    for number, fields in overrides.items():
+        unknown = set(fields) - set(WAVE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown wave fields for wave {number}: {', '.join(sorted(unknown))}")
+        wave = waves.setdefault(int(number), {})
+        wave.update(fields)
+        missing = {"count", "speed", "health"} - set(wave)
+        if missing:
+            raise ValueError(f"Wave {number} is missing {', '.join(sorted(missing))}")
+    return dict(sorted(waves.items()))
+
+
+def setup_game(context: AppContext, waves: int = 3, seed: Optional[int] = None, horde_size: Optional[int] = None,
+               headless: bool = True, wave_table: Optional[Dict[int, Dict]] = None) -> Game:
+    # A Game configured the way headless runs, replays and batches expect
+    wave_table = wave_table or WAVE_TABLE
+    if horde_size is not None:
+        wave_table = override_waves(wave_table, {number: {"count": horde_size, "max_alive": horde_size}
+                                                 for number in wave_table})
+    if not 1 <= waves <= len(wave_table):
+        raise ValueError(f"Cannot play {waves} waves, the wave table has {len(wave_table)}")
+    game = Game(context.screen, context.clock, headless=headless, use_horde=horde_size is not None, seed=seed,
+                wave_table=wave_table)
+    game.max_waves = waves
+    return game
+
+
+def step_game(game: Game, keys) -> None:
+    # One simulation tick, as the profiler and tracer should see it
+    game.profiler.begin_frame()
+    with tracer.span("tick", "simulation"):
+        game.update(keys)
+    game.profiler.end_frame()
+
+
+def game_report(game: Game, ticks: int, elapsed: float, peak_zombies: int) -> Dict:
+    if game.mission_complete:
+        outcome = "win"
+    elif game.player.current_health <= 0:
+        outcome = "dead"
+    else:
+        outcome = "timeout"
+    report = {
+        "outcome": outcome,
+        "seed": game.run_seed,
+        "waves": game.max_waves,
+        "wave_reached": game.current_wave,
+        "ticks": ticks,
+        "sim_seconds": round(game.current_time / 1000, 2),
+        "wall_seconds": round(elapsed, 3),
+        "ticks_per_second": round(ticks / elapsed) if elapsed > 0 else 0,
+        "zombies_killed": game.zombies_killed,
+        "peak_zombies": peak_zombies,
+        "health": game.player.current_health,
+        "damage_taken": game.player.max_health - game.player.current_health,
+        "bullets_fired": game.bullets_fired,
+        "bullets_hit": game.bullets_hit,
+        "accuracy": int((game.bullets_hit / max(1, game.bullets_fired)) * 100),
+        "distance_traveled": int(game.world_offset / 100),
+        "bullet_pool_peak": game.player.bullets.high_water,
+        "grenade_pool_peak": game.player.grenades.high_water,
+        "digest": game.state_digest()
+    }
+    if game.profiler.enabled:
+        report["profile"] = game.profiler.report()
+    return report
+
+
+def run_headless(waves: int = 3, seed: Optional[int] = None, max_ticks: int = HEADLESS_MAX_TICKS,
+                 horde_size: Optional[int] = None, context: Optional[AppContext] = None,
+                 profile: bool = False, record: Optional[str] = None,
+                 wave_table: Optional[Dict[int, Dict]] = None, agent: Optional[Agent] = None) -> Dict:
+    """
+    Steps a Game as fast as the CPU allows, without drawing, until the mission
+    is won, the player dies or max_ticks is reached.
+
+    Args:
+        waves (int): Number of waves to play, from 1 up to the waves in the wave table
+        seed (Optional[int]): Seed for the game's random numbers; the same seed replays the same run
+        max_ticks (int): Simulation ticks to run before giving up
+        horde_size (Optional[int]): Use the NumPy horde engine with this many zombies per wave
+        context (Optional[AppContext]): Initialised pygame state; a headless one is created if omitted
+        profile (bool): Time each stage of every tick and add the profiler report
+        record (Optional[str]): Write the run's inputs to this file, for replay_inputs()
+        wave_table (Optional[Dict[int, Dict]]): Waves to play instead of WAVE_TABLE, see override_waves()
+        agent (Optional[Agent]): Player to use; an AutopilotAgent if omitted
+
+    Returns:
+        Dict: Outcome, tick counts, throughput and final game stats
+
+    Raises:
+        ValueError: If waves is outside the wave table
+    """
+    context = context or AppContext(headless=True)
+    game = setup_game(context, waves, seed, horde_size, wave_table=wave_table)
+    if profile:
+        game.profiler.enable()
+    if record:
+        game.record_inputs(horde_size or 0)
+    agent = agent or AutopilotAgent()
+    keys = KeyState()
+    ticks = 0
+    peak_zombies = 0
+    start = time.perf_counter()
+    while ticks < max_ticks and game.player.current_health > 0 and not game.mission_complete:
+        agent.act(game, keys)
+        step_game(game, keys)
+        ticks += 1
+        peak_zombies = max(peak_zombies, game.zombie_count())
+        if game.wave_complete:
+            game.next_wave()
+    elapsed = time.perf_counter() - start
+    report = game_report(game, ticks, elapsed, peak_zombies)
+    if record:
+        report["input_log_bytes"] = game.end_recording().save(record)
+    return report
+
+
+def replay_inputs(path: str, context: Optional[AppContext] = None, headless: bool = True,
+                  profile: bool = False) -> Dict:
+    """
+    Plays a recorded input log back into a fresh Game, reproducing the recorded run tick for tick.
+
+    Args:
+        path (str): Input log written by run_headless(record=...) or --record
+        context (Optional[AppContext]): Initialised pygame state; a headless one is created if omitted
+        headless (bool): Run as fast as possible without drawing, or draw each tick in the window at FPS
+        profile (bool): Time each stage of every tick and add the profiler report
+
+    Returns:
+        Dict: The same report as run_headless, whose digest should match the recorded run's
+    """
+    log = InputLog.load(path)
+    context = context or AppContext(headless=True)
+    game = setup_game(context, log.waves, log.seed, log.horde_size or None, headless, log.wave_table)
+    if profile:
+        game.profiler.enable()
+    keys = KeyState()
+    ticks = 0
+    peak_zombies = 0
+    start = time.perf_counter()
+    for tick, opcode, args in log.records():
+        while game.tick_count < tick:
+            step_game(game, keys)
+            ticks += 1
+            peak_zombies = max(peak_zombies, game.zombie_count())
+            if not headless:
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    return game_report(game, ticks, time.perf_counter() - start, peak_zombies)
+                game.draw_game()
+                pygame.display.update()
+                game.clock.tick(FPS)
+        if opcode == InputLog.END:
+            break
+        if opcode == InputLog.KEYS:
+            keys = InputLog.key_state(*args)
+        else:
+            game.apply_input(opcode, args)
+    return game_report(game, ticks, time.perf_counter() - start, peak_zombies)
+
+
+batch_context = None  # Headless pygame state of a batch worker process, see batch_worker_init()
+
+
+def batch_worker_init() -> None:
+    # Runs once per worker, so all of its games share one display, mixer and asset cache
+    global batch_context
+    batch_context = AppContext(headless=True)
+
+
+def run_batch_job(job: Tuple[str, int, Dict[int, Dict], Dict]) -> Dict:
+    variant, seed, wave_table, options = job
+    options = dict(options, agent=AGENTS[options["agent"]]())
+    report = run_headless(seed=seed, context=batch_context, wave_table=wave_table, **options)
+    report["variant"] = variant
+    report["clear_seconds"] = report["sim_seconds"] if report["outcome"] == "win" else None
+    return report
+
+
+def run_batch(variants: Dict[str, Dict], runs: int, seed: int = 0, jobs: Optional[int] = None, waves: int = 3,
+              max_ticks: int = HEADLESS_MAX_TICKS, horde_size: Optional[int] = None,
+              agent: str = "autopilot") -> List[Dict]:
+    """
+    Plays many headless games on a pool of worker processes, for balance and soak testing.
+
+    Args:
+        variants (Dict[str, Dict]): Variant name -> wave table overrides for override_waves(); {} plays WAVE_TABLE
+        runs (int): Games per variant; game i of every variant uses seed + i, so variants are compared on the same seeds
+        seed (int): Seed of the first game
+        jobs (Optional[int]): Worker processes, one per CPU core if None; 1 plays every game in this process
+        waves (int): Waves to play, as for run_headless()
+        max_ticks (int): Simulation ticks before a game gives up
+        horde_size (Optional[int]): Use the NumPy horde engine with this many zombies per wave
+        agent (str): Name of the player in AGENTS; each game gets a new one
+
+    Returns:
+        List[Dict]: run_headless() reports with the variant and clear time added, in variant then seed order
+
+    Raises:
+        ValueError: If a variant's overrides are invalid or it has fewer waves than requested
+    """
+    # Checked here, before any worker starts, rather than in every game
+    tables = {name: override_waves(WAVE_TABLE, overrides) for name, overrides in variants.items()}
+    for name, table in tables.items():
+        if not 1 <= waves <= len(table):
+            raise ValueError(f"Cannot play {waves} waves of variant {name!r}, its wave table has {len(table)}")
+    options = {"waves": waves, "max_ticks": max_ticks, "horde_size": horde_size, "agent": agent}
+    tasks = [(name, seed + index, table, options) for name, table in tables.items() for index in range(runs)]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        if batch_context is None:
+            batch_worker_init()
+        return [run_batch_job(task) for task in tasks]
+    # Imported here so that importing this module does not pay for the process pool machinery
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Or every worker prints pygame's banner
+    # Spawned workers start without any SDL state inherited from this process, on every platform.
+    # Handing out several games at a time keeps the pool's messaging cost small next to the games.
+    with ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=batch_worker_init) as pool:
+        return list(pool.map(run_batch_job, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+
+def summarise_batch(results: List[Dict]) -> List[Dict]:
+    """
+    Aggregates batch results per variant.
+
+    Args:
+        results (List[Dict]): Reports from run_batch()
+
+    Returns:
+        List[Dict]: One row per variant with its win rate and mean clear time (of wins), damage taken,
+            accuracy, kills and wave reached
+    """
+    rows = []
+    for variant in dict.fromkeys(result["variant"] for result in results):
+        games = [result for result in results if result["variant"] == variant]
+        clear_times = [game["clear_seconds"] for game in games if game["clear_seconds"] is not None]
+        rows.append({
+            "variant": variant,
+            "runs": len(games),
+            "win_rate": round(len(clear_times) / len(games), 3),
+            "mean_clear_seconds": round(sum(clear_times) / len(clear_times), 2) if clear_times else None,
+            "mean_damage_taken": round(sum(game["damage_taken"] for game in games) / len(games), 1),
+            "mean_accuracy": round(sum(game["accuracy"] for game in games) / len(games), 1),
+            "mean_zombies_killed": round(sum(game["zombies_killed"] for game in games) / len(games), 1),
+            "mean_wave_reached": round(sum(game["wave_reached"] for game in games) / len(games), 2)
+        })
+    return rows
+
+
+def write_csv(path: str, rows: List[Dict], columns: Optional[Tuple[str, ...]] = None) -> None:
+    # Columns default to the keys of the first row; keys missing from columns are left out
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, columns or list(rows[0]), extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def bake_assets(context: AppContext, path: str = ASSET_PACK_PATH) -> Dict:
+    """
+    Decodes every image the game and its screens use and writes them into an asset pack.
+
+    Args:
+        context (AppContext): Initialised pygame state, needed to convert images for the display
+        path (str): Where to write the pack
+
+    Returns:
+        Dict: Entry count, source file count and pack size
+    """
+    asset_registry.pack_path = None  # Always bake from the source files
+    assets = asset_registry.get("game_assets", GameAssets)
+    screen, clock = context.screen, context.clock
+    HomePage(screen, clock)
+    IntroCutscene(screen, clock)
+    OutroCutscene(screen, clock, {}, assets)
+    GameOverScreen(screen, clock, True)
+    AboutScreen(screen, clock)
+    images = {key: (asset_registry.image_sources[key], surface) for key, surface in asset_registry.images.items()}
+    size = AssetPack.write(path, images)
+    return {"path": path, "entries": len(images), "sources": len(set(source for source, _ in images.values())),
+            "bytes": size}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Operation: Zombie Strike")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window or audio, as fast as possible, and print a report")
+    parser.add_argument("--waves", type=int, default=3,
+                        help=f"waves to play in headless mode, 1 to {len(WAVE_TABLE)} (or as many as --variants define)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed for headless mode; the first game's seed for --batch (default 0)")
+    parser.add_argument("--max-ticks", type=int, default=HEADLESS_MAX_TICKS,
+                        help="simulation ticks before a headless run gives up")
+    parser.add_argument("--bake-assets", action="store_true",
+                        help=f"pre-scale and flip every image into {ASSET_PACK_PATH} for faster start-up")
+    parser.add_argument("--horde", type=int, default=None, metavar="N",
+                        help="use the NumPy horde engine with N zombies per wave (headless only)")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"time each stage of the last {PROFILER_HISTORY} headless ticks and report it")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="write every input of the game to a compact log, for --replay")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="play an input log back; with --headless as fast as possible and print a report")
+    parser.add_argument("--trace", metavar="PATH", default=None,
+                        help="record timing spans and write them as a Chrome trace on exit, or when F4 is pressed")
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="autopilot",
+                        help="bot that plays headless and --batch games")
+    parser.add_argument("--batch", type=int, default=None, metavar="N",
+                        help="play N headless games per variant on all CPU cores and print a summary per variant")
+    parser.add_argument("--variants", metavar="PATH", default=None,
+                        help='JSON file of variant name -> wave table overrides for --batch, '
+                             'e.g. {"fast": {"2": {"speed": 5}}}')
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes for --batch (default: one per core)")
+    parser.add_argument("--csv", metavar="PATH", default=None, help="write the --batch summary as CSV")
+    parser.add_argument("--runs-csv", metavar="PATH", default=None, help="write one CSV row per --batch game")
+    args = parser.parse_args(argv)
+    # Variant tables can add waves, so run_batch() checks those once they are loaded
+    if args.waves < 1 or (args.variants is None and args.waves > len(WAVE_TABLE)):
+        parser.error(f"--waves must be between 1 and {len(WAVE_TABLE)}, the waves the game defines")
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.trace:
+        tracer.start(args.trace)
+        atexit.register(tracer.flush)
+    if args.batch:
+        variants = {"default": {}}
+        if args.variants:
+            with open(args.variants) as variants_file:
+                variants = json.load(variants_file)
+        start = time.perf_counter()
+        results = run_batch(variants, args.batch, args.seed or 0, args.jobs, args.waves, args.max_ticks, args.horde,
+                            args.agent)
+        elapsed = time.perf_counter() - start
+        summary = summarise_batch(results)
+        print(f"{'variant':>12} {'runs':>5} {'win rate':>9} {'clear s':>8} {'damage':>7} {'accuracy':>9} "
+              f"{'kills':>6} {'wave':>5}")
+        for row in summary:
+            clear = row["mean_clear_seconds"]
+            print(f"{row['variant']:>12} {row['runs']:>5} {row['win_rate']:>9.1%} {clear if clear else '-':>8} "
+                  f"{row['mean_damage_taken']:>7} {row['mean_accuracy']:>8}% {row['mean_zombies_killed']:>6} "
+                  f"{row['mean_wave_reached']:>5}")
+        print(f"{len(results)} games in {elapsed:.1f} s ({len(results) / elapsed:.1f} games/s)")
+        if args.csv:
+            write_csv(args.csv, summary)
+        if args.runs_csv:
+            write_csv(args.runs_csv, results, BATCH_RUN_COLUMNS)
+        return
+    context = AppContext(headless=args.headless or args.bake_assets)
+    if args.bake_assets or args.headless or args.replay:
+        if args.bake_assets:
+            report = bake_assets(context)
+        elif args.replay:
+            report = replay_inputs(args.replay, context, args.headless, args.profile)
+        else:
+            report = run_headless(args.waves, args.seed, args.max_ticks, args.horde, context, args.profile,
+                                  args.record, agent=AGENTS[args.agent]())
+        for key, value in report.items():
+            print(f"{key:>18}: {value}")
+        context.close()
+        return
+    screen, clock = context.screen, context.clock
     homepage = HomePage(screen, clock)
     while True:
         action = homepage.run()
@@ -1976,18 +4452,26 @@ def main():
             pygame.quit()
             sys.exit()
         elif action == "start_game":
-            intro = IntroCutscene(screen, clock)
+            loader = AssetLoader(asset_registry).start()
+            intro = IntroCutscene(screen, clock, loader)
             action = intro.run()
             if action == "quit":
                 pygame.quit()
                 sys.exit()
             elif action == "start_game":
                 intro.sound_manager.stop_music()
-                game = Game()
-                action = game.run()
-                if action == "menu":
-                    homepage = HomePage(screen, clock)
-                    continue
+                loader.wait()  # Only blocks if the player skipped the briefing early
+                game = Game(screen, clock)
+                if args.record:
+                    game.record_inputs()
+                try:
+                    game.run()
+                finally:
+                    # Also reached through sys.exit() when the window is closed mid-game
+                    if args.record:
+                        game.end_recording().save(args.record)
+                # Every way out of a game (pause menu, lose or win screen) lands back on the menu
+                homepage.resume()
         elif action == "instructions":
             pass
         elif action == "settings":
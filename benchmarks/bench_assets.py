@@ -0,0 +1,52 @@
+#Zombie Strike - asset loading benchmark
+#Walks menu -> intro -> game -> end screens -> menu several times and reports decoding per round
+#Run from the repository root: python benchmarks/bench_assets.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+
+def visit_screens(context):
+    # Build every screen a player passes through in one session, without running their loops
+    screen, clock = context.screen, context.clock
+    homepage = zs.HomePage(screen, clock)
+    zs.IntroCutscene(screen, clock)
+    game = zs.Game(screen, clock, headless=True)
+    zs.OutroCutscene(screen, clock, game.mission_stats(), game.assets)
+    zs.GameOverScreen(screen, clock, True)
+    zs.LoseScreen(screen, clock)
+    zs.AboutScreen(screen, clock)
+    homepage.resume()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark repeated screen transitions")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    registry = zs.asset_registry
+    print(f"{'round':>6} {'ms':>9} {'decodes':>8} {'hits':>6} {'resident MB':>12}")
+    for round_number in range(1, args.rounds + 1):
+        decodes = registry.stats()["decodes"]
+        start = time.perf_counter()
+        visit_screens(context)
+        elapsed = (time.perf_counter() - start) * 1000
+        stats = registry.stats()
+        print(f"{round_number:>6} {elapsed:>9.1f} {stats['decodes'] - decodes:>8} {stats['hits']:>6} "
+              f"{stats['resident_bytes'] / 2 ** 20:>12.1f}")
+        if round_number > 1 and stats["decodes"] != decodes:
+            sys.exit(f"round {round_number} decoded assets again: {registry.loads}")
+    context.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#Zombie Strike - audio benchmark
+#Measures the frame-time cost of grenade detonations, against the old blocking playback
+#Run from the repository root: python benchmarks/bench_audio.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import ZombieStrike as zs
+
+
+def legacy_detonation(sound_manager):
+    # What a grenade landing did before the audio engine: play, sleep, play, twice over
+    sound = sound_manager.sounds['grenade']
+    for pause in (100, 0):
+        sound.stop()
+        sound.play()
+        pygame.time.delay(50)
+        sound.play()
+        if pause:
+            pygame.time.delay(pause)
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure_ticks(context, grenades: int):
+    # Step a real game, throwing a grenade whenever the last one has gone off
+    game = zs.Game(context.screen, context.clock, headless=True)
+    game.wave_zombies[1]["count"] = 0
+    game.player.current_grenades = game.player.max_grenades = grenades
+    keys = zs.KeyState()
+    tick_ms = []
+    detonation_ms = []
+    while game.player.current_grenades > 0 or game.player.grenades or game.player.explosions:
+        if not game.player.grenades and not game.player.pending_throw:
+            game.player.throw(game.current_time, (6, -12))
+        pending = len(game.player.explosions)
+        start = time.perf_counter()
+        game.update(keys)
+        game.sound_manager.update()
+        elapsed = (time.perf_counter() - start) * 1000
+        tick_ms.append(elapsed)
+        if len(game.player.explosions) > pending:
+            detonation_ms.append(elapsed)
+    return tick_ms, detonation_ms, game.sound_manager.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark grenade detonation frame cost")
+    parser.add_argument("--grenades", type=int, default=20)
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    tick_ms, detonation_ms, stats = measure_ticks(context, args.grenades)
+    sound_manager = zs.SoundManager()
+    start = time.perf_counter()
+    legacy_detonation(sound_manager)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{'':>22} {'median ms':>10} {'p99 ms':>8} {'max ms':>8}")
+    print(f"{'all ticks':>22} {percentile(tick_ms, 0.5):>10.3f} {percentile(tick_ms, 0.99):>8.3f} {max(tick_ms):>8.3f}")
+    print(f"{'detonation ticks':>22} {percentile(detonation_ms, 0.5):>10.3f} "
+          f"{percentile(detonation_ms, 0.99):>8.3f} {max(detonation_ms):>8.3f}")
+    print(f"{'legacy detonation':>22} {legacy_ms:>10.3f}")
+    print(f"{len(detonation_ms)} detonations over {len(tick_ms)} ticks, "
+          f"frame budget {1000 / zs.FPS:.1f} ms, mixer stats {stats}")
+    context.close()
+
+
+if __name__ == "__main__":
+    main()
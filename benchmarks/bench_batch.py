@@ -0,0 +1,55 @@
+#Zombie Strike - batch runner scaling benchmark
+#Plays the same batch of headless games with 1, 2, 4... worker processes and reports how throughput scales
+#Run from the repository root: python benchmarks/bench_batch.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+
+def worker_counts(cores: int):
+    counts = []
+    jobs = 1
+    while jobs < cores:
+        counts.append(jobs)
+        jobs *= 2
+    return counts + [cores]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch simulation throughput against worker count")
+    parser.add_argument("--games", type=int, default=32, help="games per batch")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--jobs", type=int, action="append", help="worker counts to try; repeat for several")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = args.jobs or worker_counts(cores)
+    if counts[0] != 1:
+        counts.insert(0, 1)
+    expected = None
+    serial = None
+    print(f"{cores} CPU cores; every batch includes starting its workers and loading their assets")
+    print(f"{'workers':>8} {'seconds':>8} {'games/s':>8} {'speedup':>8} {'efficiency':>11}")
+    for jobs in counts:
+        start = time.perf_counter()
+        results = zs.run_batch({"default": {}}, args.games, args.seed, jobs)
+        elapsed = time.perf_counter() - start
+        digests = [result["digest"] for result in results]
+        if expected is None:
+            expected, serial = digests, elapsed
+        elif digests != expected:
+            sys.exit(f"results with {jobs} workers differ from the single-process run")
+        speedup = serial / elapsed
+        print(f"{jobs:>8} {elapsed:>8.2f} {args.games / elapsed:>8.1f} {speedup:>7.2f}x {speedup / min(jobs, cores):>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#Zombie Strike - cold start benchmark
+#Times loading every game and screen image in a fresh process, from PNG/JPG decoding and from the baked pack
+#Run from the repository root after baking: python ZombieStrike.py --bake-assets && python benchmarks/bench_cold_start.py
+#-----------------------------
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside each child process; prints load time and registry stats as JSON
+CHILD = """
+import os, sys, time, json
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, {root!r})
+os.chdir({root!r})
+import ZombieStrike as zs
+context = zs.AppContext(headless=True)
+if not {use_pack}:
+    zs.asset_registry.pack_path = None
+start = time.perf_counter()
+assets = zs.asset_registry.get("game_assets", zs.GameAssets)
+for path, size in (("Assets/Background.jpg", (zs.SCREEN_WIDTH, zs.SCREEN_HEIGHT)),):
+    zs.asset_registry.image(path, alpha=False, size=size)
+zs.asset_registry.image("Assets/Tank.png", size=(600, 300))
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(ms=elapsed * 1000, **zs.asset_registry.stats())))
+"""
+
+
+def run_child(use_pack: bool) -> dict:
+    code = CHILD.format(root=ROOT, use_pack=use_pack)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-start asset loading")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(ROOT, "Assets", "assets.pack")):
+        sys.exit("no asset pack found; run: python ZombieStrike.py --bake-assets")
+    print(f"{'loader':>8} {'median ms':>10} {'min ms':>8} {'decodes':>8} {'pack loads':>11}")
+    medians = {}
+    for name, use_pack in (("decode", False), ("pack", True)):
+        results = [run_child(use_pack) for _ in range(args.runs)]
+        times = [result["ms"] for result in results]
+        medians[name] = statistics.median(times)
+        print(f"{name:>8} {medians[name]:>10.1f} {min(times):>8.1f} {results[-1]['decodes']:>8} "
+              f"{results[-1]['pack_loads']:>11}")
+    print(f"speedup: {medians['decode'] / medians['pack']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#Zombie Strike - collision benchmark
+#Compares CollisionSystem and ExplosionSystem against the original nested zombie x bullet x explosion loop
+#Run from the repository root: python benchmarks/bench_collisions.py
+#-----------------------------
+import os
+import sys
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import ZombieStrike as zs
+
+
+def make_scene(zombie_count: int, bullet_count: int, explosion_count: int, seed: int):
+    # Build a frame's worth of zombies, bullets and explosions around the visible area
+    rng = random.Random(seed)
+    world_offset = rng.randint(0, 20000)
+    zombies = []
+    for _ in range(zombie_count):
+        zombie = zs.Zombie(world_offset + rng.randint(-200, zs.SCREEN_WIDTH + 200), 330, None)
+        zombie.health = 10 ** 9
+        zombies.append(zombie)
+    bullets = zs.ProjectilePool(max(1, bullet_count))
+    for _ in range(bullet_count):
+        bullets.acquire().launch(rng.randint(0, zs.SCREEN_WIDTH), rng.randint(420, 560), 1, 1,
+                                 (zs.BULLET_SPEED, 0), "right", 0)
+    explosions = zs.ExplosionSystem()
+    for _ in range(explosion_count):
+        x = rng.randint(0, zs.SCREEN_WIDTH)
+        explosion = explosions.detonate((x, 560), (x + world_offset, 560), 0)
+        explosion.radius = rng.randint(0, zs.EXPLOSION_RADIUS)
+    return zombies, bullets, explosions, world_offset
+
+
+def legacy_resolve(zombies, bullets, explosions, world_offset):
+    # The loop Game.update_zombies used before CollisionSystem, minus zombie AI,
+    # with explosions as a brute-force radial test against every zombie
+    bullets = list(bullets)
+    hits = []
+    for zombie in zombies:
+        for bullet in bullets[:]:
+            bullet_world_rect = pygame.Rect(
+                int(bullet.x) + world_offset,
+                int(bullet.y),
+                bullet.width,
+                bullet.height
+            )
+            if zombie.is_alive and bullet_world_rect.colliderect(zombie.rect):
+                hits.append((id(zombie), id(bullet)))
+                bullets.remove(bullet)
+                break
+        for explosion in explosions:
+            x, y = explosion.world_pos
+            dx = max(zombie.rect.left - x, x - zombie.rect.right, 0)
+            dy = max(zombie.rect.top - y, y - zombie.rect.bottom, 0)
+            if zombie.is_alive and dx * dx + dy * dy <= explosion.reach ** 2:
+                hits.append((id(zombie), "explosion"))
+    return sorted(hits, key=str)
+
+
+def spatial_resolve(system, zombies, bullets, explosions, world_offset):
+    # Forget earlier hits so every call sees each blast as freshly detonated
+    for explosion in explosions:
+        explosion.hit.clear()
+    bullet_hits = system.resolve(zombies, bullets, world_offset)
+    explosion_hits = explosions.resolve(system, zombies)
+    hits = [(id(zombie), id(bullets[index])) for zombie, index in bullet_hits]
+    hits.extend((id(zombie), "explosion") for zombie, damage in explosion_hits)
+    return sorted(hits, key=str)
+
+
+def time_call(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zombie collision resolution")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--explosions", type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.init()
+    system = zs.CollisionSystem()
+    print(f"{'zombies':>8} {'bullets':>8} {'legacy ms':>10} {'spatial ms':>11} {'speedup':>8}")
+    for zombie_count, bullet_count in [(12, 30), (50, 50), (200, 200), (500, 500), (1000, 1000)]:
+        zombies, bullets, explosions, world_offset = make_scene(zombie_count, bullet_count, args.explosions, args.seed)
+        expected = legacy_resolve(zombies, bullets, explosions, world_offset)
+        actual = spatial_resolve(system, zombies, bullets, explosions, world_offset)
+        if expected != actual:
+            sys.exit(f"hit mismatch at {zombie_count} zombies / {bullet_count} bullets")
+        legacy_ms = time_call(lambda: legacy_resolve(zombies, bullets, explosions, world_offset), args.repeats)
+        spatial_ms = time_call(lambda: spatial_resolve(system, zombies, bullets, explosions, world_offset), args.repeats)
+        print(f"{zombie_count:>8} {bullet_count:>8} {legacy_ms:>10.3f} {spatial_ms:>11.3f} {legacy_ms / spatial_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#Zombie Strike - import time benchmark
+#Times importing pygame and then ZombieStrike in fresh processes, and checks the import opens no window or mixer
+#Run from the repository root: python benchmarks/bench_import.py
+#-----------------------------
+import os
+import sys
+import json
+import argparse
+import py_compile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside each child process; prints both import times and the pygame state as JSON
+CHILD = """
+import os, sys, time, json
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import pygame
+pygame_done = time.perf_counter()
+import ZombieStrike
+module_done = time.perf_counter()
+print(json.dumps(dict(pygame_ms=(pygame_done - start) * 1000, module_ms=(module_done - pygame_done) * 1000,
+                      display=pygame.display.get_init(), mixer=pygame.mixer.get_init() is not None,
+                      argv=sys.argv[1:])))
+"""
+
+
+def run_child() -> dict:
+    code = CHILD.format(root=ROOT)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark importing the game module")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=50.0, help="fail if the module's own import is slower")
+    args = parser.parse_args()
+
+    # Time the import, not the compile: the bytecode cache may be disabled in the environment
+    py_compile.compile(os.path.join(ROOT, "ZombieStrike.py"), doraise=True)
+    results = [run_child() for _ in range(args.runs)]
+    pygame_ms = statistics.median(result["pygame_ms"] for result in results)
+    module_ms = statistics.median(result["module_ms"] for result in results)
+    print(f"{'import':>12} {'median ms':>10} {'max ms':>8}")
+    print(f"{'pygame':>12} {pygame_ms:>10.1f} {max(result['pygame_ms'] for result in results):>8.1f}")
+    print(f"{'ZombieStrike':>12} {module_ms:>10.1f} {max(result['module_ms'] for result in results):>8.1f}")
+
+    side_effects = [result for result in results if result["display"] or result["mixer"] or result["argv"]]
+    if side_effects:
+        sys.exit(f"importing ZombieStrike touched pygame or argv: {side_effects[0]}")
+    if module_ms > args.max_ms:
+        sys.exit(f"ZombieStrike import took {module_ms:.1f} ms, over the {args.max_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
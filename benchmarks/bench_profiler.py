@@ -0,0 +1,51 @@
+#Zombie Strike - profiler overhead benchmark
+#Runs the same headless game with the frame profiler off and on and compares tick throughput
+#Run from the repository root: python benchmarks/bench_profiler.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+
+def frame_pair_ns(profiler, count: int = 100000) -> float:
+    # Cost of the begin_frame()/end_frame() pair the game loop always pays
+    start = time.perf_counter()
+    for _ in range(count):
+        profiler.begin_frame()
+        profiler.end_frame()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frame profiler overhead")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--horde", type=int, default=None, metavar="N")
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    throughput = {False: [], True: []}
+    for _ in range(args.repeats):
+        for profile in (False, True):
+            report = zs.run_headless(seed=args.seed, horde_size=args.horde, context=context, profile=profile)
+            throughput[profile].append(report["ticks_per_second"])
+    off, on = statistics.median(throughput[False]), statistics.median(throughput[True])
+    print(f"{'profiler':>9} {'ticks/s':>9}")
+    print(f"{'off':>9} {off:>9.0f}")
+    print(f"{'on':>9} {on:>9.0f}")
+    print(f"enabled overhead {(off / on - 1) * 100:.1f}%, "
+          f"per-frame cost when off {frame_pair_ns(zs.Game(context.screen, context.clock, headless=True).profiler):.0f} ns")
+    print(f"last profile: {report['profile']}")
+    context.close()
+
+
+if __name__ == "__main__":
+    main()
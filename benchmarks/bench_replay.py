@@ -0,0 +1,66 @@
+#Zombie Strike - replay benchmark
+#Replays a recorded input log headlessly several times, checking every replay ends in the same state
+#Record a session first with: python ZombieStrike.py --record session.zsi   (or --headless --record)
+#Run from the repository root: python benchmarks/bench_replay.py session.zsi
+#Without a log, headless autopilot runs seeded with --seed, its negative and a modified wave table are recorded and replayed
+#-----------------------------
+import os
+import sys
+import argparse
+import statistics
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+SHORT_WAVES = {1: {"count": 3}}  # Wave table overrides for the recorded run that must replay with them
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark replaying an input log")
+    parser.add_argument("log", nargs="?", default=None, help="input log to replay")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1, help="seed of the runs recorded when no log is given")
+    parser.add_argument("--profile", action="store_true", help="print the stage timings of the last replay")
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    logs = {args.log: None}  # Log path -> seed and digest of the recorded run, if known
+    if args.log is None:
+        directory = tempfile.mkdtemp()
+        logs = {}
+        # Negative seeds are valid too and must survive the log header, and so must a changed wave table
+        runs = {f"autopilot_{seed}": (seed, None) for seed in (args.seed, -args.seed)}
+        runs["short_waves"] = (args.seed, zs.override_waves(zs.WAVE_TABLE, SHORT_WAVES))
+        for name, (seed, wave_table) in runs.items():
+            path = os.path.join(directory, f"{name}.zsi")
+            report = zs.run_headless(seed=seed, context=context, record=path, wave_table=wave_table)
+            logs[path] = (report["seed"], report["digest"])
+
+    diverged = []
+    for path, expected in logs.items():
+        reports = [zs.replay_inputs(path, context, profile=args.profile) for _ in range(args.repeats)]
+        size = os.path.getsize(path)
+        minutes = reports[0]["sim_seconds"] / 60
+        throughput = [report["ticks_per_second"] for report in reports]
+        print(f"{os.path.basename(path)}: {size} bytes for {reports[0]['ticks']} ticks "
+              f"({size / max(minutes, 1 / 60):.0f} bytes per minute)")
+        print(f"  ticks/s: median {statistics.median(throughput):.0f}, best {max(throughput)}, worst {min(throughput)}")
+        if args.profile:
+            print(f"  profile: {reports[-1]['profile']}")
+        states = {(report["seed"], report["digest"]) for report in reports}
+        if len(states) != 1 or (expected is not None and states != {expected}):
+            diverged.append(f"{os.path.basename(path)} recorded {expected}, replayed {sorted(states)}")
+        else:
+            seed, digest = states.pop()
+            print(f"  every replay of seed {seed} ended in state {digest}")
+    context.close()
+    if diverged:
+        sys.exit(f"replays diverged: {'; '.join(diverged)}")
+
+
+if __name__ == "__main__":
+    main()
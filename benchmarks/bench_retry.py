@@ -0,0 +1,81 @@
+#Zombie Strike - retry benchmark
+#Plays part of a game, then times "Play Again" as a reset against building a new Game
+#Run from the repository root: python benchmarks/bench_retry.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+# Gameplay state a retry must put back exactly as a new game has it
+CHECKED = ("current_wave", "zombies_spawned", "zombies_killed", "bullets_fired", "bullets_hit",
+           "world_offset", "current_time", "wave_complete", "mission_complete", "game_time")
+
+
+def play(game, ticks: int) -> None:
+    agent = zs.AutopilotAgent()
+    keys = zs.KeyState()
+    for _ in range(ticks):
+        agent.act(game, keys)
+        game.update(keys)
+        if game.player.current_health <= 0 or game.mission_complete:
+            break
+
+
+def snapshot(game) -> dict:
+    state = {name: getattr(game, name) for name in CHECKED}
+    state["zombies"] = game.zombie_count()
+    state["health"] = game.player.current_health
+    state["ammo"] = (game.player.current_bullets, game.player.current_grenades)
+    state["projectiles"] = (len(game.player.bullets), len(game.player.grenades), len(game.player.explosions))
+    state["player"] = game.player.rect.topleft
+    state["digest"] = game.state_digest()
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrying a game")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=600)
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    registry = zs.asset_registry
+    start = time.perf_counter()
+    game = zs.Game(context.screen, context.clock, headless=True, seed=1)
+    first_ms = (time.perf_counter() - start) * 1000
+    expected = snapshot(zs.Game(context.screen, context.clock, headless=True, seed=1))
+
+    construct_ms = []
+    reset_ms = []
+    for _ in range(args.repeats):
+        play(game, args.ticks)
+        start = time.perf_counter()
+        zs.Game(context.screen, context.clock, headless=True)
+        construct_ms.append((time.perf_counter() - start) * 1000)
+
+        decodes = registry.stats()["decodes"]
+        start = time.perf_counter()
+        game.reset()
+        reset_ms.append((time.perf_counter() - start) * 1000)
+        if registry.stats()["decodes"] != decodes:
+            sys.exit(f"reset decoded assets: {registry.loads}")
+        if snapshot(game) != expected:
+            sys.exit(f"reset left stale state: {snapshot(game)} != {expected}")
+
+    print(f"{'retry':>22} {'median ms':>10} {'max ms':>8}")
+    print(f"{'first Game()':>22} {first_ms:>10.3f} {first_ms:>8.3f}")
+    print(f"{'new Game(), cached':>22} {statistics.median(construct_ms):>10.3f} {max(construct_ms):>8.3f}")
+    print(f"{'Game.reset()':>22} {statistics.median(reset_ms):>10.3f} {max(reset_ms):>8.3f}")
+    context.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#Zombie Strike - scenario benchmark suite
+#Drives the game headlessly through fixed, seeded scenarios and compares frame times and allocations with a baseline
+#Run from the repository root: python benchmarks/bench_scenarios.py
+#Record a new baseline after an intended change: python benchmarks/bench_scenarios.py --save-baseline
+#-----------------------------
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import tracemalloc
+from datetime import datetime
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import ZombieStrike as zs
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Metric -> True if bigger is better; compared against the baseline with the thresholds below
+TIME_METRICS = {"median_ms": False, "mean_ms": False, "p99_ms": False, "ticks_per_second": True}
+P99_MIN_FRAMES = 300  # With fewer frames the 99th percentile is little more than the slowest frame
+ALLOC_METRICS = ("alloc_bytes_per_frame", "retained_bytes_per_frame")
+ALLOC_NOISE_BYTES = 4096  # Allocation changes smaller than this never count as regressions
+
+
+class Scenario:
+    """
+    One seeded situation to measure.
+    step() advances the simulation by a tick and returns; draw() renders the
+    result. A frame is one step plus one draw, as in Game.run.
+    """
+
+    max_frames = None  # Cap for scenarios too slow to run the full frame count; below P99_MIN_FRAMES p99 is not reported
+
+    def __init__(self, context, game=None):
+        self.context = context
+        self.game = game
+        self.keys = zs.KeyState()
+
+    def step(self) -> None:
+        self.keep_alive()
+        self.game.update(self.keys)
+        self.game.sound_manager.update()
+
+    def draw(self) -> None:
+        self.game.draw_game()
+
+    def keep_alive(self) -> None:
+        # Scenarios measure a steady state, so the player never dies and ammo never runs out
+        player = self.game.player
+        player.current_health = player.max_health
+        player.current_bullets = player.max_bullets
+        player.current_grenades = player.max_grenades
+
+
+def new_game(context, seed: int, horde_size=None):
+    game = zs.Game(context.screen, context.clock, headless=True, use_horde=horde_size is not None, seed=seed)
+    if horde_size is not None:
+        for wave in game.wave_zombies.values():
+            wave["count"] = wave["max_alive"] = horde_size
+    return game
+
+
+class IdleWave(Scenario):
+    def __init__(self, context, seed: int):
+        super().__init__(context, new_game(context, seed))
+
+
+class Horde(Scenario):
+    size = 0
+
+    def __init__(self, context, seed: int):
+        super().__init__(context, new_game(context, seed, self.size))
+        # Spawn the whole horde, then bring it a screen closer so it is drawn from the first frame
+        self.step()
+        horde = self.game.horde
+        horde.x[:horde.count] -= zs.SCREEN_WIDTH
+        horde.prev_x[:horde.count] = horde.x[:horde.count]
+        self.keys[pygame.K_d] = True
+
+
+class Horde50(Horde):
+    size = 50
+
+
+class Horde500(Horde):
+    size = 500
+    max_frames = 100
+
+
+class Horde5000(Horde):
+    size = 5000
+    max_frames = 16
+
+
+class SustainedFire(Scenario):
+    def __init__(self, context, seed: int):
+        super().__init__(context, new_game(context, seed))
+
+    def step(self) -> None:
+        self.game.fire()
+        super().step()
+
+
+class GrenadeBarrage(Scenario):
+    blasts = 4
+
+    def __init__(self, context, seed: int):
+        super().__init__(context, new_game(context, seed, 200))
+
+    def step(self) -> None:
+        # Set off a volley of simultaneous explosions whenever the last one has burnt out
+        game = self.game
+        if not game.player.explosions:
+            for index in range(self.blasts):
+                pos = (zs.SCREEN_WIDTH // 2 + 150 + index * 120, zs.SCREEN_HEIGHT - zs.GROUND_HEIGHT - 50)
+                game.player.explosions.detonate(pos, (pos[0] + game.world_offset, pos[1]), game.current_time)
+            game.sound_manager.play_sound('grenade')
+        super().step()
+
+
+class DayToNight(Scenario):
+    def __init__(self, context, seed: int):
+        super().__init__(context, new_game(context, seed))
+        self.game.game_time = datetime(2024, 1, 1, 17, 50)  # The 18:00-19:00 blend starts ten ticks in
+
+
+class MenuOnly(Scenario):
+    # No simulation: every frame redraws the main menu
+    def __init__(self, context, seed: int):
+        super().__init__(context)
+        random.seed(seed)  # The menu's drifting particles use the global generator
+        self.homepage = zs.HomePage(context.screen, context.clock)
+
+    def step(self) -> None:
+        pass
+
+    def draw(self) -> None:
+        self.homepage.draw_menu()
+
+
+SCENARIOS = {
+    "idle_wave1": IdleWave,
+    "horde_50": Horde50,
+    "horde_500": Horde500,
+    "horde_5000": Horde5000,
+    "sustained_fire": SustainedFire,
+    "grenade_barrage": GrenadeBarrage,
+    "day_to_night": DayToNight,
+    "menu_only": MenuOnly,
+}
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def start_scenario(context, name: str, warmup: int, seed: int) -> Scenario:
+    scenario = SCENARIOS[name](context, seed)
+    for _ in range(warmup):
+        scenario.step()
+        scenario.draw()
+    return scenario
+
+
+def time_frames(scenario: Scenario, frames: int):
+    frame_ms = []
+    step_seconds = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        scenario.step()
+        stepped = time.perf_counter()
+        scenario.draw()
+        end = time.perf_counter()
+        step_seconds += stepped - start
+        frame_ms.append((end - start) * 1000)
+    return frame_ms, step_seconds
+
+
+def measure(context, name: str, frames: int, warmup: int, alloc_frames: int, seed: int, repeats: int) -> dict:
+    # Every repeat replays the same seeded scenario; the best one is kept, since
+    # noise from other processes only ever makes a run slower
+    frames = min(frames, SCENARIOS[name].max_frames or frames)
+    warmup = min(warmup, frames // 2)
+    alloc_frames = min(alloc_frames, frames)
+    scenario = start_scenario(context, name, warmup, seed)
+    # Repeats resume from the warmed-up state instead of setting the scenario up again
+    checkpoint = scenario.game.snapshot() if scenario.game is not None else None
+    passes = []
+    for repeat in range(repeats):
+        if repeat and checkpoint is not None:
+            scenario.game.restore(checkpoint)
+        elif repeat:
+            scenario = start_scenario(context, name, warmup, seed)
+        passes.append(time_frames(scenario, frames))
+    frame_ms, step_seconds = min(passes, key=lambda timing: statistics.median(timing[0]))
+
+    # Allocation pass, separate because tracing slows every allocation down.
+    # Only the Python heap is traced; pixel buffers allocated by SDL are not.
+    allocated = []
+    retained = 0
+    tracemalloc.start()
+    for _ in range(alloc_frames):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        scenario.step()
+        scenario.draw()
+        current, peak = tracemalloc.get_traced_memory()
+        allocated.append(peak - before)
+        retained += current - before
+    tracemalloc.stop()
+
+    ticks_per_second = None
+    if scenario.game is not None and step_seconds > 0:
+        ticks_per_second = round(frames / step_seconds)
+    return {
+        "frames": frames,
+        "median_ms": round(statistics.median(frame_ms), 4),
+        "mean_ms": round(statistics.fmean(frame_ms), 4),
+        "p99_ms": round(percentile(frame_ms, 0.99), 4) if frames >= P99_MIN_FRAMES else None,
+        "max_ms": round(max(frame_ms), 4),
+        "ticks_per_second": ticks_per_second,
+        "alloc_bytes_per_frame": round(statistics.median(allocated)) if allocated else 0,
+        "retained_bytes_per_frame": round(retained / alloc_frames) if alloc_frames else 0,
+        "zombies": scenario.game.zombie_count() if scenario.game is not None else 0
+    }
+
+
+def compare(results: dict, baseline: dict, time_threshold: float, alloc_threshold: float) -> list:
+    """
+    Lists every metric that got worse than the baseline by more than its threshold.
+
+    Args:
+        results (dict): Scenario name -> metrics from this run
+        baseline (dict): Scenario name -> metrics from the stored baseline
+        time_threshold (float): Allowed fractional slowdown, e.g. 0.3 for 30%
+        alloc_threshold (float): Allowed fractional growth in allocations
+
+    Returns:
+        list: Human-readable regression descriptions, empty if none
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, higher_is_better in TIME_METRICS.items():
+            old, new = reference.get(metric), metrics.get(metric)
+            if not old or not new:
+                continue
+            change = old / new - 1 if higher_is_better else new / old - 1
+            if change > time_threshold:
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({change:+.0%})")
+        for metric in ALLOC_METRICS:
+            old, new = reference.get(metric, 0), metrics.get(metric, 0)
+            if new - old > max(ALLOC_NOISE_BYTES, abs(old) * alloc_threshold):
+                regressions.append(f"{name}.{metric}: {old} -> {new} bytes")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the scenario benchmark suite")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="run only this scenario; repeat for several")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=3, help="timing passes per scenario; the fastest is kept")
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--alloc-frames", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="write this run's results as the baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.3,
+                        help="fail if frame times or tick rate are this fraction worse than the baseline")
+    parser.add_argument("--alloc-threshold", type=float, default=0.5,
+                        help="fail if allocations per frame grow by this fraction over the baseline")
+    parser.add_argument("--output", default=None, help="also write the results as JSON to this path")
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    results = {}
+    print(f"{'scenario':>16} {'frames':>7} {'median ms':>10} {'mean ms':>8} {'p99 ms':>8} {'max ms':>8} {'ticks/s':>9} "
+          f"{'alloc B':>9} {'kept B':>8} {'zombies':>8}")
+    for name in args.scenario or SCENARIOS:
+        metrics = measure(context, name, args.frames, args.warmup, args.alloc_frames, args.seed, args.repeats)
+        results[name] = metrics
+        p99 = "-" if metrics["p99_ms"] is None else f"{metrics['p99_ms']:.3f}"
+        print(f"{name:>16} {metrics['frames']:>7} {metrics['median_ms']:>10.3f} {metrics['mean_ms']:>8.3f} {p99:>8} "
+              f"{metrics['max_ms']:>8.3f} {metrics['ticks_per_second'] or '-':>9} {metrics['alloc_bytes_per_frame']:>9} "
+              f"{metrics['retained_bytes_per_frame']:>8} {metrics['zombies']:>8}")
+    context.close()
+
+    document = {
+        "meta": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                 "machine": platform.machine(), "frames": args.frames, "repeats": args.repeats, "seed": args.seed},
+        "scenarios": results
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(document, output_file, indent=2)
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                document["scenarios"] = {**json.load(baseline_file)["scenarios"], **results}
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(document, baseline_file, indent=2)
+            baseline_file.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare against; run with --save-baseline to create one")
+        return
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)["scenarios"]
+    regressions = compare(results, baseline, args.time_threshold, args.alloc_threshold)
+    if regressions:
+        print("regressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("no regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
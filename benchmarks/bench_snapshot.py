@@ -0,0 +1,79 @@
+#Zombie Strike - snapshot benchmark
+#Times capturing and restoring a mid-wave game, and checks a restored game carries on exactly like the original
+#Run from the repository root: python benchmarks/bench_snapshot.py
+#-----------------------------
+import os
+import sys
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+# Name -> zombies per wave for the horde engine, None for the zombie list
+CASES = {"list": None, "horde_500": 500, "horde_5000": 5000}
+
+
+def play(game, ticks: int) -> None:
+    agent = zs.AutopilotAgent()
+    keys = zs.KeyState()
+    for _ in range(ticks):
+        agent.act(game, keys)
+        game.update(keys)
+        if game.wave_complete:
+            game.next_wave()
+
+
+def timed_us(action, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game snapshots")
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=600, help="ticks played before the snapshot is taken")
+    parser.add_argument("--check-ticks", type=int, default=600, help="ticks played after restoring, to compare")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    context = zs.AppContext(headless=True)
+    budget_us = 1e6 / zs.FPS
+    diverged = []
+    print(f"{'case':>11} {'zombies':>8} {'bytes':>7} {'capture us':>11} {'restore us':>11} {'of a frame':>11}")
+    for name, horde_size in CASES.items():
+        game = zs.setup_game(context, seed=args.seed, horde_size=horde_size)
+        play(game, args.ticks)
+        snapshot = game.snapshot()
+        zombies = game.zombie_count()
+        capture_us = timed_us(game.snapshot, args.repeats)
+        restore_us = timed_us(lambda: game.restore(snapshot), args.repeats)
+
+        # The original, a rewound copy and a separate Game restored from the snapshot must stay in step
+        play(game, args.check_ticks)
+        expected = game.state_digest()
+        game.restore(snapshot)
+        play(game, args.check_ticks)
+        other = zs.setup_game(context, seed=args.seed + 1, horde_size=horde_size)
+        other.restore(snapshot)
+        play(other, args.check_ticks)
+        if {game.state_digest(), other.state_digest()} != {expected}:
+            diverged.append(name)
+        print(f"{name:>11} {zombies:>8} {len(snapshot):>7} {capture_us:>11.1f} {restore_us:>11.1f} "
+              f"{(capture_us + restore_us) / budget_us:>11.2%}")
+    context.close()
+    if diverged:
+        sys.exit(f"restored games diverged from the original: {', '.join(diverged)}")
+    print("every restored game carried on identically")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#Zombie Strike - tracing benchmark
+#Measures what a span costs with tracing off and on, and how long a flush holds up the game loop
+#Run from the repository root: python benchmarks/bench_trace.py
+#-----------------------------
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+
+def span_ns(tracer, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        with tracer.span("bench"):
+            pass
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trace recording and flushing")
+    parser.add_argument("--spans", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    tracer = zs.Tracer()
+    off_ns = span_ns(tracer, args.spans)
+    path = os.path.join(tempfile.mkdtemp(), "trace.json")
+    tracer.start(path)
+    on_ns = span_ns(tracer, args.spans)  # Also fills the ring buffer for the flush below
+
+    start = time.perf_counter()
+    writer = tracer.flush(background=True)
+    stall_ms = (time.perf_counter() - start) * 1000
+    writer.join()
+    write_ms = (time.perf_counter() - start) * 1000
+    with open(path) as trace_file:
+        written = len(json.load(trace_file)["traceEvents"])
+
+    context = zs.AppContext(headless=True)
+    plain = zs.run_headless(seed=args.seed, context=context)["ticks_per_second"]
+    zs.tracer.start(path)
+    traced = zs.run_headless(seed=args.seed, context=context)["ticks_per_second"]
+    context.close()
+
+    print(f"span cost: {off_ns:.0f} ns off, {on_ns:.0f} ns on")
+    print(f"flush of {written} events: game loop paused {stall_ms:.2f} ms, written after {write_ms:.0f} ms")
+    print(f"headless ticks/s: {plain} untraced, {traced} traced")
+
+
+if __name__ == "__main__":
+    main()
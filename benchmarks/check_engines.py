@@ -0,0 +1,111 @@
+#Zombie Strike - zombie engine parity check
+#Checks that the zombie list and the NumPy horde resolve bullet hits the same way, first on random overlapping
+#layouts and then by playing the same small seeded waves through both engines
+#Run from the repository root: python benchmarks/check_engines.py
+#-----------------------------
+import os
+import sys
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ZombieStrike as zs
+
+WAVE = {"count": 12, "speed": 3, "health": 400}  # Tough and packed close together, so bullets overlap several zombies
+
+
+def layout_mismatches(game, layouts: int, seed: int) -> int:
+    # Random piles of zombies and bullets resolved by both engines from the same positions
+    rng = random.Random(seed)
+    pool = game.player.bullets
+    mismatches = 0
+    for _ in range(layouts):
+        xs = [rng.randint(0, 200) for _ in range(rng.randint(1, 8))]
+        zombies = [zs.Zombie(x, 0, game.assets) for x in xs]
+        horde = zs.Horde(game.assets)
+        horde.spawn(xs, 0, 1, 100)
+        pool.reset()
+        for _ in range(rng.randint(1, 6)):
+            bullet = pool.acquire()
+            bullet.active = True
+            bullet.x, bullet.y = rng.randint(0, 260), rng.randint(80, 260)
+            bullet.width = bullet.height = rng.randint(10, 40)
+        pairs = zs.CollisionSystem().resolve(zombies, pool, 0)
+        spent, _ = horde.resolve_hits(pool, game.player.explosions, 0)
+        shot = zs.np.flatnonzero(horde.health[:len(xs)] < 100).tolist()
+        if [index for _, index in pairs] != spent or sorted(zombies.index(z) for z, _ in pairs) != shot:
+            mismatches += 1
+    pool.reset()
+    return mismatches
+
+
+def small_wave(context, seed: int, use_horde: bool):
+    # One wave whose zombies are all placed up front, at the same spots for both engines
+    table = zs.override_waves(zs.WAVE_TABLE, {1: WAVE})
+    game = zs.Game(context.screen, context.clock, headless=True, use_horde=use_horde, seed=seed, wave_table=table)
+    game.max_waves = 1
+    rng = random.Random(seed)
+    xs = [zs.SCREEN_WIDTH + rng.randint(0, 150) for _ in range(WAVE["count"])]
+    y = zs.SCREEN_HEIGHT - zs.GROUND_HEIGHT - game.assets.zombie_frames[0].get_height() - 48
+    game.zombies.clear()  # Drop the zombie start_wave() spawned
+    if use_horde:
+        game.horde.clear()
+        game.horde.spawn(xs, y, WAVE["speed"], WAVE["health"])
+    else:
+        for x in xs:
+            zombie = zs.Zombie(x, y, game.assets)
+            zombie.speed = WAVE["speed"]
+            zombie.health = zombie.max_health = WAVE["health"]
+            game.zombies.append(zombie)
+    game.zombies_spawned = WAVE["count"]
+    return game
+
+
+def play(game, max_ticks: int) -> list:
+    # Kills, hits, shots and player health after every tick
+    agent = zs.AutopilotAgent()
+    keys = zs.KeyState()
+    history = []
+    while len(history) < max_ticks and game.player.current_health > 0 and not game.mission_complete:
+        agent.act(game, keys)
+        game.update(keys)
+        history.append((game.zombies_killed, game.bullets_hit, game.bullets_fired, game.player.current_health))
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the zombie list and the horde engine agree on hits")
+    parser.add_argument("--layouts", type=int, default=3000)
+    parser.add_argument("--seeds", type=int, default=8, help="small waves to play through both engines")
+    parser.add_argument("--max-ticks", type=int, default=3000)
+    args = parser.parse_args()
+    if zs.np is None:
+        sys.exit("the horde engine requires numpy")
+
+    context = zs.AppContext(headless=True)
+    game = zs.Game(context.screen, context.clock, headless=True, seed=1)
+    failures = []
+    mismatches = layout_mismatches(game, args.layouts, 1)
+    print(f"layouts: {mismatches} of {args.layouts} resolved differently")
+    if mismatches:
+        failures.append(f"{mismatches} layouts")
+    print(f"{'seed':>5} {'ticks':>6} {'kills':>6} {'hits':>5} {'shots':>6} {'health':>7}  engines")
+    for seed in range(1, args.seeds + 1):
+        listed = play(small_wave(context, seed, False), args.max_ticks)
+        horde = play(small_wave(context, seed, True), args.max_ticks)
+        same = listed == horde
+        print(f"{seed:>5} {len(listed):>6} {listed[-1][0]:>6} {listed[-1][1]:>5} {listed[-1][2]:>6} "
+              f"{listed[-1][3]:>7}  {'agree' if same else f'differ, horde ended at {horde[-1]}'}")
+        if not same:
+            failures.append(f"seed {seed}")
+    context.close()
+    if failures:
+        sys.exit(f"the engines disagree: {', '.join(failures)}")
+    print("both engines agree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#Zombie Strike - timestep check
+#Runs the movement code at several simulation rates and checks that every mover covers the same distance per simulated second
+#Run from the repository root: python benchmarks/check_timestep.py
+#-----------------------------
+import os
+import sys
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import ZombieStrike as zs
+
+RATES = (30, 60, 120)
+JUMP_TOLERANCE = 0.05  # The jump is sampled once per tick, so its measured peak and landing can shift by part of a tick
+
+
+def set_rate(hz: int) -> float:
+    # The movement code reads these module globals on every tick
+    zs.SIMULATION_HZ = hz
+    zs.SIMULATION_DT = 1000 / hz
+    zs.TICK_SCALE = 60 / hz
+    return zs.SIMULATION_DT
+
+
+def walk(game, hz: int, key: int, sprint: bool) -> float:
+    game.reset()
+    game.world_offset = 10000
+    keys = zs.KeyState()
+    keys[key] = True
+    keys[pygame.K_LSHIFT] = sprint
+    for _ in range(hz):
+        game.handle_input(keys)
+    return abs(game.world_offset - 10000)
+
+
+def chase(game, hz: int, speed: float, start: int) -> float:
+    # The zombie starts inside detection range and stays out of attack range for the whole second
+    player_x = 10000
+    zombie = zs.Zombie(player_x + start - 40, 0, game.assets)
+    zombie.speed = speed
+    for tick in range(hz):
+        zombie.update(player_x, game.player, tick * zs.SIMULATION_DT, zs.SIMULATION_DT)
+    return abs(zombie.x - (player_x + start))
+
+
+def horde_chase(game, hz: int, speed: float, start: int) -> float:
+    player_x = 10000
+    horde = zs.Horde(game.assets)
+    horde.spawn([player_x + start], 0, speed, 100)
+    start_x = float(horde.x[0])
+    for tick in range(hz):
+        horde.update(player_x, game.player, tick * zs.SIMULATION_DT, zs.SIMULATION_DT)
+    return abs(float(horde.x[0]) - start_x)
+
+
+def jump(game) -> tuple:
+    # Height of the arc in pixels and time in the air in simulated seconds
+    player = game.player
+    player.reset()
+    keys = zs.KeyState()
+    keys[pygame.K_w] = True
+    player.handle_jumping(keys)
+    keys[pygame.K_w] = False
+    top = player.y
+    ticks = 0
+    while player.jumping:
+        player.handle_jumping(keys)
+        top = min(top, player.y)
+        ticks += 1
+    return player.original_y - top, ticks / zs.SIMULATION_HZ
+
+
+def measure(game, hz: int) -> dict:
+    set_rate(hz)
+    results = {
+        "walk right": walk(game, hz, pygame.K_d, False),
+        "walk left": walk(game, hz, pygame.K_a, False),
+        "run right": walk(game, hz, pygame.K_d, True),
+        "zombie speed 3 left": chase(game, hz, 3, 450),
+        "zombie speed 3 right": chase(game, hz, 3, -450),
+        "zombie speed 3.5 left": chase(game, hz, 3.5, 450),
+        "zombie speed 1 left": chase(game, hz, 1, 450),
+        "zombie speed 1 right": chase(game, hz, 1, -450),
+    }
+    if zs.np is not None:
+        results["horde speed 3.5 left"] = horde_chase(game, hz, 3.5, 450)
+        results["horde speed 1 right"] = horde_chase(game, hz, 1, -450)
+    results["jump height"], results["jump air time"] = jump(game)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check movement speeds do not depend on the simulation rate")
+    parser.add_argument("--rate", type=int, action="append", help="simulation rates in Hz; repeat for several")
+    args = parser.parse_args()
+
+    rates = args.rate or RATES
+    context = zs.AppContext(headless=True)
+    game = zs.Game(context.screen, context.clock, headless=True, seed=1)
+    default_hz = zs.SIMULATION_HZ
+    expected = measure(game, default_hz)
+    by_rate = {hz: measure(game, hz) for hz in rates}
+    set_rate(default_hz)
+    context.close()
+
+    print(f"{'per simulated second':>22}" + "".join(f"{f'{hz} Hz':>10}" for hz in rates))
+    mismatched = []
+    for name, reference in expected.items():
+        tolerance = abs(reference) * JUMP_TOLERANCE if name.startswith("jump") else 1e-6
+        values = [by_rate[hz][name] for hz in rates]
+        print(f"{name:>22}" + "".join(f"{value:>10.2f}" for value in values))
+        mismatched += [f"{name} at {hz} Hz" for hz, value in zip(rates, values) if abs(value - reference) > tolerance]
+    if mismatched:
+        sys.exit(f"movement depends on the simulation rate: {', '.join(mismatched)}")
+    print(f"every rate matches {default_hz} Hz")
+
+
+if __name__ == "__main__":
+    main()